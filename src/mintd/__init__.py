@@ -2,7 +2,21 @@
 
 from importlib.metadata import PackageNotFoundError, version as _pkg_version
 
-try:
-    __version__ = _pkg_version("mintd")
-except PackageNotFoundError:  # source / editable run with no installed dist metadata
-    __version__ = "0.0.0+unknown"
+# Declared, not bound: the module ``__getattr__`` below only fires while
+# the name is unset.
+__version__: str
+
+
+def __getattr__(name: str) -> str:
+    # ``__version__`` is resolved on first access rather than at import:
+    # the metadata lookup scans every sys.path entry for dist-info, and
+    # almost no CLI invocation ever prints the version. The result is
+    # bound as a real module global, so this runs at most once.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    global __version__
+    try:
+        __version__ = _pkg_version("mintd")
+    except PackageNotFoundError:  # source / editable run with no installed dist metadata
+        __version__ = "0.0.0+unknown"
+    return __version__
@@ -31,11 +31,13 @@ def has_profile(
     """Return True iff the credentials file has a section named
     ``profile_name`` AND the section has both keys populated."""
     path = credentials_path or default_credentials_path()
-    if not path.is_file():
-        return False
     cp = configparser.ConfigParser()
     try:
-        cp.read(path)
+        # ``read`` skips files it can't open (missing, a directory) and
+        # returns what it did read — the existence check and the parse
+        # are one open, not a stat followed by an open.
+        if not cp.read(path):
+            return False
     except configparser.Error:
         return False
     if not cp.has_section(profile_name):
@@ -83,8 +85,7 @@ def write_profile(
         )
 
     cp = configparser.ConfigParser()
-    if path.exists():
-        cp.read(path)
+    cp.read(path)  # a missing file is skipped, leaving cp empty
 
     sections = [profile_name]
     if sync_default:
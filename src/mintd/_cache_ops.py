@@ -25,10 +25,14 @@ every user-facing string calls this store the "repo file cache (S3)".
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, Optional
 from uuid import uuid4
@@ -66,6 +70,8 @@ if TYPE_CHECKING:
     from ._config import Config
     from ._console import Reporter
 
+logger = logging.getLogger(__name__)
+
 # The ONLY occurrence of the literal cache-segment name.
 CACHE_DIR_NAME = "cache"
 # The per-object tag riding S1's extra_args; an admin lifecycle rule filters on
@@ -269,7 +275,8 @@ def _all_dvc_outs(project_path: Path, remote_name: str) -> list:
     """Every DVC out for the project: ``.dvc`` pointers (via
     ``discover_all_outs`` + ``outs_for_target``) plus ``dvc.lock`` stage outs.
     The single enumeration both the collision guard and the tracked-path set
-    read from, so neither can drift from the other's view of DVC reality."""
+    read from, so neither can drift from the other's view of DVC reality —
+    push and pull compute it once and hand it to both."""
     outs = []
     for target in discover_all_outs(project_path):
         outs.extend(outs_for_target(project_path, target, remote_name))
@@ -278,7 +285,9 @@ def _all_dvc_outs(project_path: Path, remote_name: str) -> list:
     return outs
 
 
-def dvc_tracked_paths(project_path: Path, remote_name: str) -> set[str]:
+def dvc_tracked_paths(
+    project_path: Path, remote_name: str, *, outs: list | None = None
+) -> set[str]:
     """Repo-relative posix path of every DVC-tracked workspace out (files AND
     directory-out roots). ``cache push`` refuses any path in — or under a
     directory in — this set (a versioned product belongs to ``mintd data
@@ -286,10 +295,12 @@ def dvc_tracked_paths(project_path: Path, remote_name: str) -> set[str]:
     clobber a tracked out). Uses ``workspace_path_for`` — the exact anchoring
     ``.dvc``-file/``dvc.lock`` outs record — so it matches where DVC materializes
     each out. Outs that resolve outside the project (shouldn't happen) are
-    skipped."""
+    skipped. ``outs`` is a precomputed :func:`_all_dvc_outs` result."""
     root = project_path.resolve()
     tracked: set[str] = set()
-    for out in _all_dvc_outs(project_path, remote_name):
+    if outs is None:
+        outs = _all_dvc_outs(project_path, remote_name)
+    for out in outs:
         try:
             rel = workspace_path_for(project_path, out).resolve().relative_to(root).as_posix()
         except ValueError:
@@ -304,23 +315,28 @@ def _is_tracked(rel_posix: str, tracked: set[str]) -> bool:
     reason as ``_is_protected_repo_path``: on a case-insensitive filesystem
     ``data/FINAL.parquet`` is the same file as a tracked ``data/final.parquet``,
     so a case-sensitive compare would let the cache clobber (pull) or shadow
-    (push) a versioned out."""
+    (push) a versioned out. One ``startswith`` plus a separator check at the
+    known offset — no ``f"{tc}/"`` string built per tracked out per file."""
     r = rel_posix.casefold()
     for t in tracked:
         tc = t.casefold()
-        if r == tc or r.startswith(f"{tc}/"):
+        if r.startswith(tc) and (len(r) == len(tc) or r[len(tc)] == "/"):
             return True
     return False
 
 
-def _dvc_outs_under_cache(project_path: Path, remote_name: str) -> list[_Collision]:
+def _dvc_outs_under_cache(
+    project_path: Path, remote_name: str, outs: list | None = None
+) -> list[_Collision]:
     """Every DVC out whose path-based key starts with ``cache/``. Asks
     ``s3_key_for_out`` — the exact function that builds fast-sync's keys — so the
     guard can never drift from DVC-key reality. Md5-keyed outs return
     ``files/md5/…`` and never trip it; outs that raise ``ValueError``
     (synthetic/no key) are skipped."""
     collisions: list[_Collision] = []
-    for out in _all_dvc_outs(project_path, remote_name):
+    if outs is None:
+        outs = _all_dvc_outs(project_path, remote_name)
+    for out in outs:
         try:
             key = s3_key_for_out("", out, project_path)
         except ValueError:
@@ -336,11 +352,13 @@ def _dvc_outs_under_cache(project_path: Path, remote_name: str) -> list[_Collisi
     return collisions
 
 
-def guard_no_dvc_outs_under_cache(project_path: Path, remote_name: str) -> None:
+def guard_no_dvc_outs_under_cache(
+    project_path: Path, remote_name: str, *, outs: list | None = None
+) -> None:
     """Refuse (naming the out + its source) when any DVC out's key would
     interleave with the repo file cache (S3). Runs on push AND pull before any
-    write."""
-    collisions = _dvc_outs_under_cache(project_path, remote_name)
+    write. ``outs`` is a precomputed :func:`_all_dvc_outs` result."""
+    collisions = _dvc_outs_under_cache(project_path, remote_name, outs)
     if not collisions:
         return
     c = collisions[0]
@@ -556,11 +574,14 @@ class _PushItem:
     abs_path: Path
     size: int
     # Set when enumeration's ``stat()`` raised (a TOCTOU: a producer removed /
-    # locked the file between ``os.walk`` listing it and ``_add_file`` stat'ing
-    # it). The item is still enumerated so it lands in the ledger as a per-file
+    # locked the file between the directory walk listing it and ``_add_file``
+    # stat'ing it). The item is still enumerated so it lands in the ledger as a per-file
     # ``failed`` outcome (``_push_one`` short-circuits on it) rather than letting
     # a bare ``OSError`` abort the whole push as a raw traceback out of main().
     read_error: OSError | None = None
+    # The enumeration stat's ``st_mtime_ns``; with ``size`` it keys the
+    # remembered digest (``_LocalDigests``). 0 = unknown, never trusted.
+    mtime_ns: int = 0
 
 
 def _resolve_arg(project_path: Path, arg: str) -> Path:
@@ -594,6 +615,9 @@ class _PushScan:
     symlinks: list[str]
     refused: list[_Refused]
     empty_args: list[str]
+    # Repo-relative directory args whose subtree was walked: every file
+    # still under one of them is in ``items`` (or ``refused``/``symlinks``).
+    walked_dirs: list[str] = field(default_factory=list)
 
     def refused_by(self, reason: RefusalReason) -> list[str]:
         return [r.path for r in self.refused if r.reason == reason]
@@ -616,6 +640,7 @@ def enumerate_push_items(
     symlinks: list[str] = []
     refused: list[_Refused] = []
     empty_args: list[str] = []
+    walked_dirs: list[str] = []
     seen: set[str] = set()
 
     def _rel_of(p: Path) -> str:
@@ -649,7 +674,7 @@ def enumerate_push_items(
             return "dvc_tracked"
         return None
 
-    def _add_file(abs_path: Path) -> None:
+    def _add_file(abs_path: Path, entry: os.DirEntry[str] | None = None) -> None:
         # A file discovered mid-walk that fails a check is REFUSED LOUDLY (added
         # to ``refused``), never silently dropped — a bare ``return`` would omit
         # it from every ledger, letting a sibling valid file report success while
@@ -667,14 +692,18 @@ def enumerate_push_items(
             return
         seen.add(rel)
         try:
-            size = abs_path.stat().st_size
+            # A walked entry is already known not to be a symlink, so its
+            # cached lstat is the same answer as a fresh stat of the path.
+            st = entry.stat(follow_symlinks=False) if entry is not None else abs_path.stat()
         except OSError as exc:
-            # TOCTOU: gone/unreadable between os.walk and this stat. Enumerate it
+            # TOCTOU: gone/unreadable between the walk and this stat. Enumerate it
             # anyway (size 0, carrying the error) so it becomes a per-file failed
             # ledger entry instead of a raw traceback (see _PushItem.read_error).
             items.append(_PushItem(rel=rel, abs_path=abs_path, size=0, read_error=exc))
             return
-        items.append(_PushItem(rel=rel, abs_path=abs_path, size=size))
+        items.append(
+            _PushItem(rel=rel, abs_path=abs_path, size=st.st_size, mtime_ns=st.st_mtime_ns)
+        )
 
     for arg in paths:
         raw = _resolve_arg(project_path, arg)
@@ -698,34 +727,51 @@ def enumerate_push_items(
             if dir_reason is not None:
                 refused.append(_Refused(rel, dir_reason))
                 continue
+            walked_dirs.append(rel)
             before_refused = len(refused)
             files_here = 0  # regular (non-symlink) files this arg's walk found
-            for dirpath, dirnames, filenames in os.walk(abs_path, followlinks=False):
-                # Screen symlinked SUBDIRECTORIES: os.walk(followlinks=False)
-                # yields their names here but never descends into them, so any
-                # files beneath a symlinked dir would be silently omitted from
-                # the push. Drop them from the walk (keeping os.walk's no-follow
-                # contract honest) and record each as a skipped symlink named by
-                # its own path — same posture as a symlinked file. Prune protected
+            # Depth-first over ``os.scandir`` in os.walk's top-down order (each
+            # directory's sorted subdirs, then its sorted files, then its kept
+            # subdirs). DirEntry answers is_symlink from the directory read and
+            # caches the one lstat _add_file needs, so a file costs one syscall
+            # instead of an is_symlink lstat plus a stat.
+            pending = [abs_path]
+            while pending:
+                dir_path = pending.pop()
+                try:
+                    with os.scandir(dir_path) as it:
+                        entries = sorted(it, key=lambda e: e.name)
+                except OSError:
+                    continue  # unreadable directory: skipped, as os.walk does
+                # Screen symlinked SUBDIRECTORIES: they are never descended
+                # into, so any files beneath one would be silently omitted from
+                # the push. Record each as a skipped symlink named by its own
+                # path — same posture as a symlinked file. Prune protected
                 # subtrees (.git/.dvc) from the walk entirely — enumerating git's
                 # object store is pointless and would refuse thousands of files.
-                kept: list[str] = []
-                for d in sorted(dirnames):
-                    child = Path(dirpath) / d
-                    if child.is_symlink():
-                        symlinks.append(_rel_of(child))
-                    elif _is_protected_repo_path(_rel_of(child)):
+                kept: list[Path] = []
+                files: list[os.DirEntry[str]] = []
+                for e in entries:
+                    try:
+                        is_dir = e.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(e)
                         continue
-                    else:
-                        kept.append(d)
-                dirnames[:] = kept
-                for name in sorted(filenames):
-                    fp = Path(dirpath) / name
-                    if fp.is_symlink():
+                    child = Path(e.path)
+                    if e.is_symlink():
+                        symlinks.append(_rel_of(child))
+                    elif not _is_protected_repo_path(_rel_of(child)):
+                        kept.append(child)
+                for e in files:
+                    fp = Path(e.path)
+                    if e.is_symlink():
                         symlinks.append(_rel_of(fp))
                         continue
                     files_here += 1
-                    _add_file(fp)
+                    _add_file(fp, e)
+                pending.extend(reversed(kept))
             if files_here == 0 and len(refused) == before_refused:
                 # Zero regular files AND zero refusals from this dir — a genuinely
                 # empty (or all-symlink) arg. Counting files_here (not items
@@ -748,7 +794,8 @@ def enumerate_push_items(
             empty_args.append(arg)
 
     return _PushScan(
-        items=items, symlinks=symlinks, refused=refused, empty_args=empty_args
+        items=items, symlinks=symlinks, refused=refused, empty_args=empty_args,
+        walked_dirs=walked_dirs,
     )
 
 
@@ -757,6 +804,86 @@ def enumerate_push_items(
 # ---------------------------------------------------------------------------
 
 
+# A file modified this recently may still change within the same mtime tick,
+# so its digest is not remembered (git's "racily clean" rule).
+_DIGEST_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _default_digest_dir() -> Path:
+    return Path.home() / ".cache" / "mintd" / "digests"
+
+
+class _LocalDigests:
+    """SHA256s of working-tree files remembered across pushes.
+
+    Keyed per file on the enumeration stat's ``(st_size, st_mtime_ns)``: an
+    unchanged file's digest is reused instead of re-reading it, so re-pushing
+    an unchanged tree costs the walk's stats, not a full hash of every
+    size-matching file. Any size or mtime change re-hashes. Persisted per
+    project (``<dir>/<sha256(project root)[:16]>.json``); a missing or
+    corrupt file just means an empty memo, and a failed save is logged and
+    ignored. ``cache push --rehash`` bypasses it. Entries under a pushed
+    directory that the push no longer found (deleted or renamed files) are
+    dropped by :meth:`forget_missing`, so the memo tracks the tree.
+    """
+
+    def __init__(self, path: Path, entries: dict[str, list[Any]]) -> None:
+        self._path = path
+        self._entries = entries
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory: Path, project_root: Path) -> "_LocalDigests":
+        key = hashlib.sha256(str(project_root).encode("utf-8")).hexdigest()[:16]
+        path = directory / f"{key}.json"
+        try:
+            raw = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            raw = {}
+        return cls(path, raw if isinstance(raw, dict) else {})
+
+    def sha256(self, item: _PushItem) -> str:
+        hit = self._entries.get(item.rel)
+        if (
+            item.mtime_ns
+            and isinstance(hit, list)
+            and len(hit) == 3
+            and hit[0] == item.size
+            and hit[1] == item.mtime_ns
+        ):
+            return hit[2]
+        sha = file_sha256(item.abs_path)
+        if item.mtime_ns and time.time_ns() - item.mtime_ns > _DIGEST_RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[item.rel] = [item.size, item.mtime_ns, sha]
+                self._dirty = True
+        return sha
+
+    def forget_missing(self, walked_dirs: list[str], found: set[str]) -> None:
+        """Drop remembered files under ``walked_dirs`` that are not in ``found``."""
+        prefixes = tuple(f"{d}/" for d in walked_dirs)
+        if not prefixes:
+            return
+        with self._lock:
+            stale = [rel for rel in self._entries if rel.startswith(prefixes) and rel not in found]
+            for rel in stale:
+                del self._entries[rel]
+            if stale:
+                self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_name(f"{self._path.name}.{uuid4().hex}.tmp")
+            tmp.write_bytes(json.dumps(self._entries).encode("utf-8"))
+            os.replace(tmp, self._path)
+        except OSError as exc:
+            logger.debug("could not save local digests to %s: %s", self._path, exc)
+
+
 def _push_local_error(rel: str, exc: OSError) -> TransferOutcome:
     """A local-filesystem error (a file removed / made unreadable between
     enumeration and hashing — a real TOCTOU when a producer is still writing
@@ -772,6 +899,10 @@ def _push_local_error(rel: str, exc: OSError) -> TransferOutcome:
     )
 
 
+def _local_sha(item: _PushItem, digests: _LocalDigests | None) -> str:
+    return digests.sha256(item) if digests is not None else file_sha256(item.abs_path)
+
+
 def _push_one(
     item: _PushItem,
     *,
@@ -781,11 +912,12 @@ def _push_one(
     remote_size: int | None,
     advance: Callable[[int], None],
     dry_run: bool,
+    digests: _LocalDigests | None = None,
 ) -> TransferOutcome:
     """Self-contained per-file task: size-precheck (from the shared LIST),
     HEAD+SHA only for size-matching candidates, then upload or skip. No shared
-    mutable state; the ``remote_size`` argument is read from the read-only LIST
-    map by the caller."""
+    mutable state beyond ``digests`` (lock-guarded); the ``remote_size``
+    argument is read from the read-only LIST map by the caller."""
     if item.read_error is not None:
         # Enumeration could not stat this file (removed/locked mid-push). Resolve
         # it here — before any S3 call — to the same per-file failed ledger entry
@@ -797,7 +929,7 @@ def _push_one(
     remote_sha: str | None = None
     if remote_size is not None and remote_size == item.size:
         try:
-            local_sha = file_sha256(item.abs_path)
+            local_sha = _local_sha(item, digests)
         except OSError as exc:
             return _push_local_error(item.rel, exc)
         try:
@@ -820,7 +952,7 @@ def _push_one(
         return TransferOutcome(rel=item.rel, status="uploaded", bytes=item.size)
     if local_sha is None:
         try:
-            local_sha = file_sha256(item.abs_path)
+            local_sha = _local_sha(item, digests)
         except OSError as exc:
             return _push_local_error(item.rel, exc)
     extra_args: dict[str, Any] = {
@@ -914,17 +1046,24 @@ def cache_push(
     jobs: int = 8,
     dry_run: bool = False,
     s3_client_factory: Factory | None = None,
+    rehash: bool = False,
+    digest_dir: Path | None = None,
 ) -> CachePushSummary:
     """Upload every named repo file to ``<prefix>/cache/<repo-relative-path>``.
     Any working-tree file may be cached except a DVC-tracked out, a ``.git/`` /
     ``.dvc/`` internal, or a forbidden-set-unclean path — all refused loudly,
     all-or-nothing. One paginated LIST precheck, HEADs only for size-matching
-    candidates, concurrent uploads through S1's transport."""
+    candidates, concurrent uploads through S1's transport. Local digests of
+    files unchanged since the last push are reused (``_LocalDigests``) unless
+    ``rehash``."""
     factory = s3_client_factory or _create_s3_client
     jobs = jobs or 8
     repo = resolve_repo_remote(project_path, remote)
-    guard_no_dvc_outs_under_cache(project_path, repo.remote_name)
-    tracked = dvc_tracked_paths(project_path, repo.remote_name)
+    # One project walk + .dvc/dvc.lock parse feeds both the collision guard
+    # and the tracked-path set.
+    outs = _all_dvc_outs(project_path, repo.remote_name)
+    guard_no_dvc_outs_under_cache(project_path, repo.remote_name, outs=outs)
+    tracked = dvc_tracked_paths(project_path, repo.remote_name, outs=outs)
 
     scan = enumerate_push_items(project_path, paths, tracked)
     _raise_on_refusals(scan)
@@ -962,6 +1101,10 @@ def cache_push(
         # repo-relative path, so the precheck map keys directly on item.rel.
         return remote_by_remainder.get(item.rel)
 
+    digests = None if rehash else _LocalDigests.load(
+        digest_dir if digest_dir is not None else _default_digest_dir(),
+        project_path.resolve(),
+    )
     symlink_outcomes = [
         TransferOutcome(rel=s, status="skipped_symlink") for s in scan.symlinks
     ]
@@ -973,7 +1116,7 @@ def cache_push(
                 _push_one(
                     item, s3=s3, bucket=repo.bucket, prefix=repo.prefix,
                     remote_size=_remote_size(item), advance=lambda _n: None,
-                    dry_run=True,
+                    dry_run=True, digests=digests,
                 )
             )
     else:
@@ -988,7 +1131,7 @@ def cache_push(
                     ex.submit(
                         _push_one, item, s3=s3, bucket=repo.bucket,
                         prefix=repo.prefix, remote_size=_remote_size(item),
-                        advance=advance, dry_run=False,
+                        advance=advance, dry_run=False, digests=digests,
                     )
                     for item in items
                 ]
@@ -998,6 +1141,9 @@ def cache_push(
                     done += 1
                     advance.set_description(_push_label(done, n_files))
     outcomes.extend(symlink_outcomes)
+    if digests is not None:
+        digests.forget_missing(scan.walked_dirs, {i.rel for i in items})
+        digests.save()
 
     summary = CachePushSummary(
         outcomes=outcomes,
@@ -1141,8 +1287,11 @@ def cache_pull(
     factory = s3_client_factory or _create_s3_client
     jobs = jobs or 8
     repo = resolve_repo_remote(project_path, remote)
-    guard_no_dvc_outs_under_cache(project_path, repo.remote_name)
-    tracked = dvc_tracked_paths(project_path, repo.remote_name)
+    # One project walk + .dvc/dvc.lock parse feeds both the collision guard
+    # and the tracked-path set.
+    outs = _all_dvc_outs(project_path, repo.remote_name)
+    guard_no_dvc_outs_under_cache(project_path, repo.remote_name, outs=outs)
+    tracked = dvc_tracked_paths(project_path, repo.remote_name, outs=outs)
 
     sub = _normalise_sub_path(prefix)  # "isochrones/ct/" or ""
     listing = _list_or_cache_error(
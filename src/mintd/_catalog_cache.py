@@ -15,6 +15,7 @@ Layout in the cache mirrors the production registry repo:
 
 from __future__ import annotations
 
+import glob
 from pathlib import Path
 
 from ._catalog_serializer import deserialize
@@ -24,6 +25,7 @@ from .catalog import CatalogEntry, CatalogFilter
 # Project types correspond to the four catalog subdirectories. The model's
 # `project.type` literal is the source of truth; this list must stay in sync.
 _TYPE_DIRS = ("data", "code", "project", "enclave")
+_TYPE_RANK = {type_name: i for i, type_name in enumerate(_TYPE_DIRS)}
 
 
 class CatalogCache:
@@ -86,7 +88,11 @@ class CatalogCache:
         # write_entry / .mintd_pending.json that wasn't committed before
         # a failure). The cache is mintd-owned scratch; nothing under it
         # is user data, so force-discarding is safe.
-        self._git_ops.checkout(self._work_dir, "main", force=True)
+        # The common case is a cache already parked on main, where the
+        # ``reset --hard`` below discards the same changes — skip the
+        # extra git process and go straight to fetch.
+        if not self._on_main():
+            self._git_ops.checkout(self._work_dir, "main", force=True)
         self._git_ops.fetch(self._work_dir)
         self._git_ops.reset_hard(self._work_dir, "origin/main")
 
@@ -103,7 +109,31 @@ class CatalogCache:
         path = self._find_entry_path(name)
         if path is None:
             return None
-        return deserialize(path.read_text(encoding="utf-8"))
+        return deserialize(path.read_bytes())
+
+    def has_entry(self, name: str) -> bool:
+        """Whether `name` exists in any `catalog/<type>/` subdirectory.
+
+        Existence checks (``status``, ``register``'s duplicate guard) only
+        need a stat, not a yaml parse + model validation.
+        """
+        return self._find_entry_path(name) is not None
+
+    def entry_names(self) -> set[str]:
+        """Names of every entry on disk, across all type directories.
+
+        One directory listing per type, built once — for callers that test
+        many names against the same snapshot (``status_many``) instead of
+        stat-ing each ``catalog/<type>/<name>.yaml`` per name.
+        """
+        catalog_dir = self._work_dir / "catalog"
+        if not catalog_dir.is_dir():
+            return set()
+        return {
+            path.stem
+            for path in catalog_dir.glob("*/*.yaml")
+            if path.parent.name in _TYPE_RANK
+        }
 
     def list_entries(self, filter: CatalogFilter | None = None) -> list[CatalogEntry]:
         """Walk all catalog yaml files, optionally filter by project type."""
@@ -111,15 +141,15 @@ class CatalogCache:
         if not catalog_dir.is_dir():
             return []
 
-        results: list[CatalogEntry] = []
-        type_dirs = [filter.project_type] if filter and filter.project_type else _TYPE_DIRS
-        for type_name in type_dirs:
-            subdir = catalog_dir / type_name
-            if not subdir.is_dir():
-                continue
-            for path in sorted(subdir.glob("*.yaml")):
-                results.append(deserialize(path.read_text(encoding="utf-8")))
-        return results
+        # One pattern walk instead of an is_dir + glob per type directory;
+        # the sort key keeps the old order (type-dir order, then filename).
+        if filter and filter.project_type:
+            pattern = f"{glob.escape(filter.project_type)}/*.yaml"
+            paths = list(catalog_dir.glob(pattern))
+        else:
+            paths = [p for p in catalog_dir.glob("*/*.yaml") if p.parent.name in _TYPE_RANK]
+        paths.sort(key=lambda p: (_TYPE_RANK.get(p.parent.name, -1), p.name))
+        return [deserialize(path.read_bytes()) for path in paths]
 
     # ------------------------------------------------------------------
     # Writes (working tree only — caller pushes)
@@ -143,30 +173,43 @@ class CatalogCache:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _on_main(self) -> bool:
+        """True when the cache's HEAD is the ``main`` branch. Reads
+        ``.git/HEAD`` directly; any surprise (detached HEAD, unreadable
+        file) answers False so the caller falls back to an explicit
+        checkout."""
+        try:
+            head = (self._work_dir / ".git" / "HEAD").read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return head.strip() == "ref: refs/heads/main"
+
     def _find_entry_path(self, name: str) -> Path | None:
         catalog_dir = self._work_dir / "catalog"
         if not catalog_dir.is_dir():
             return None
-        for type_name in _TYPE_DIRS:
-            candidate = catalog_dir / type_name / f"{name}.yaml"
-            if candidate.is_file():
-                return candidate
-        return None
+        # One pattern walk over the type directories instead of a stat per
+        # type. Sort by _TYPE_DIRS so a name present under several types
+        # resolves the same way it always has.
+        matches = [
+            path
+            for path in catalog_dir.glob(f"*/{glob.escape(name)}.yaml")
+            if path.parent.name in _TYPE_RANK and path.is_file()
+        ]
+        if not matches:
+            return None
+        return min(matches, key=lambda p: _TYPE_RANK[p.parent.name])
 
     @staticmethod
     def _entry_project_name(entry: CatalogEntry) -> str:
-        dumped = entry.model_dump()
-        project = dumped.get("project") or {}
-        name = project.get("name")
-        if not isinstance(name, str) or not name:
+        name = entry.name
+        if not name:
             raise ValueError("CatalogEntry missing project.name")
         return name
 
     @staticmethod
     def _entry_project_type(entry: CatalogEntry) -> str:
-        dumped = entry.model_dump()
-        project = dumped.get("project") or {}
-        project_type = project.get("type")
+        project_type = entry.project_type
         if project_type not in _TYPE_DIRS:
             raise ValueError(f"CatalogEntry has invalid project.type: {project_type!r}")
         return project_type
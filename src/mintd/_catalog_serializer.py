@@ -5,26 +5,34 @@ The catalog stores `metadata.json` verbatim except for
 audience-based filtering, no advisory tier — see `notes/decisions.md`
 2026-05-14 for the rationale.
 
-Two thin wrappers around `yaml.safe_dump` / `yaml.safe_load`:
+Thin wrappers around `safe_dump` / `safe_load` (libyaml-backed, see
+`_yaml.py`):
   - `serialize(metadata)` calls `metadata.to_catalog_entry()` and dumps.
+  - `serialize_entry(entry)` dumps an already-projected `CatalogEntry`.
   - `deserialize(yaml_text)` parses into a `CatalogEntry`.
 """
 
 from __future__ import annotations
 
-import yaml
-
+from . import _yaml
 from .catalog import CatalogEntry
 from .model import Metadata
 
 
 def serialize(metadata: Metadata) -> str:
     """Emit `metadata` as catalog yaml text."""
-    entry = metadata.to_catalog_entry()
-    return yaml.safe_dump(entry.model_dump(mode="json"), sort_keys=False, default_flow_style=False)
+    return serialize_entry(metadata.to_catalog_entry())
+
+
+def serialize_entry(entry: CatalogEntry) -> str:
+    """Emit an already-projected `entry` as catalog yaml text. Callers that
+    need both the entry and its yaml project once and dump here, rather
+    than round-tripping `serialize` output back through `deserialize`."""
+    return _yaml.safe_dump(entry.model_dump(mode="json"), sort_keys=False, default_flow_style=False)
 
 
-def deserialize(yaml_text: str) -> CatalogEntry:
-    """Parse a catalog yaml string into a CatalogEntry."""
-    raw = yaml.safe_load(yaml_text) or {}
+def deserialize(yaml_text: str | bytes) -> CatalogEntry:
+    """Parse catalog yaml (text, or UTF-8 bytes as read from disk) into a
+    CatalogEntry."""
+    raw = _yaml.safe_load(yaml_text) or {}
     return CatalogEntry.model_validate(raw)
@@ -8,11 +8,15 @@ dependencies explicitly and never reaches into a global config.
 from __future__ import annotations
 
 import os
+import time
+from functools import cached_property
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from . import _yaml
+
 
 class ConfigError(Exception):
     """Malformed YAML or Pydantic-validation failure while loading config."""
@@ -24,6 +28,17 @@ class Timeouts(BaseModel):
     transfer: float | None = None
 
 
+# Parsed configs keyed by absolute path, validated against the file's
+# ``(st_mtime_ns, st_size)``. Handlers, the client resolvers and config_ops
+# each call ``Config.load``, so one command can load the same file several
+# times (and a long-lived caller many more); an unchanged file costs a stat
+# instead of a YAML parse + validation. A file modified within the racy
+# window is not cached: a rewrite inside one timestamp tick could leave the
+# key unchanged.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], "Config"]] = {}
+_CONFIG_CACHE_RACY_WINDOW_NS = 2_000_000_000
+
+
 class Config(BaseModel):
     model_config = ConfigDict(frozen=True, extra="forbid")
 
@@ -59,33 +74,53 @@ class Config(BaseModel):
     def load(cls, path: Path | None = None) -> "Config":
         if path is None:
             path = _default_config_path()
-        if not path.is_file():
+        cache_key = os.path.abspath(path)
+        try:
+            st = os.stat(cache_key)
+        except (FileNotFoundError, NotADirectoryError):
             return cls()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == key:
+            # A copy, so per-instance cached properties (aws_profile_name)
+            # are resolved afresh for each load, as before.
+            return cached[1].model_copy()
+        # Parsed from bytes: the parser never pulls through a text-mode
+        # file object.
         try:
-            with path.open(encoding="utf-8") as fh:
-                data = yaml.safe_load(fh) or {}
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return cls()
+        try:
+            data = _yaml.safe_load(raw) or {}
         except yaml.YAMLError as e:
             raise ConfigError(f"malformed YAML in {path}: {e}") from e
         try:
-            return cls.model_validate(data)
+            config = cls.model_validate(data)
         except ValidationError as e:
             raise ConfigError(
                 f"invalid config in {path} (see notes/CONFIG.md for the new timeouts: block): {e}"
             ) from e
+        if time.time_ns() - st.st_mtime_ns > _CONFIG_CACHE_RACY_WINDOW_NS:
+            _CONFIG_CACHE[cache_key] = (key, config.model_copy())
+        return config
 
     def resolved_cache_dir(self) -> Path:
         return self.cache_dir if self.cache_dir is not None else Path.home() / ".cache" / "mintd"
 
-    @property
+    @cached_property
     def aws_profile_name(self) -> str | None:
         """Returns 'mintd' if ~/.aws/credentials has a [mintd] section, else None
-        (= boto3 default credential chain)."""
+        (= boto3 default credential chain).
+
+        Resolved once per ``Config`` instance — handlers read it several
+        times per invocation and the credentials file does not change
+        underneath a single CLI run."""
         import configparser
-        from pathlib import Path
 
         cred_path = Path.home() / ".aws" / "credentials"
-        if not cred_path.is_file():
-            return None
+        # No is_file() probe: ConfigParser.read already skips a missing or
+        # unreadable file, leaving no sections.
         cp = configparser.ConfigParser()
         try:
             cp.read(cred_path)
@@ -95,6 +130,9 @@ class Config(BaseModel):
 
 
 def _default_config_path() -> Path:
+    """Resolved on demand, never at import: ``mintd --version`` and other
+    config-free paths pay no ``Path.home()``. Deliberately uncached so a
+    changed ``$MINTD_CONFIG_DIR`` / ``$HOME`` (tests, wrappers) is honoured."""
     base = os.environ.get("MINTD_CONFIG_DIR")
     if base:
         return Path(base) / "config.yaml"
@@ -1,18 +1,24 @@
+from __future__ import annotations
+
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+import json
 import sys
 import logging
+import threading
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    TaskID,
-    TextColumn,
-    TimeRemainingColumn,
-    TransferSpeedColumn,
-)
-from rich.status import Status
+
+# The live widgets (rich.status / rich.progress, plus rich.live and the
+# spinner tables behind them) are imported where they're first used: most
+# invocations (--help, list/show commands, --json) never draw one.
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+    from rich.status import Status
+
+# A status spinner only appears once its block has run this long. Fast
+# blocks (a cached lookup, a no-op push) finish before it fires and never
+# pay for rich's Live setup/teardown or flash a one-frame spinner.
+_STATUS_START_DELAY_S = 0.2
 
 
 class _ProgressHandle:
@@ -48,6 +54,9 @@ class Reporter:
         self._active_progress: Optional[Progress] = None
         self._progress_task_id: Optional[TaskID] = None
         self._status_base: str = ""
+        # Serializes the deferred spinner start (timer thread) against
+        # progress() suspending that same spinner on the main thread.
+        self._status_lock = threading.Lock()
         # Per-stream byte buffer for chunk-boundary safety: subprocess
         # output arrives in 256-byte chunks that may split a \r-terminated
         # progress tick in half. Without buffering, the spinner would
@@ -56,8 +65,22 @@ class Reporter:
         # until we see a \r or \n boundary.
         self._stderr_buf: str = ""
 
+    def _live_enabled(self) -> bool:
+        """Whether a spinner / progress bar should run at all. Off a TTY
+        (CI, output piped to a log) rich's Live renders nothing for a
+        transient widget but still starts a refresh thread and redirects
+        stdio, so skip it along with --json and quiet levels."""
+        return not self.json_mode and self.level >= 1 and self._stderr.is_terminal
+
+    @property
+    def shows_live_progress(self) -> bool:
+        """Whether ``status`` / ``progress`` actually render. Subprocess
+        wrappers use it to skip asking a child for progress output that
+        would only be buffered and dropped."""
+        return self._live_enabled()
+
     def status(self, msg: str) -> Any:  # context manager
-        if self.json_mode or self.level < 1:
+        if not self._live_enabled():
             from contextlib import nullcontext
             return nullcontext()
         # Clear any residual partial from the previous subprocess (rare,
@@ -73,15 +96,24 @@ class Reporter:
         # reference, treats the (already-stopped) spinner as "active",
         # and re-opens it on progress exit — leaving the old label
         # stuck on screen during subsequent subprocess phases.
+        # The spinner itself starts on a timer (``_STATUS_START_DELAY_S``);
+        # labels set before then are simply shown when it does start.
         outer_self = self
+        timer = threading.Timer(
+            _STATUS_START_DELAY_S, self._start_deferred_status, args=(rich_status,)
+        )
+        timer.daemon = True
 
         class _StatusCM:
             def __enter__(self) -> Any:
-                rich_status.__enter__()
+                timer.start()
                 return rich_status
 
             def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
                 try:
+                    timer.cancel()
+                    timer.join()
+                    # No-op when the block finished before the timer fired.
                     rich_status.__exit__(exc_type, exc, tb)
                 finally:
                     outer_self._active_status = None
@@ -89,9 +121,16 @@ class Reporter:
 
         return _StatusCM()
 
+    def _start_deferred_status(self, rich_status: Status) -> None:
+        """Timer callback: show the spinner unless its block already ended
+        or ``progress()`` suspended it in the meantime."""
+        with self._status_lock:
+            if self._active_status is rich_status:
+                rich_status.start()
+
     def update_status(self, msg: str) -> None:
         """Refresh the active status spinner's label. No-op when status is a
-        nullcontext (json_mode / quiet level). Used to phase a multi-step
+        nullcontext (json_mode / quiet level / not a TTY). Used to phase a multi-step
         operation under one outer ``with reporter.status(...)`` block."""
         if self.json_mode or self._active_status is None:
             return
@@ -122,14 +161,15 @@ class Reporter:
             self._stderr.print(f"warning: {msg}")
 
     def error(self, msg: str, *, hint: Optional[str] = None) -> None:
-        self._stderr.print(f"error: {msg}")
+        # One print for the error and all its hint lines: one render pass
+        # and one write instead of one per line.
+        lines = [f"error: {msg}"]
         if hint:
-            for line in hint.splitlines():
-                self._stderr.print(f"  hint: {line}")
+            lines.extend(f"  hint: {line}" for line in hint.splitlines())
+        self._stderr.print("\n".join(lines))
 
     def result(self, payload: Any, *, pretty: Optional[Callable[[Any], str]] = None) -> None:
         if self.json_mode:
-            import json
             sys.stdout.write(json.dumps(payload, separators=(",", ":")) + "\n")
             sys.stdout.flush()
         else:
@@ -179,20 +219,31 @@ class Reporter:
         if not chunk or self.json_mode:
             return
         self._stderr_buf += chunk
-        # Drain complete \n-terminated lines first.
-        while "\n" in self._stderr_buf:
-            line, _, self._stderr_buf = self._stderr_buf.partition("\n")
-            visible = line[line.rfind("\r") + 1:] if "\r" in line else line
-            visible = visible.rstrip()
-            if visible:
-                self._stderr.print(visible)
+        # Drain complete \n-terminated lines first, printing them together.
+        if "\n" in self._stderr_buf:
+            *lines, self._stderr_buf = self._stderr_buf.split("\n")
+            # Only the text after a line's last \r survived on a terminal.
+            drained = [
+                visible
+                for line in lines
+                if (visible := line[line.rfind("\r") + 1:].rstrip())
+            ]
+            if drained:
+                self._stderr.print("\n".join(drained))
         # Now buffer has the in-flight tail (no \n). Find the last
         # complete tick — text between the second-to-last \r and the last
         # \r. Anything after the last \r is partial and stays buffered.
-        if self._active_status is None or "\r" not in self._stderr_buf:
-            return
         last_r = self._stderr_buf.rfind("\r")
+        if last_r == -1:
+            return
         before_last_r = self._stderr_buf[:last_r]
+        # Everything before the last \r is overwritten history: scrollback
+        # only prints what follows it, and the tick below is taken now. Drop
+        # it so a long \r-only stream (clone --progress with no spinner, e.g.
+        # piped to a log) doesn't grow the buffer and get rescanned per chunk.
+        self._stderr_buf = self._stderr_buf[last_r:]
+        if self._active_status is None:
+            return
         if "\r" in before_last_r:
             second_last_r = before_last_r.rfind("\r")
             complete_tick = before_last_r[second_last_r + 1:]
@@ -218,19 +269,29 @@ class Reporter:
         line; resumes the spinner on exit.
 
         Returns a nullcontext-style no-op (yielding a callable that does
-        nothing) when ``json_mode``, quiet mode (``level < 1``), or
-        ``total <= 0`` (empty/no-data repo).
+        nothing) when ``json_mode``, quiet mode (``level < 1``), stderr is
+        not a terminal, or ``total <= 0`` (empty/no-data repo).
 
         Single-active per Reporter — nesting is not supported (no current
         caller nests; would corrupt ``_active_status`` tracking)."""
-        if self.json_mode or self.level < 1 or total <= 0:
+        if not self._live_enabled() or total <= 0:
             yield _ProgressHandle(lambda _n: None, lambda _t: None)
             return
+        from rich.progress import (
+            BarColumn,
+            DownloadColumn,
+            Progress,
+            TextColumn,
+            TimeRemainingColumn,
+            TransferSpeedColumn,
+        )
+
         had_status = self._active_status is not None
         base = self._status_base
-        if had_status and self._active_status is not None:
-            self._active_status.stop()
-            self._active_status = None
+        with self._status_lock:
+            if had_status and self._active_status is not None:
+                self._active_status.stop()
+                self._active_status = None
         prog = Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
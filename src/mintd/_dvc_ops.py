@@ -6,6 +6,8 @@ Only this module shells out to `dvc`. Mirrors `_registry_git_ops.py` for git/gh.
 from __future__ import annotations
 
 import ast
+import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -124,6 +126,9 @@ class DvcPushResult:
     up_to_date: bool = False
 
 
+_PUSHED_COUNT_RE = re.compile(r"(\d+)\s+files?\s+pushed")
+
+
 def _parse_push_output(stdout: str) -> DvcPushResult:
     """Best-effort scrape of `dvc push`'s human summary.
 
@@ -131,11 +136,9 @@ def _parse_push_output(stdout: str) -> DvcPushResult:
     `N file(s) pushed` after a real transfer. Never raises: unrecognized
     output yields `pushed=None`, and the caller still reports success.
     """
-    import re
-
     if "Everything is up to date." in stdout:
         return DvcPushResult(pushed=0, up_to_date=True)
-    m = re.search(r"(\d+)\s+files?\s+pushed", stdout)
+    m = _PUSHED_COUNT_RE.search(stdout)
     if m:
         n = int(m.group(1))
         return DvcPushResult(pushed=n, up_to_date=(n == 0))
@@ -292,7 +295,6 @@ class SubprocessDvcOps:
         """
         if not self._aws_profile_name:
             return None
-        import os
         env = dict(os.environ)
         env.setdefault("AWS_PROFILE", self._aws_profile_name)
         return env
@@ -446,8 +448,6 @@ class SubprocessDvcOps:
         return path.parent / (path.name + ".dvc")
 
     def status(self, targets: list[str] | None = None) -> dict[str, str]:
-        import json
-
         cmd = [*dvc_cmd(), "status", "--json"]
         if targets:
             cmd.extend(targets)
@@ -5,23 +5,28 @@ Coupled to DVC cache layout (3.66.x).
 
 import configparser
 import dataclasses
+import functools
 import hashlib
+import importlib.metadata
 import json
 import logging
 import os
 import random
+import re
 import shlex
 import subprocess
 import time
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Protocol, TypeVar
 
 import yaml
 
+# Only the (cheap) botocore exception classes are imported eagerly — the
+# ``except`` clauses below need them. boto3 itself is imported on first S3
+# use by ``_boto3()``.
 try:
-    import boto3
     from botocore.exceptions import (
         ClientError,
         ConnectionClosedError,
@@ -32,7 +37,6 @@ try:
         SSLError,
     )
 except ImportError:
-    boto3 = None  # type: ignore[assignment]
 
     class _BotocoreMissingError(Exception):
         """Placeholder when botocore is absent; never raised, so
@@ -47,6 +51,7 @@ except ImportError:
     ReadTimeoutError = _BotocoreMissingError  # type: ignore[assignment,misc]
     SSLError = _BotocoreMissingError  # type: ignore[assignment,misc]
 
+from mintd import _yaml
 from mintd._atomic import _try_fsync_file, _try_fsync_parent_dir
 from mintd._dvc_invoke import dvc_cmd
 from mintd.model import FastPullResult
@@ -82,8 +87,40 @@ _RETRY_BACKOFF_CAP_S = 8.0
 _SPOT_CHECK_N = 5
 _DEFAULT_DVC_CACHE_REL = Path(".dvc/cache")
 
+# All three ``.dvc/config`` remote-section spellings: ``'remote "name"'``,
+# ``remote "name"`` and ``remote name``.
+_REMOTE_SECTION_RE = re.compile(r"""'?remote\s+"?(?P<name>[^"']+)"?'?""")
+
+
+def _installed_dvc_version() -> str | None:
+    """dvc's version from the dist-info in mintd's own env — the same env
+    ``sys.executable -m dvc`` runs in — or ``None`` without metadata."""
+    try:
+        return importlib.metadata.version("dvc")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def _check_dvc() -> tuple[bool, str | None]:
-    """Probe the bundled dvc. Return (ok, reason_if_not_ok)."""
+    """Probe the bundled dvc. Return (ok, reason_if_not_ok).
+
+    Reads the installed version in-process first; only when there is no
+    dvc dist-info does it fall back to spawning ``python -m dvc --version``
+    (an interpreter start + dvc import, hundreds of ms), which also yields
+    the honest "not installed" reason. Memoized: mintd's own env can't
+    change mid-process, so a multi-output ``data import`` probes once.
+    """
+    version = _installed_dvc_version()
+    if version is None:
+        ok, reason, version = _probe_dvc_subprocess()
+        if not ok:
+            return ok, reason
+    return _check_dvc_version(version)
+
+
+def _probe_dvc_subprocess() -> tuple[bool, str | None, str]:
+    """Run ``python -m dvc --version``. Return (ok, reason, version)."""
     # Same "subprocess argv:" prefix and shlex quoting as run_streaming, so
     # -vv output has one grep-able, copy-pasteable format for every spawn.
     logger.debug("subprocess argv: %s", shlex.join([*dvc_cmd(), "--version"]))
@@ -96,17 +133,21 @@ def _check_dvc() -> tuple[bool, str | None]:
             check=False,
         )
     except FileNotFoundError:
-        return False, "dvc not installed"
+        return False, "dvc not installed", ""
     except subprocess.TimeoutExpired:
-        return False, "dvc version probe timed out"
+        return False, "dvc version probe timed out", ""
     if result.returncode != 0:
         # `sys.executable -m dvc` returns exit 1 + "No module named 'dvc'" on
         # stderr when dvc isn't installed in mintd's env — re-emit the
         # honest reason rather than the opaque "probe failed" string.
         if "No module named 'dvc'" in result.stderr or "No module named dvc" in result.stderr:
-            return False, "dvc not installed"
-        return False, f"dvc version probe failed (exit {result.returncode})"
-    version = result.stdout.strip()
+            return False, "dvc not installed", ""
+        return False, f"dvc version probe failed (exit {result.returncode})", ""
+    return True, None, result.stdout.strip()
+
+
+def _check_dvc_version(version: str) -> tuple[bool, str | None]:
+    """Check a dvc version string against the supported floor/ceiling."""
     parts = version.split(".")
     try:
         major, minor = int(parts[0]), int(parts[1])
@@ -388,8 +429,7 @@ def parse_dvc_outs(dvc_path: Path, remote_name: str) -> list[DvcOut]:
     empty so the caller routes them to fallback.
     """
     try:
-        with open(dvc_path) as f:
-            data = yaml.safe_load(f)
+        data = _yaml.safe_load(dvc_path.read_bytes())
     except (FileNotFoundError, yaml.YAMLError):
         return []
 
@@ -456,26 +496,24 @@ def parse_dvc_lock_outs(project_path: Path, remote_name: str) -> list[DvcOut]:
 
     wdir_map: dict[str, str] = {}
     try:
-        if yaml_path.exists():
-            with open(yaml_path) as f:
-                data = yaml.safe_load(f)
-                if isinstance(data, dict) and "stages" in data:
-                    for stage, stage_data in data["stages"].items():
-                        wdir = stage_data.get("wdir", ".")
-                        if Path(wdir).is_absolute():
-                            logger.warning(
-                                "absolute wdir in dvc.yaml stage %s: %s; skipping stage",
-                                stage, wdir,
-                            )
-                            wdir_map[stage] = "SKIP"
-                        else:
-                            wdir_map[stage] = wdir
+        # No exists() probe: a missing dvc.yaml is the FileNotFoundError below.
+        data = _yaml.safe_load(yaml_path.read_bytes())
+        if isinstance(data, dict) and "stages" in data:
+            for stage, stage_data in data["stages"].items():
+                wdir = stage_data.get("wdir", ".")
+                if Path(wdir).is_absolute():
+                    logger.warning(
+                        "absolute wdir in dvc.yaml stage %s: %s; skipping stage",
+                        stage, wdir,
+                    )
+                    wdir_map[stage] = "SKIP"
+                else:
+                    wdir_map[stage] = wdir
     except (FileNotFoundError, yaml.YAMLError, OSError):
         pass
 
     try:
-        with open(lock_path) as f:
-            lock_data = yaml.safe_load(f)
+        lock_data = _yaml.safe_load(lock_path.read_bytes())
     except (FileNotFoundError, yaml.YAMLError, OSError):
         return []
 
@@ -618,6 +656,18 @@ def cache_path_for(cache_dir: Path, md5: str) -> Path:
     return cache_dir / "files" / "md5" / md5[:2] / md5[2:]
 
 
+def _make_cache_shard_dirs(cache_dir: Path, md5s: Iterable[str]) -> None:
+    """Create each distinct ``files/md5/XX/`` shard directory once.
+
+    A directory out can have thousands of constituents but at most 256
+    shards. Creating the shards up front (shallowest first) lets the
+    per-entry :func:`fetch_to_cache` calls skip their own
+    ``mkdir(parents=True)`` — an EEXIST round-trip plus a stat per file.
+    """
+    for shard in sorted({cache_path_for(cache_dir, m).parent for m in md5s if m}):
+        shard.mkdir(parents=True, exist_ok=True)
+
+
 def is_cached(cache_dir: Path, md5: str) -> bool:
     if not md5:
         return False
@@ -899,12 +949,11 @@ def _default_remote_name_from_config(cp: "configparser.ConfigParser") -> str | N
     (single-quoted, the modern default), ``remote "name"`` (double-quoted),
     and ``remote name`` (unquoted); all three are matched.
     """
-    import re
     if cp.has_section("core") and cp.has_option("core", "remote"):
         return cp.get("core", "remote")
     remote_names: list[str] = []
     for section in cp.sections():
-        m = re.fullmatch(r"""'?remote\s+"?(?P<name>[^"']+)"?'?""", section)
+        m = _REMOTE_SECTION_RE.fullmatch(section)
         if m:
             remote_names.append(m.group("name"))
     if len(remote_names) == 1:
@@ -954,10 +1003,12 @@ def get_remote_config(project_path: Path, remote_name: str) -> dict[str, str]:
     """Read a DVC remote section from ``.dvc/config`` (path wrapper over
     :func:`parse_remote_config_text`)."""
     config_path = project_path / ".dvc" / "config"
-    if not config_path.exists():
-        raise FileNotFoundError(f"no .dvc/config at {config_path}")
     try:
-        return parse_remote_config_text(config_path.read_text(), remote_name)
+        text = config_path.read_text()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"no .dvc/config at {config_path}") from None
+    try:
+        return parse_remote_config_text(text, remote_name)
     except KeyError as exc:
         raise KeyError(f"{exc.args[0]} ({config_path})") from exc
 
@@ -1086,15 +1137,15 @@ def spot_check_versions(
 def verify_download(cache_path: Path, expected_md5: str) -> VerifyResult:
     """Stream-verify a downloaded file's md5 against the expected hash.
 
-    Streams in 1 MiB chunks so we don't OOM on multi-GB parquet files. On
-    mismatch or read error, the partial download is unlinked.
+    Streams through ``hashlib.file_digest``'s reused buffer so we don't OOM
+    on multi-GB parquet files. On mismatch or read error, the partial
+    download is unlinked.
     """
     try:
-        h = hashlib.md5(usedforsecurity=False)
         with open(cache_path, "rb") as f:
-            while chunk := f.read(1 << 20):
-                h.update(chunk)
-        actual = h.hexdigest()
+            actual = hashlib.file_digest(
+                f, lambda: hashlib.md5(usedforsecurity=False)
+            ).hexdigest()
         ok = (actual == expected_md5)
         if not ok:
             cache_path.unlink(missing_ok=True)
@@ -1146,6 +1197,7 @@ def fetch_to_cache(
     version_id: str | None = None,
     *,
     progress: Callable[[int], None] | None = None,
+    make_parent: bool = True,
 ) -> bool:
     """Download an object to the DVC cache atomically.
 
@@ -1166,9 +1218,13 @@ def fetch_to_cache(
     Retry: transient S3/network errors are retried via :func:`retry_transient`
     (3 attempts, capped backoff); the tmp file is unlinked between attempts.
     Non-transient errors (incl. md5 mismatch) propagate immediately.
+
+    ``make_parent=False`` skips creating the shard directory — for batch
+    callers that already ran :func:`_make_cache_shard_dirs`.
     """
     tmp_path = cache_path.with_suffix(".tmp")
-    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    if make_parent:
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
 
     extra_args: dict[str, str] | None = (
         {"VersionId": version_id} if version_id else None
@@ -1299,11 +1355,13 @@ def fetch_dir_contents(
                 entry.md5,
                 None,
                 progress=progress,
+                make_parent=False,
             )
             return (entry.relpath, None)
         except Exception as exc:
             return (entry.relpath, f"{entry.relpath}: {exc}")
 
+    _make_cache_shard_dirs(cache_dir, unique)
     with ThreadPoolExecutor(max_workers=max(1, jobs)) as ex:
         futures = [ex.submit(_one, e) for e in unique_entries]
         for fut in as_completed(futures):
@@ -1390,11 +1448,13 @@ def fetch_files_dir_contents(
                 entry.md5,
                 entry.version_id,
                 progress=progress,
+                make_parent=False,
             )
             return (entry.relpath, None)
         except Exception as exc:
             return (entry.relpath, f"{entry.relpath}: {exc}")
 
+    _make_cache_shard_dirs(cache_dir, unique)
     with ThreadPoolExecutor(max_workers=max(1, jobs)) as ex:
         futures = [ex.submit(_one, e) for e in unique_entries]
         for fut in as_completed(futures):
@@ -1523,11 +1583,42 @@ def _build_fast_pull_result(
     )
 
 
-def _create_s3_client(remote_cfg: dict[str, str], aws_profile_name: str | None) -> Any:
+@functools.lru_cache(maxsize=1)
+def _boto3() -> Any:
+    """The ``boto3`` module, or None when it isn't installed.
+
+    Importing boto3 pulls in botocore's session/client machinery — about
+    a quarter of a second — so it happens on the first S3 call rather than
+    at ``import mintd.cli``; ``mintd --help`` and local-only verbs never
+    pay it.
+    """
+    try:
+        import boto3
+    except ImportError:
+        return None
+    return boto3
+
+
+@functools.lru_cache(maxsize=None)
+def _s3_session(aws_profile_name: str | None) -> Any:
+    """One boto3 ``Session`` per profile for the whole process.
+
+    Building a Session resolves the profile (falling back to the default
+    chain when it doesn't exist), and each fresh Session re-loads botocore's
+    service models on its first ``client()`` call. Reusing the Session lets
+    every later S3 client — one per fast pull, rescue, and cache verb — skip
+    both. Clients are still created per call (endpoint/region vary by
+    remote); only the Session is shared.
+    """
+    boto3 = _boto3()
     try:
-        session = boto3.Session(profile_name=aws_profile_name)
+        return boto3.Session(profile_name=aws_profile_name)
     except ProfileNotFound:
-        session = boto3.Session()
+        return boto3.Session()
+
+
+def _create_s3_client(remote_cfg: dict[str, str], aws_profile_name: str | None) -> Any:
+    session = _s3_session(aws_profile_name)
 
     endpoint_url = remote_cfg.get("endpointurl")
     if not endpoint_url:
@@ -1621,7 +1712,7 @@ class SubprocessFastSyncOps:
         except ValueError as exc:
             return _degrade_all(f"non-S3 remote: {exc}")
 
-        if boto3 is None:
+        if _boto3() is None:
             return _degrade_all("boto3 not importable")
 
         s3 = _create_s3_client(remote_cfg, self._aws_profile_name)
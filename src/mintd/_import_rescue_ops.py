@@ -38,15 +38,15 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from . import imports
+from . import _yaml, imports
 from ._fast_sync_ops import (
     _DEFAULT_DVC_CACHE_REL,
     _DRIFT_404_CODES,
+    _boto3,
     _default_remote_name_from_config,
     _extract_version_id_from_file_entry,
     ClientError,
     DvcFileEntry,
-    boto3,
     cache_path_for,
     ensure_dir_manifest,
     is_cached,
@@ -233,7 +233,7 @@ def _entries_from_producer_pointer(
         except FetchError:
             continue
         try:
-            data = yaml.safe_load(raw)
+            data = _yaml.safe_load(raw)
         except yaml.YAMLError:
             continue
         entries = _match_out_files(data, output_path, producer.remote_name)
@@ -377,7 +377,7 @@ def rescue_import_pull(
             f"producer's bucket ({dep.producer_repo}@{dep.contract_pin[:7]})"
         )
 
-    if boto3 is None:
+    if _boto3() is None:
         return RescueResult(
             ok=False,
             reason="boto3 is not installed, so the producer's bucket cannot be reached",
@@ -6,11 +6,47 @@ single-seam pattern of `_dvc_ops.py` and `_registry_git_ops.py`.
 
 from __future__ import annotations
 
+import re
 import subprocess
 from pathlib import Path
 from typing import Protocol
 from ._dvc_invoke import dvc_cmd
 
+# Option values DVC's configobj writes bare (no quoting): anything with a
+# comma, quote, ``#`` or whitespace would be quoted/list-split by configobj,
+# so those keys still go through ``dvc remote modify``.
+_PLAIN_CONFIG_VALUE_RE = re.compile(r"[A-Za-z0-9._:/@+=~%-]+")
+
+
+def _append_remote_options(
+    config_path: Path, name: str, options: list[tuple[str, str]]
+) -> bool:
+    """Append ``key = value`` lines to the ``remote "<name>"`` section of a
+    ``.dvc/config`` that ``dvc remote add`` just wrote, in DVC's own layout.
+
+    Returns False — writing nothing — when the section isn't found exactly
+    once or a value isn't plain, so the caller falls back to one
+    ``dvc remote modify`` per key.
+    """
+    if not all(_PLAIN_CONFIG_VALUE_RE.fullmatch(value) for _key, value in options):
+        return False
+    try:
+        lines = config_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    except OSError:
+        return False
+    header = f"['remote \"{name}\"']"
+    starts = [i for i, line in enumerate(lines) if line.strip() == header]
+    if len(starts) != 1:
+        return False
+    end = starts[0] + 1
+    while end < len(lines) and not lines[end].lstrip().startswith("["):
+        end += 1
+    if lines[end - 1] and not lines[end - 1].endswith("\n"):
+        lines[end - 1] += "\n"
+    lines[end:end] = [f"    {key} = {value}\n" for key, value in options]
+    config_path.write_text("".join(lines), encoding="utf-8")
+    return True
+
 
 class InitOpError(Exception):
     """Non-zero exit from `git init` or `dvc init`."""
@@ -148,6 +184,12 @@ class SubprocessInitOps:
         ``dvc remote modify <name> version_aware true`` so the S3 key is
         the file's real path (mintd's mental model; matches what
         ``metadata.storage.versioning = True`` already declares).
+
+        Each ``dvc`` invocation is a full interpreter + DVC startup, so
+        after ``dvc remote add`` has created (and validated) the section,
+        the follow-up options are appended to ``.dvc/config`` directly in
+        one write — byte-for-byte what the ``modify`` calls would produce.
+        Values DVC would need to quote fall back to the ``modify`` calls.
         """
         cmd = [*dvc_cmd(), "remote", "add"]
         if default:
@@ -168,6 +210,17 @@ class SubprocessInitOps:
             if "No module named 'dvc'" in result.stderr or "No module named dvc" in result.stderr:
                 raise DvcNotInstalled("mintd's bundled dvc is missing — reinstall mintd.") from None
             raise InitOpError(f"dvc remote add failed: {result.stderr.strip()}")
+        options: list[tuple[str, str]] = []
+        if endpoint:
+            options.append(("endpointurl", endpoint))
+        if profile:
+            options.append(("profile", profile))
+        options.append(("version_aware", "true"))
+        try:
+            if _append_remote_options(target_dir / ".dvc" / "config", name, options):
+                return
+        except OSError as exc:
+            raise InitOpError(f"writing .dvc/config failed: {exc}") from exc
         if endpoint:
             result = subprocess.run(
                 [*dvc_cmd(), "remote", "modify", name, "endpointurl", endpoint],
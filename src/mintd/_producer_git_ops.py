@@ -7,6 +7,7 @@ Only this module shells out to `git` for producer-side operations (fetching
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 import tarfile
@@ -127,6 +128,24 @@ def _classify_stderr(stderr: str) -> FetchError.Reason | None:
     return None
 
 
+_SHM_DIR = "/dev/shm"
+
+
+def _scratch_dir() -> str | None:
+    """Parent for the fallback clone's throwaway directory.
+
+    The clone is ``--no-checkout`` and deleted as soon as one blob is read,
+    so it never needs to outlive the process: prefer the RAM-backed
+    ``/dev/shm`` (Linux tmpfs) when it is a writable directory, sparing
+    git's many small ``.git/objects`` writes from hitting disk. Elsewhere
+    (macOS, Windows, locked-down containers) ``None`` keeps tempfile's
+    default.
+    """
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return None
+
+
 class GitArchiveFetcher:
     """Production Fetcher. Tries `git archive --remote`, falls back to a
     shallow clone if the remote rejects `upload-archive` (GitHub disables
@@ -187,7 +206,7 @@ class GitArchiveFetcher:
         return raw, head_sha
 
     def _fallback_clone(self, repo: str, pin: str, path: str) -> bytes:
-        with tempfile.TemporaryDirectory() as tmp:
+        with tempfile.TemporaryDirectory(prefix="mintd-producer-", dir=_scratch_dir()) as tmp:
             self._run_clone(["git", "clone", "--depth=1", "--filter=blob:none", "--no-checkout", repo, tmp], repo=repo, pin=pin, path=path)
             self._run_clone(["git", "-C", tmp, "fetch", "--depth=1", "origin", pin], repo=repo, pin=pin, path=path)
             show = _run(
@@ -328,7 +347,7 @@ def _git_ls_remote_head(repo: str, *, timeout: float) -> str:
         parts = line.split()
         if not parts:
             continue
-        if _SHA_RE.match(parts[0]):
+        if _SHA_RE.fullmatch(parts[0]):
             return parts[0]
 
     raise FetchError.pin_missing(
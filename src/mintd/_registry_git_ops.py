@@ -15,6 +15,8 @@ If you ever find yourself reaching for `subprocess` outside this module, stop.
 from __future__ import annotations
 
 import json
+import os
+import shlex
 import subprocess
 from pathlib import Path
 from typing import Any, Protocol
@@ -95,7 +97,9 @@ class RegistryGitOps(Protocol):
     def reset_hard(self, repo_dir: Path, ref: str) -> None: ...
     def checkout(self, repo_dir: Path, ref: str, *, force: bool = False) -> None: ...
     def checkout_new_branch(self, repo_dir: Path, branch: str) -> None: ...
-    def commit_all(self, repo_dir: Path, message: str) -> None: ...
+    def commit_all(
+        self, repo_dir: Path, message: str, *, paths: list[str] | None = None,
+    ) -> None: ...
     def push_branch(self, repo_dir: Path, branch: str) -> None: ...
     def tag(self, work_dir: Path, name: str, message: str) -> None: ...
     def is_working_tree_clean(self, work_dir: Path) -> bool: ...
@@ -117,6 +121,70 @@ class RegistryGitOps(Protocol):
 # ---------------------------------------------------------------------------
 
 
+def _gh_env() -> dict[str, str]:
+    """Environment for non-interactive ``gh`` calls.
+
+    ``GH_NO_UPDATE_NOTIFIER`` skips gh's release check, an extra GitHub API
+    round-trip gh makes alongside the real request. ``GH_PROMPT_DISABLED``
+    makes gh fail fast instead of blocking on a prompt nobody can answer
+    (stdin/stdout are captured) until the timeout fires.
+    """
+    return {**os.environ, "GH_NO_UPDATE_NOTIFIER": "1", "GH_PROMPT_DISABLED": "1"}
+
+
+def _ssh_mux_dir() -> Path:
+    # Resolved per call, not at import, like the other $HOME-derived paths.
+    return Path.home() / ".cache" / "mintd" / "ssh"
+
+
+def _configured_ssh_command() -> str | None:
+    """The user's ``core.sshCommand`` (global/system git config), if set.
+
+    ``GIT_SSH_COMMAND`` takes precedence over it, so overriding the variable
+    would silently drop e.g. an ``-i ~/.ssh/lab_key`` identity."""
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get", "core.sshCommand"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def _git_network_env() -> dict[str, str] | None:
+    """Environment for ``git`` commands that talk to the remote (clone,
+    fetch, push).
+
+    A register/update run does fetch → push back to back, and every one of
+    them otherwise pays a fresh SSH handshake + auth. ``ControlMaster=auto``
+    with a short ``ControlPersist`` lets the later commands reuse the first
+    one's connection. Returns ``None`` (inherit the environment) when the
+    user already configured ``GIT_SSH_COMMAND`` / ``GIT_SSH`` /
+    ``core.sshCommand`` or on Windows, whose OpenSSH has no multiplexing.
+    HTTPS remotes ignore the variable.
+    """
+    if os.name == "nt" or "GIT_SSH_COMMAND" in os.environ or "GIT_SSH" in os.environ:
+        return None
+    if _configured_ssh_command() is not None:
+        return None
+    mux_dir = _ssh_mux_dir()
+    try:
+        mux_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return None
+    # git runs GIT_SSH_COMMAND through the shell: quote the path so a home
+    # directory with spaces stays one argument.
+    ssh = (
+        "ssh -o ControlMaster=auto"
+        f" -o ControlPath={shlex.quote(f'{mux_dir}/%C')}"
+        " -o ControlPersist=60s"
+    )
+    return {**os.environ, "GIT_SSH_COMMAND": ssh}
+
+
 class SubprocessRegistryGitOps:
     """Production: shells out to `git` and `gh`.
 
@@ -133,6 +201,20 @@ class SubprocessRegistryGitOps:
     ) -> None:
         self._timeouts = timeouts
         self._reporter = reporter
+        # Built on first use and reused by every later command this instance
+        # runs: a register/update is fetch -> commit -> push -> gh, and
+        # rebuilding the environment copy (plus the ssh mux-dir mkdir) per
+        # process bought nothing. One instance lives for one CLI command.
+        self._network_env: dict[str, str] | None = None
+        self._network_env_resolved = False
+        self._gh_env: dict[str, str] | None = None
+
+    def _remote_env(self) -> dict[str, str] | None:
+        """``_git_network_env()``, resolved once per instance."""
+        if not self._network_env_resolved:
+            self._network_env = _git_network_env()
+            self._network_env_resolved = True
+        return self._network_env
 
     @property
     def _fast_timeout(self) -> float | None:
@@ -163,10 +245,17 @@ class SubprocessRegistryGitOps:
             "git",
             "-c", "http.lowSpeedLimit=1000",
             "-c", "http.lowSpeedTime=300",
-            "clone", "--progress",
+            "clone",
         ]
+        # git only reports progress to a pipe when asked; ask only when the
+        # reporter has a live spinner to show it on. Off a TTY the ticks
+        # would be streamed through and thrown away.
+        if self._reporter is not None and self._reporter.shows_live_progress:
+            argv.append("--progress")
         if shallow:
-            argv.append("--depth=1")
+            # --depth implies --single-branch; spell it out so a later
+            # ``fetch`` stays on the one branch the registry cache reads.
+            argv.extend(["--depth=1", "--single-branch"])
         if branch:
             argv.extend(["--branch", branch])
         argv.extend([url, str(dest)])
@@ -179,6 +268,7 @@ class SubprocessRegistryGitOps:
         try:
             r = run_streaming(
                 argv,
+                env=self._remote_env(),
                 wall_timeout=wall_timeout,
                 reporter=self._reporter,
             )
@@ -188,7 +278,11 @@ class SubprocessRegistryGitOps:
             raise GitOpError(argv, "".join(r.stderr_lines) or "")
 
     def fetch(self, repo_dir: Path) -> None:
-        self._git(["fetch", "origin"], cwd=repo_dir)
+        # ``--depth=1`` keeps the registry cache as shallow as the clone
+        # that created it: each refresh transfers only the new tip of the
+        # single tracked branch, never the accumulated history. Callers
+        # only ever ``reset --hard origin/main`` after fetching.
+        self._git(["fetch", "--depth=1", "origin"], cwd=repo_dir, env=self._remote_env())
 
     def reset_hard(self, repo_dir: Path, ref: str) -> None:
         self._git(["reset", "--hard", ref], cwd=repo_dir)
@@ -207,12 +301,17 @@ class SubprocessRegistryGitOps:
         # origin/main baseline.
         self._git(["checkout", "-B", branch], cwd=repo_dir)
 
-    def commit_all(self, repo_dir: Path, message: str) -> None:
-        self._git(["add", "-A"], cwd=repo_dir)
+    def commit_all(
+        self, repo_dir: Path, message: str, *, paths: list[str] | None = None,
+    ) -> None:
+        # ``paths`` narrows staging to the files the caller wrote, so git
+        # doesn't rescan the whole worktree and untracked scratch (e.g. the
+        # registry cache's .mintd_pending.json) never rides along.
+        self._git(["add", "--", *paths] if paths else ["add", "-A"], cwd=repo_dir)
         self._git(["commit", "-m", message], cwd=repo_dir)
 
     def push_branch(self, repo_dir: Path, branch: str) -> None:
-        self._git(["push", "-u", "origin", branch], cwd=repo_dir)
+        self._git(["push", "-u", "origin", branch], cwd=repo_dir, env=self._remote_env())
 
     def tag(self, work_dir: Path, name: str, message: str) -> None:
         try:
@@ -273,12 +372,15 @@ class SubprocessRegistryGitOps:
     # Helpers
     # ------------------------------------------------------------------
 
-    def _git(self, args: list[str], *, cwd: Path | None) -> str:
+    def _git(
+        self, args: list[str], *, cwd: Path | None, env: dict[str, str] | None = None,
+    ) -> str:
         cmd = ["git", *args]
         try:
             result = subprocess.run(
                 cmd,
                 cwd=str(cwd) if cwd else None,
+                env=env,
                 capture_output=True,
                 text=True,
                 timeout=self._fast_timeout,
@@ -292,10 +394,13 @@ class SubprocessRegistryGitOps:
 
     def _gh(self, args: list[str], *, cwd: Path) -> str:
         cmd = ["gh", *args]
+        if self._gh_env is None:
+            self._gh_env = _gh_env()
         try:
             result = subprocess.run(
                 cmd,
                 cwd=str(cwd),
+                env=self._gh_env,
                 capture_output=True,
                 text=True,
                 timeout=self._fast_timeout,
@@ -305,9 +410,11 @@ class SubprocessRegistryGitOps:
             raise GhNotInstalled(str(e)) from e
         except subprocess.CalledProcessError as e:
             stderr = (e.stderr or "") + (e.stdout or "")
-            if "not authenticated" in stderr.lower() or "authentication" in stderr.lower():
+            # Lowercased once for all the probes below.
+            lowered = stderr.lower()
+            if "not authenticated" in lowered or "authentication" in lowered:
                 raise GhAuthError(stderr) from e
-            if "already exists" in stderr.lower():
+            if "already exists" in lowered:
                 raise PRConflictError(branch="(unknown)") from e
             raise GitOpError(cmd, stderr)
         return result.stdout
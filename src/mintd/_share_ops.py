@@ -25,6 +25,7 @@ and raise ``ShareError(msg, hint)``.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import time
 from dataclasses import dataclass, field
@@ -71,32 +72,36 @@ except ImportError:  # boto3 absent — inert placeholder; the except clause nev
     class FlexibleChecksumError(Exception):  # type: ignore[no-redef]
         """Placeholder when botocore is absent (mirrors _fast_sync_ops:37-48)."""
 
-# boto3's high-level ``upload_file`` catches every botocore ``ClientError`` from
-# the transfer and re-raises it wrapped in ``S3UploadFailedError`` (which is NOT
-# a ``ClientError``; boto3/s3/transfer.py:456-459). We import it via the same
-# guarded pattern as the botocore sentinels above so ``upload_object`` can unwrap
-# it back to the underlying ``ClientError`` — otherwise real upload failures
-# (bad bucket, AccessDenied, SlowDown) would escape unmapped and un-retried.
-try:
-    from boto3.exceptions import S3UploadFailedError
-except ImportError:  # boto3 absent — inert placeholder; the except clause never fires
-
-    class S3UploadFailedError(Exception):  # type: ignore[no-redef]
-        """Placeholder when boto3 is absent (mirrors _fast_sync_ops:37-48)."""
-
-
-# s3transfer's download runs its OWN retry loop over the response-body stream
-# and, once exhausted, boto3 re-raises boto3.exceptions.RetriesExceededError
-# (a Boto3Error carrying .last_exception — NOT a ClientError/BotoCoreError, so
-# neither is_transient_s3_error nor the network tuple sees it). Without this it
-# would escape as a raw traceback on a real large-file download whose stream
-# read-times-out mid-transfer.
-try:
-    from boto3.exceptions import RetriesExceededError
-except ImportError:  # boto3 absent — inert placeholder; the except clause never fires
+class _Boto3Absent(Exception):
+    """Placeholder when boto3 is absent (mirrors _fast_sync_ops:37-48)."""
+
+
+@functools.lru_cache(maxsize=1)
+def _boto3_transfer_errors() -> tuple[type[BaseException], type[BaseException]]:
+    """``(S3UploadFailedError, RetriesExceededError)`` from ``boto3.exceptions``.
+
+    boto3's high-level ``upload_file`` catches every botocore ``ClientError``
+    from the transfer and re-raises it wrapped in ``S3UploadFailedError``
+    (which is NOT a ``ClientError``; boto3/s3/transfer.py:456-459) —
+    ``upload_object`` unwraps it back to the underlying ``ClientError`` so
+    real upload failures (bad bucket, AccessDenied, SlowDown) are mapped and
+    retried. s3transfer's download runs its OWN retry loop over the
+    response-body stream and, once exhausted, boto3 re-raises
+    ``RetriesExceededError`` (a Boto3Error carrying ``.last_exception`` — NOT
+    a ClientError/BotoCoreError); without a clause for it a read-timeout
+    mid-transfer would escape as a raw traceback.
+
+    Importing ``boto3.exceptions`` imports the whole boto3 package, so it is
+    resolved on the first transfer, not at ``import mintd.cli``. When boto3
+    is absent both slots hold an inert placeholder whose except clauses
+    never fire.
+    """
+    try:
+        from boto3.exceptions import RetriesExceededError, S3UploadFailedError
+    except ImportError:
+        return _Boto3Absent, _Boto3Absent
+    return S3UploadFailedError, RetriesExceededError
 
-    class RetriesExceededError(Exception):  # type: ignore[no-redef]
-        """Placeholder when boto3 is absent (mirrors _fast_sync_ops:37-48)."""
 
 if TYPE_CHECKING:
     from mintd._config import Config
@@ -155,12 +160,12 @@ def _map_transport_error(exc: BaseException, key: str) -> TransferError:
     house 'no traceback on documented paths' norm). One helper, used by all
     three transport functions, so the mapping cannot drift between them.
 
-    Called only with the error families in ``_MAPPED_TRANSPORT_ERRORS`` — a
+    Called only with the error families in ``_mapped_transport_errors()`` — a
     ``verify_tmp`` policy failure (unless it is itself a ``TransferError``) and
     any genuinely-unexpected exception are deliberately NOT caught at the call
     sites, so they propagate verbatim (R2: the policy layer owns its error; a
     real bug should surface loudly, not be masked as 'transfer failed')."""
-    if isinstance(exc, RetriesExceededError):
+    if isinstance(exc, _boto3_transfer_errors()[1]):
         # s3transfer exhausted its own stream-retry loop. Unwrap to the real
         # cause so a network/credentials/client exhaustion gets its precise
         # hint; fall back to a generic transfer error otherwise.
@@ -189,17 +194,19 @@ def _map_transport_error(exc: BaseException, key: str) -> TransferError:
     )
 
 
-# The transport-error families the three functions map to a hinted
-# TransferError. NOT caught (propagate verbatim): a verify_tmp policy error
-# that is not a TransferError, and any unexpected exception (a real bug).
-_MAPPED_TRANSPORT_ERRORS: tuple[type[BaseException], ...] = (
-    TransferError,
-    NoCredentialsError,
-    ClientError,
-    FlexibleChecksumError,
-    RetriesExceededError,
-    *_TRANSFER_NETWORK_ERRORS,
-)
+@functools.lru_cache(maxsize=1)
+def _mapped_transport_errors() -> tuple[type[BaseException], ...]:
+    """The transport-error families the three functions map to a hinted
+    TransferError. NOT caught (propagate verbatim): a verify_tmp policy error
+    that is not a TransferError, and any unexpected exception (a real bug)."""
+    return (
+        TransferError,
+        NoCredentialsError,
+        ClientError,
+        FlexibleChecksumError,
+        _boto3_transfer_errors()[1],
+        *_TRANSFER_NETWORK_ERRORS,
+    )
 
 
 def _map_client_error(exc: Any, key: str) -> TransferError:
@@ -239,7 +246,7 @@ def head_remote_object(s3: Any, bucket: str, key: str) -> RemoteObjectInfo:
         resp = retry_transient(
             lambda: s3.head_object(Bucket=bucket, Key=key, ChecksumMode="ENABLED")
         )
-    except _MAPPED_TRANSPORT_ERRORS as exc:
+    except _mapped_transport_errors() as exc:
         raise _map_transport_error(exc, key) from exc
     return RemoteObjectInfo(
         size=int(resp["ContentLength"]),
@@ -280,7 +287,7 @@ def upload_object(
             s3.upload_file(
                 str(local_path), bucket, key, ExtraArgs=merged, Callback=progress
             )
-        except S3UploadFailedError as exc:
+        except _boto3_transfer_errors()[0] as exc:
             # boto3 wraps every transfer-time ClientError in S3UploadFailedError
             # (not a ClientError; boto3/s3/transfer.py:456-459). Unwrap the
             # underlying ClientError — set as __context__ by boto3's bare
@@ -294,7 +301,7 @@ def upload_object(
 
     try:
         retry_transient(_attempt)
-    except _MAPPED_TRANSPORT_ERRORS as exc:
+    except _mapped_transport_errors() as exc:
         raise _map_transport_error(exc, key) from exc
     # Prefer the pre-transfer size (share_put already stat()'d and the caller
     # passes it) is not available here, so re-stat defensively: a file that
@@ -388,19 +395,19 @@ def download_object(
 
     try:
         retry_transient(_attempt)
-    except _MAPPED_TRANSPORT_ERRORS as exc:
+    except _mapped_transport_errors() as exc:
         raise _map_transport_error(exc, key) from exc
     return dest.stat().st_size
 
 
 def file_sha256(path: Path) -> str:
-    """Chunked ``hashlib.sha256`` hex digest of ``path`` (R1 — cache's
-    skip-compare + ``x-amz-meta-mintd-sha256`` source; S1 uses it in tests)."""
-    h = hashlib.sha256()
+    """Streaming ``hashlib.sha256`` hex digest of ``path`` (R1 — cache's
+    skip-compare + ``x-amz-meta-mintd-sha256`` source; S1 uses it in tests).
+
+    ``hashlib.file_digest`` reads into one reused buffer instead of
+    allocating a fresh bytes object per chunk."""
     with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(fh, "sha256").hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -197,7 +197,7 @@ def compute_storage_prefix(
     if classification == "licensed":
         if not slug:
             raise ValueError("classification 'licensed' requires a slug")
-        if not SLUG_REGEX.match(slug):
+        if not SLUG_REGEX.fullmatch(slug):
             raise ValueError(
                 f"licensed slug {slug!r} must match {SLUG_REGEX.pattern}"
             )
@@ -218,7 +218,7 @@ def _read_metadata_storage(
     if not metadata_path.is_file():
         return None, None, None, False
     try:
-        data = json.loads(metadata_path.read_text(encoding="utf-8"))
+        data = json.loads(metadata_path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return None, None, None, False
     storage = data.get("storage")
@@ -8,17 +8,26 @@ list of written paths so the CLI can render `created:` lines.
 
 from __future__ import annotations
 
+import functools
 import getpass
 import importlib.metadata
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from importlib.resources import files as _files
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from .engine import render_template
 from .scaffolds import dispatch
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .._config import Config
+
+
 _NAME_RE = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_-]*$")
 
 # Static files that should be copied as-is rather than Jinja-rendered.
@@ -40,28 +49,34 @@ class InitNameInvalid(Exception):
 
 def validate_project_name(name: str) -> None:
     """Raise ``InitNameInvalid`` if ``name`` isn't a safe filesystem segment."""
-    if not _NAME_RE.match(name):
+    if not _NAME_RE.fullmatch(name):
         raise InitNameInvalid(
             f"invalid project name {name!r}; must match {_NAME_RE.pattern}"
         )
 
 
-_TYPE_PREFIX = {"project": "prj"}
+# Full-name prefix per project type, separator included. ``code`` is bare:
+# the ``code`` fact is carried by the ``project.type`` field in metadata,
+# making a redundant ``code_`` prefix unnecessary.
+_TYPE_PREFIX = {
+    "data": "data_",
+    "project": "prj_",
+    "code": "",
+    "enclave": "enclave_",
+}
 
 
 def project_full_name(project_type: str, name: str) -> str:
     """Compute the full project identifier (e.g. ``data_foo``).
 
-    For ``code`` projects, this is the bare ``name``. For all others, it
-    uses the ``{prefix}_{name}`` naming convention, where ``prefix`` is the
-    project type unless overridden in ``_TYPE_PREFIX`` (e.g. ``project`` ->
-    ``prj``). The ``code`` fact is carried by the ``project.type`` field in
-    metadata, making redundant ``code_`` prefixes unnecessary.
+    Looks the prefix up in ``_TYPE_PREFIX`` (``project`` -> ``prj_``,
+    ``code`` -> bare ``name``). A type missing from the table falls back
+    to the ``{project_type}_{name}`` convention.
     """
-    if project_type == "code":
-        return name
-    prefix = _TYPE_PREFIX.get(project_type, project_type)
-    return f"{prefix}_{name}"
+    prefix = _TYPE_PREFIX.get(project_type)
+    if prefix is None:
+        prefix = f"{project_type}_"
+    return prefix + name
 
 
 def _get_mint_hash() -> str:
@@ -76,6 +91,19 @@ def _get_mint_hash() -> str:
     return "unknown"
 
 
+@functools.lru_cache(maxsize=1)
+def _mint_version() -> str:
+    """Installed mintd version for the ``mint_version`` context key.
+
+    ``importlib.metadata.version`` walks ``sys.path`` dist-info on every
+    call; the answer can't change inside one process, so resolve it once.
+    """
+    try:
+        return importlib.metadata.version("mintd")
+    except importlib.metadata.PackageNotFoundError:
+        return "0.0.0"
+
+
 def _current_user() -> str:
     """Best-effort user lookup. Falls back to ``"unknown"`` when no USER/
     LOGNAME env var is set and the UID has no passwd entry (CI, distroless)."""
@@ -85,14 +113,25 @@ def _current_user() -> str:
         return "unknown"
 
 
-def _detect_platform_os() -> str:
+@dataclass(frozen=True)
+class _PlatformInfo:
+    """Host facts the templates branch on: OS name and shell command joiner."""
+
+    os: str
+    command_sep: str
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_platform() -> _PlatformInfo:
+    """Host platform as the templates name it. Probed once per process — the
+    answer can't change underneath a running CLI — and shared frozen."""
     import platform as _platform
     system = _platform.system().lower()
     if system == "darwin":
-        return "macos"
+        return _PlatformInfo(os="macos", command_sep="&&")
     if system == "windows":
-        return "windows"
-    return "linux"
+        return _PlatformInfo(os="windows", command_sep="&")
+    return _PlatformInfo(os="linux", command_sep="&&")
 
 
 def _build_context(
@@ -101,20 +140,22 @@ def _build_context(
     name: str,
     language: str,
     source_dir: str = "code",
+    config: "Config | None" = None,
+    overrides: dict[str, object] | None = None,
 ) -> dict[str, object]:
-    try:
-        version = importlib.metadata.version("mintd")
-    except importlib.metadata.PackageNotFoundError:
-        version = "0.0.0"
-    # Load the user's config lazily; slice 21 lets users seed these fields
-    # via `mintd config setup`. Absent fields fall back to safe defaults
-    # — empty strings for cosmetic vars, sensible literals for the rest.
-    # See `notes/V1-PORT-AUDIT.md` for the legacy→v2 mapping.
-    try:
-        from .._config import Config
-        cfg = Config.load()
-    except Exception:
-        cfg = None
+    version = _mint_version()
+    # Slice 21 lets users seed these fields via `mintd config setup`.
+    # Absent fields fall back to safe defaults — empty strings for cosmetic
+    # vars, sensible literals for the rest. See `notes/V1-PORT-AUDIT.md`
+    # for the legacy→v2 mapping. Callers that already hold the config
+    # (`mintd init`) pass it in; otherwise load it lazily here.
+    cfg = config
+    if cfg is None:
+        try:
+            from .._config import Config
+            cfg = Config.load()
+        except Exception:
+            cfg = None
 
     def _cfg(name: str, default: object) -> object:
         if cfg is None:
@@ -122,13 +163,15 @@ def _build_context(
         value = getattr(cfg, name, None)
         return default if value is None else value
 
-    platform_os = _detect_platform_os()
-    command_sep = "&" if platform_os == "windows" else "&&"
+    platform_info = _detect_platform()
+    bucket_prefix = _cfg("storage_bucket_prefix", "")
 
     # Empty-string defaults for every variable the vendored legacy templates
     # reference. Slice-21 absorbs the v1-config fields that users actually
     # set; the rest stay deferred until a downstream slice surfaces a need.
-    # Keys are grouped by source for readability.
+    # Keys are grouped by source for readability. ``overrides`` are spread
+    # last so the whole context is one dict literal — no second
+    # ``.update()`` pass re-hashing keys into a resized table.
     return {
         # Set by slice-19 init flow.
         "project_name": name,
@@ -145,8 +188,8 @@ def _build_context(
 
         # Platform — auto-detected (slice 21). Windows shell scripts not yet
         # vendored — see notes/V1-PORT-AUDIT.md and the windows-followup memory.
-        "platform_os": platform_os,
-        "command_sep": command_sep,
+        "platform_os": platform_info.os,
+        "command_sep": platform_info.command_sep,
         "stata_executable": _cfg("stata_executable", "stata"),
 
         # Absorbed from v1 config in slice 21.
@@ -167,9 +210,9 @@ def _build_context(
         "researcher_team": _cfg("researcher_team", ""),
 
         # Storage fields absorbed in slice 21.
-        "bucket_name": _cfg("storage_bucket_prefix", ""),
+        "bucket_name": bucket_prefix,
         "storage_endpoint": _cfg("storage_endpoint", ""),
-        "storage_prefix": _cfg("storage_bucket_prefix", ""),
+        "storage_prefix": bucket_prefix,
         "storage_provider": "s3",
         "storage_versioning": True,
         "dvc_remote_name": "origin",
@@ -182,6 +225,8 @@ def _build_context(
 
         # Deferred (pipeline definition / catalog imports).
         "data_products_primary": "",
+
+        **(overrides or {}),
     }
 
 
@@ -253,15 +298,42 @@ def _render_metadata_json(context: dict[str, object]) -> str:
     )
 
 
+def _scaffold_dirs(
+    dirs: Iterable[str], files: Iterable[tuple[str, str]]
+) -> list[str]:
+    """Every directory the scaffold needs — declared dirs, file parents, and
+    all their ancestors — deduplicated and ordered shallowest first.
+
+    Walking this list with a plain ``mkdir(exist_ok=True)`` creates each
+    directory exactly once: no ``parents=True`` re-walk per entry and no
+    per-file parent mkdir in ``_write_file``.
+    """
+    needed: set[Path] = set()
+    for rel_dir in dirs:
+        needed.add(Path(rel_dir))
+    for rel_path, _template in files:
+        needed.add(Path(rel_path).parent)
+    for rel in list(needed):
+        needed.update(rel.parents)
+    needed.discard(Path("."))
+    return [p.as_posix() for p in sorted(needed, key=lambda p: (len(p.parts), p))]
+
+
+@functools.lru_cache(maxsize=None)
+def _static_file_bytes(template_name: str) -> bytes:
+    """Contents of a packaged static scaffold file.
+
+    Uses importlib.resources for installed-package safety. The package
+    data can't change inside one process, so the resource lookup + read
+    happens once per file, not once per scaffold that copies it.
+    """
+    return (_files("mintd") / "files" / template_name).read_bytes()
+
+
 def _write_file(out_path: Path, template_name: str, context: dict[str, object]) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
     if template_name in _STATIC_FILES:
-        # Copy verbatim. Use importlib.resources for installed-package safety.
-        from importlib.resources import files as _files
-        out_path.write_text(
-            (_files("mintd") / "files" / template_name).read_text(encoding="utf-8"),
-            encoding="utf-8",
-        )
+        # Copy verbatim. Bytes in, bytes out: no decode/re-encode.
+        out_path.write_bytes(_static_file_bytes(template_name))
         return
     if template_name in _METADATA_TEMPLATES:
         out_path.write_text(_render_metadata_json(context), encoding="utf-8")
@@ -276,24 +348,30 @@ def render_scaffold(
     language: Literal["python", "r", "stata"],
     target_dir: Path,
     context_overrides: dict[str, object] | None = None,
+    config: "Config | None" = None,
 ) -> list[Path]:
     """Render the full scaffold for a typed project into ``target_dir``.
 
     Caller is responsible for ensuring ``target_dir`` exists. ``name`` is
     validated; raises ``InitNameInvalid`` on a bad name. Returns the list
     of files written (in scaffold order), so the CLI can print one
-    ``created:`` line per file.
+    ``created:`` line per file. ``config`` is the already-loaded user
+    config, if the caller has one; ``None`` loads it from disk.
     """
     validate_project_name(name)
-    context = _build_context(project_type=project_type, name=name, language=language)
-    if context_overrides:
-        context.update(context_overrides)
+    context = _build_context(
+        project_type=project_type,
+        name=name,
+        language=language,
+        config=config,
+        overrides=context_overrides,
+    )
 
     full_name = project_full_name(project_type, name)
     dirs, files = dispatch(project_type)(language, name, full_name)
 
-    for rel_dir in dirs:
-        (target_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+    for rel_dir in _scaffold_dirs(dirs, files):
+        (target_dir / rel_dir).mkdir(exist_ok=True)
 
     written: list[Path] = []
     for rel_path, template_name in files:
@@ -4,23 +4,78 @@
 rather than silently producing empty strings — cheap insurance against
 slice-19's binding-question risk (legacy templates referencing keys we
 don't pass).
+
+The environment is built on first render and then reused, so each
+template is parsed and compiled once per process. Building it lazily
+keeps the jinja2 import off CLI startup: ``mintd._templates`` is imported
+by every command (``data`` needs ``project_full_name``) but only
+``mintd init`` renders anything. ``auto_reload=False`` drops the
+per-``get_template`` mtime check: the templates ship inside the installed
+package and never change underneath a running CLI.
+
+Compiled templates are also kept across processes in a Jinja bytecode
+cache under ``~/.cache/mintd/jinja``, so a fresh ``mintd init`` loads
+code objects instead of re-parsing every ``.j2`` it renders. Jinja
+checksums the template source on load, so an upgraded template simply
+recompiles. The cache is best-effort: an unwritable directory means
+compiling in memory, never a failed render.
 """
 
 from __future__ import annotations
 
-from jinja2 import Environment, PackageLoader, StrictUndefined
+import functools
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+    from jinja2.bccache import BytecodeCache
+
+logger = logging.getLogger(__name__)
+
+
+def _bytecode_cache_dir() -> Path:
+    return Path.home() / ".cache" / "mintd" / "jinja"
+
+
+def _bytecode_cache() -> "BytecodeCache | None":
+    """A filesystem bytecode cache, or None when the directory can't be
+    created. Write failures after that are logged and dropped."""
+    from jinja2 import FileSystemBytecodeCache
+
+    class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+        def dump_bytecode(self, bucket) -> None:
+            try:
+                super().dump_bytecode(bucket)
+            except OSError as e:
+                logger.debug("jinja bytecode cache write failed for %s: %s", bucket.key, e)
+
+    directory = _bytecode_cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug("jinja bytecode cache disabled: %s", e)
+        return None
+    return _BestEffortBytecodeCache(str(directory))
+
 
+@functools.lru_cache(maxsize=1)
+def _get_env() -> "Environment":
+    from jinja2 import Environment, PackageLoader, StrictUndefined
 
-_env = Environment(
-    loader=PackageLoader("mintd", "files"),
-    trim_blocks=True,
-    lstrip_blocks=True,
-    undefined=StrictUndefined,
-    keep_trailing_newline=True,
-    autoescape=False,
-)
+    return Environment(
+        loader=PackageLoader("mintd", "files"),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        undefined=StrictUndefined,
+        keep_trailing_newline=True,
+        autoescape=False,
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache(),
+    )
 
 
 def render_template(template_name: str, context: dict[str, object]) -> str:
     """Render ``template_name`` (e.g., ``"README_data.md.j2"``) with ``context``."""
-    return _env.get_template(template_name).render(**context)
+    return _get_env().get_template(template_name).render(**context)
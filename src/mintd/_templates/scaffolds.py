@@ -1,8 +1,9 @@
 """Per-project-type scaffold definitions.
 
 Each function returns ``(dirs_to_create, files_to_render)`` where
-``files_to_render`` is a list of ``(target_rel_path, template_name)``
-tuples consumed by ``_render.render_scaffold``.
+``files_to_render`` is a tuple of ``(target_rel_path, template_name)``
+pairs consumed by ``_render.render_scaffold``. Both halves are shared,
+immutable tables — callers iterate them and must copy before mutating.
 
 Ports legacy ``mintd/src/mintd/templates/{data,project,code,enclave}.py``
 verbatim in shape — same dir layouts, same template names. Files marked
@@ -17,83 +18,143 @@ branch on language in legacy and don't here either.
 
 from __future__ import annotations
 
+import functools
+
 from .languages import get_language_config
 
 
-def _common_data_dirs(source_dir: str) -> list[str]:
-    return [
-        "data/raw",
-        "data/intermediate",
-        "data/final",
-        "schemas/v1",
-        "scripts",
-        source_dir,
-    ]
-
-
-def _common_data_files() -> list[tuple[str, str]]:
-    return [
-        ("README.md", "README_data.md.j2"),
-        ("metadata.json", "metadata.json.j2"),
-        (".gitignore", "gitignore.txt"),
-        (".dvcignore", "dvcignore.txt"),
-        (".pre-commit-config.yaml", "pre-commit-config.yaml.j2"),
-        ("scripts/check-dvc-sync.sh", "check-dvc-sync.sh.j2"),
-        ("scripts/check-env-lockfiles.sh", "check-env-lockfiles.sh.j2"),
-        ("dvc_vars.yaml", "dvc_vars.yaml.j2"),
-        ("dvc.yaml", "dvc_data.yaml.j2"),
-    ]
-
-
-def scaffold_data(language: str, name: str, full_name: str, source_dir: str = "code") -> tuple[list[str], list[tuple[str, str]]]:
+# Everything that doesn't depend on ``language`` / ``source_dir`` is built
+# once at import as tuples; the parts that do are assembled once per
+# distinct argument by the cached helpers below.
+
+_COMMON_DATA_DIRS: tuple[str, ...] = (
+    "data/raw",
+    "data/intermediate",
+    "data/final",
+    "schemas/v1",
+    "scripts",
+)
+
+_COMMON_DATA_FILES: tuple[tuple[str, str], ...] = (
+    ("README.md", "README_data.md.j2"),
+    ("metadata.json", "metadata.json.j2"),
+    (".gitignore", "gitignore.txt"),
+    (".dvcignore", "dvcignore.txt"),
+    (".pre-commit-config.yaml", "pre-commit-config.yaml.j2"),
+    ("scripts/check-dvc-sync.sh", "check-dvc-sync.sh.j2"),
+    ("scripts/check-env-lockfiles.sh", "check-env-lockfiles.sh.j2"),
+    ("dvc_vars.yaml", "dvc_vars.yaml.j2"),
+    ("dvc.yaml", "dvc_data.yaml.j2"),
+)
+
+_COMMON_PROJECT_DIRS: tuple[str, ...] = (
+    "data/raw",
+    "data/analysis",
+    "data/enclave-out",
+)
+
+# Created under ``source_dir``.
+_PROJECT_SOURCE_SUBDIRS: tuple[str, ...] = (
+    "01_data_prep",
+    "02_analysis",
+    "03_tables",
+    "04_figures",
+)
+
+_PROJECT_TAIL_DIRS: tuple[str, ...] = (
+    "notebooks",
+    "results/figures",
+    "results/tables",
+    "results/estimates",
+    "results/presentations",
+    "docs",
+    "references",
+    "tests",
+    "scripts",
+)
+
+_COMMON_PROJECT_FILES: tuple[tuple[str, str], ...] = (
+    ("README.md", "README_project.md.j2"),
+    ("metadata.json", "metadata.json.j2"),
+    ("citations.md", "citations.md.j2"),
+    (".gitignore", "gitignore.txt"),
+    (".dvcignore", "dvcignore.txt"),
+    (".pre-commit-config.yaml", "pre-commit-config.yaml.j2"),
+    ("scripts/check-dvc-sync.sh", "check-dvc-sync.sh.j2"),
+    ("scripts/check-env-lockfiles.sh", "check-env-lockfiles.sh.j2"),
+)
+
+_CODE_FILES: tuple[tuple[str, str], ...] = (
+    ("metadata.json", "metadata_code.json.j2"),
+)
+
+_ENCLAVE_DIRS: tuple[str, ...] = ("data", "src", "scripts", "transfers")
+
+_ENCLAVE_FILES: tuple[tuple[str, str], ...] = (
+    ("README.md", "README_enclave.md.j2"),
+    ("metadata.json", "metadata.json.j2"),
+    ("enclave_manifest.yaml", "enclave_manifest.yaml.j2"),
+    ("requirements.txt", "requirements_enclave.txt.j2"),
+    ("enclave_cli.py", "enclave_cli.py.j2"),
+    (".gitignore", "gitignore.txt"),
+    (".dvcignore", "dvcignore.txt"),
+    ("src/__init__.py", "__init__.py.j2"),
+    ("src/registry.py", "registry.py.j2"),
+    ("src/download.py", "download.py.j2"),
+    ("src/transfer.py", "transfer.py.j2"),
+    ("scripts/pull_data.sh", "pull_data.sh.j2"),
+    ("scripts/package_transfer.sh", "package_transfer.sh.j2"),
+    ("scripts/unpack_transfer.sh", "unpack_transfer.sh.j2"),
+    ("scripts/verify_transfer.sh", "verify_transfer.sh.j2"),
+)
+
+
+_COMMON_FILES_BY_KIND: dict[str, tuple[tuple[str, str], ...]] = {
+    "data": _COMMON_DATA_FILES,
+    "project": _COMMON_PROJECT_FILES,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _file_table(kind: str, language: str, source_dir: str) -> tuple[tuple[str, str], ...]:
+    """Common + language-specific files for a data/project scaffold.
+
+    Pure in its arguments, so each ``(kind, language, source_dir)`` is
+    assembled once per process — the language entries' ``source_dir``
+    lambdas run once, not per scaffold. Raises ``ValueError`` (uncached)
+    on an unknown language.
+    """
+    lang_files = get_language_config(language)[f"{kind}_files"](source_dir)
+    return _COMMON_FILES_BY_KIND[kind] + tuple(lang_files)
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_table(kind: str, source_dir: str) -> tuple[str, ...]:
+    """Directory list for a data/project scaffold, built once per
+    ``(kind, source_dir)``."""
+    if kind == "data":
+        return (*_COMMON_DATA_DIRS, source_dir)
+    return (
+        *_COMMON_PROJECT_DIRS,
+        *(f"{source_dir}/{sub}" for sub in _PROJECT_SOURCE_SUBDIRS),
+        *_PROJECT_TAIL_DIRS,
+    )
+
+
+_Scaffold = tuple[tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+def scaffold_data(language: str, name: str, full_name: str, source_dir: str = "code") -> _Scaffold:
     del name, full_name  # accepted for symmetry; templates pull these from context
-    lang_cfg = get_language_config(language)
-    files = _common_data_files() + lang_cfg["data_files"](source_dir)
-    return _common_data_dirs(source_dir), files
-
-
-def _common_project_dirs(source_dir: str) -> list[str]:
-    return [
-        "data/raw",
-        "data/analysis",
-        "data/enclave-out",
-        f"{source_dir}/01_data_prep",
-        f"{source_dir}/02_analysis",
-        f"{source_dir}/03_tables",
-        f"{source_dir}/04_figures",
-        "notebooks",
-        "results/figures",
-        "results/tables",
-        "results/estimates",
-        "results/presentations",
-        "docs",
-        "references",
-        "tests",
-        "scripts",
-    ]
-
-
-def _common_project_files() -> list[tuple[str, str]]:
-    return [
-        ("README.md", "README_project.md.j2"),
-        ("metadata.json", "metadata.json.j2"),
-        ("citations.md", "citations.md.j2"),
-        (".gitignore", "gitignore.txt"),
-        (".dvcignore", "dvcignore.txt"),
-        (".pre-commit-config.yaml", "pre-commit-config.yaml.j2"),
-        ("scripts/check-dvc-sync.sh", "check-dvc-sync.sh.j2"),
-        ("scripts/check-env-lockfiles.sh", "check-env-lockfiles.sh.j2"),
-    ]
-
-
-def scaffold_project(language: str, name: str, full_name: str, source_dir: str = "code") -> tuple[list[str], list[tuple[str, str]]]:
+    return _dir_table("data", source_dir), _file_table("data", language, source_dir)
+
+
+def scaffold_project(language: str, name: str, full_name: str, source_dir: str = "code") -> _Scaffold:
     del name, full_name
-    lang_cfg = get_language_config(language)
-    files = _common_project_files() + lang_cfg["project_files"](source_dir)
-    return _common_project_dirs(source_dir), files
+    return _dir_table("project", source_dir), _file_table("project", language, source_dir)
 
 
-def scaffold_code(language: str, name: str, full_name: str, source_dir: str = "code") -> tuple[list[str], list[tuple[str, str]]]:
+def scaffold_code(language: str, name: str, full_name: str, source_dir: str = "code") -> _Scaffold:
     """Code repos are metadata-only — no language-specific scaffold.
 
     Slice 19 emits ``metadata.json`` only (no .dvcignore — the legacy
@@ -101,33 +162,13 @@ def scaffold_code(language: str, name: str, full_name: str, source_dir: str = "c
     accepted for signature symmetry but unused.
     """
     del language, name, full_name, source_dir
-    return [], [
-        ("metadata.json", "metadata_code.json.j2"),
-    ]
+    return (), _CODE_FILES
 
 
-def scaffold_enclave(language: str, name: str, full_name: str, source_dir: str = "code") -> tuple[list[str], list[tuple[str, str]]]:
+def scaffold_enclave(language: str, name: str, full_name: str, source_dir: str = "code") -> _Scaffold:
     """Enclave scaffold — language arg ignored (always Python toolchain inside)."""
     del language, name, full_name, source_dir
-    dirs = ["data", "src", "scripts", "transfers"]
-    files = [
-        ("README.md", "README_enclave.md.j2"),
-        ("metadata.json", "metadata.json.j2"),
-        ("enclave_manifest.yaml", "enclave_manifest.yaml.j2"),
-        ("requirements.txt", "requirements_enclave.txt.j2"),
-        ("enclave_cli.py", "enclave_cli.py.j2"),
-        (".gitignore", "gitignore.txt"),
-        (".dvcignore", "dvcignore.txt"),
-        ("src/__init__.py", "__init__.py.j2"),
-        ("src/registry.py", "registry.py.j2"),
-        ("src/download.py", "download.py.j2"),
-        ("src/transfer.py", "transfer.py.j2"),
-        ("scripts/pull_data.sh", "pull_data.sh.j2"),
-        ("scripts/package_transfer.sh", "package_transfer.sh.j2"),
-        ("scripts/unpack_transfer.sh", "unpack_transfer.sh.j2"),
-        ("scripts/verify_transfer.sh", "verify_transfer.sh.j2"),
-    ]
-    return dirs, files
+    return _ENCLAVE_DIRS, _ENCLAVE_FILES
 
 
 _DISPATCH = {
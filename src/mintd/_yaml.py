@@ -0,0 +1,30 @@
+"""libyaml-backed safe YAML load/dump shared by mintd-owned YAML files.
+
+PyYAML ships a C (libyaml) loader/dumper alongside the pure-Python ones,
+but ``yaml.safe_load`` / ``yaml.safe_dump`` always pick the pure-Python
+path. ``safe_load`` / ``safe_dump`` here are drop-in replacements that use
+``CSafeLoader`` / ``CSafeDumper`` when PyYAML was built with libyaml and
+fall back to the pure-Python classes otherwise. Same safe tag set either
+way.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: Any) -> Any:
+    """``yaml.safe_load`` on the C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """``yaml.safe_dump`` on the C dumper when available."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -25,20 +25,23 @@ from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol
 from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ._console import Reporter
     from .model import Metadata
 
 
+# `<org>/<repo>` from an https or scp-style (`git@github.com:`) GitHub URL.
+_GITHUB_REPO_RE = re.compile(r"(?:github\.com[:/])([^/]+)/([^/.]+)(?:\.git)?/?$")
+
+
 def _pr_url(registry_repo_url: str, pr_number: int) -> str | None:
     """Build a github.com PR URL from a registry repo URL + PR number.
 
     Returns None when the registry URL isn't a recognizable GitHub
     repo (e.g. a file:// path in tests, or a self-hosted host).
     """
-    m = re.search(
-        r"(?:github\.com[:/])([^/]+)/([^/.]+)(?:\.git)?/?$",
-        registry_repo_url,
-    )
+    m = _GITHUB_REPO_RE.search(registry_repo_url)
     if not m:
         return None
     org, repo = m.group(1), m.group(2)
@@ -138,8 +141,14 @@ class CatalogEntry(BaseModel):
         return self._nested("repository", "github_url")
 
     def _nested(self, *keys: str) -> str:
-        """Walk the dumped tree by keys; return ''  on any missing/non-str."""
-        cur: Any = self.model_dump()
+        """Walk the entry's fields by keys; return ''  on any missing/non-str.
+
+        Every field is an ``extra`` one, held as the plain validated dict, so
+        the walk reads ``model_extra`` directly instead of dumping (and
+        copying) the whole entry on each property access — ``data list``
+        touches ``name`` / ``description`` several times per row.
+        """
+        cur: Any = self.model_extra
         for k in keys:
             if not isinstance(cur, dict):
                 return ""
@@ -169,6 +178,10 @@ class CatalogClient(Protocol):
     def fetch(self, name: str) -> CatalogEntry: ...
     def list(self, filter: CatalogFilter | None = None) -> list[CatalogEntry]: ...
     def status(self, name: str) -> RegistrationStatus: ...
+    def status_many(self, names: "Iterable[str]") -> dict[str, RegistrationStatus]:
+        """`status` for several names against one refresh of the backing
+        store. Keys follow the input order."""
+        ...
     def sync(self) -> int:
         """Refresh local cache from upstream. Returns the entry count.
 
@@ -223,9 +236,15 @@ class InMemoryCatalogClient:
 
     def status(self, name: str) -> RegistrationStatus:
         """In-memory has no PR lifecycle — either registered or not found."""
-        if name in self._entries:
-            return RegistrationStatus(state="registered")
-        return RegistrationStatus(state="not_found")
+        return self.status_many([name])[name]
+
+    def status_many(self, names: "Iterable[str]") -> dict[str, RegistrationStatus]:
+        return {
+            name: RegistrationStatus(
+                state="registered" if name in self._entries else "not_found"
+            )
+            for name in names
+        }
 
     def sync(self) -> int:
         """No-op for in-memory; returns the current entry count."""
@@ -261,8 +280,9 @@ class GitCatalogClient:
     """Production CatalogClient.
 
     register / update open a branch + PR against the registry repo. fetch /
-    list read from a local clone (`_catalog_cache.py`) that's kept fresh
-    transparently on every read. status() resolves PR-pending entries against
+    list read from a local clone (`_catalog_cache.py`) that's refreshed
+    transparently on the first read and reused for the rest of the client's
+    life, until a write or `sync()` moves it again. status() resolves PR-pending entries against
     a local state file (`pending_registrations.py`) before falling back to
     a `gh pr list` query.
 
@@ -292,20 +312,21 @@ class GitCatalogClient:
             git_ops=self._git_ops,
         )
         self._pending = PendingRegistrations(path=work_dir / self._PENDING_FILE)
+        self._fresh = False
 
     # ------------------------------------------------------------------
     # Reads
     # ------------------------------------------------------------------
 
     def fetch(self, name: str) -> CatalogEntry:
-        self._cache.ensure_fresh()
+        self._ensure_fresh()
         entry = self._cache.read_entry(name)
         if entry is None:
             raise CatalogNotFound(name)
         return entry
 
     def list(self, filter: CatalogFilter | None = None) -> list[CatalogEntry]:
-        self._cache.ensure_fresh()
+        self._ensure_fresh()
         return self._cache.list_entries(filter)
 
     # ------------------------------------------------------------------
@@ -313,13 +334,12 @@ class GitCatalogClient:
     # ------------------------------------------------------------------
 
     def register(self, metadata: "Metadata", *, dry_run: bool = False, reporter: Optional["Reporter"] = None) -> RegisterResult:
-        from ._catalog_serializer import deserialize, serialize
+        from ._catalog_serializer import serialize_entry
 
-        self._cache.ensure_fresh()
+        self._ensure_fresh(force=True)
         name = metadata.project.name
 
-        existing = self._cache.read_entry(name)
-        if existing is not None:
+        if self._cache.has_entry(name):
             raise CatalogAlreadyExists(name)
         if self._pending.find(name) is not None:
             # A PR is already open for this name — fail loudly per slice-3
@@ -329,8 +349,8 @@ class GitCatalogClient:
         if dry_run:
             return RegisterResult(name=name, dry_run=True)
 
-        content = serialize(metadata)
-        entry = deserialize(content)
+        entry = metadata.to_catalog_entry()
+        content = serialize_entry(entry)
         branch = f"register/{name}"
         pr = self._commit_and_pr(
             branch=branch,
@@ -349,17 +369,17 @@ class GitCatalogClient:
         )
 
     def update(self, metadata: "Metadata", *, dry_run: bool = False, reporter: Optional["Reporter"] = None) -> UpdateResult:
-        from ._catalog_serializer import deserialize, serialize
+        from ._catalog_serializer import serialize_entry
 
-        self._cache.ensure_fresh()
+        self._ensure_fresh(force=True)
         name = metadata.project.name
 
         existing = self._cache.read_entry(name)
         if existing is None:
             raise CatalogNotFound(name)
 
-        new_content = serialize(metadata)
-        new_entry = deserialize(new_content)
+        new_entry = metadata.to_catalog_entry()
+        new_content = serialize_entry(new_entry)
 
         changes = _diff_entries(existing, new_entry)
 
@@ -394,23 +414,48 @@ class GitCatalogClient:
     # ------------------------------------------------------------------
 
     def status(self, name: str) -> RegistrationStatus:
-        self._cache.ensure_fresh()
-        if self._cache.read_entry(name) is not None:
-            return RegistrationStatus(state="registered")
-        pending = self._pending.find(name)
-        if pending is not None:
-            return RegistrationStatus(state="pending", pr_number=pending.pr_number)
-        return RegistrationStatus(state="not_found")
+        return self.status_many([name])[name]
+
+    def status_many(self, names: "Iterable[str]") -> dict[str, RegistrationStatus]:
+        """One cache refresh and one pending-file read for all of `names`,
+        instead of a fetch + reset per name."""
+        self._ensure_fresh()
+        registered = self._cache.entry_names()
+        pending = {p.name: p for p in self._pending.all_entries()}
+        results: dict[str, RegistrationStatus] = {}
+        for name in names:
+            if name in registered:
+                results[name] = RegistrationStatus(state="registered")
+            elif name in pending:
+                results[name] = RegistrationStatus(
+                    state="pending", pr_number=pending[name].pr_number
+                )
+            else:
+                results[name] = RegistrationStatus(state="not_found")
+        return results
 
     def sync(self) -> int:
         """Force-refresh the registry cache; returns the entry count."""
-        self._cache.ensure_fresh()
+        self._ensure_fresh(force=True)
         return len(self._cache.list_entries())
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _ensure_fresh(self, *, force: bool = False) -> None:
+        """Refresh the cache at most once per client unless `force`d.
+
+        A command that resolves many entries (``enclave pull``, ``check``
+        over an enclave's approved products) calls ``fetch`` per item; one
+        fetch + reset up front is enough for all of them. Writes always
+        force, so their duplicate/diff checks see the latest ``main``.
+        """
+        if self._fresh and not force:
+            return
+        self._cache.ensure_fresh()
+        self._fresh = True
+
     def _commit_and_pr(
         self,
         *,
@@ -422,13 +467,20 @@ class GitCatalogClient:
         pr_body: str,
         reporter: Optional["Reporter"] = None,
     ) -> int:
+        # The working tree leaves main from here on; the next read must
+        # switch back and reset before trusting what's on disk.
+        self._fresh = False
         self._git_ops.checkout_new_branch(self._work_dir, branch)
         if reporter:
             reporter.update_status("Writing catalog entry...")
-        self._cache.write_entry(entry, content)
+        written = self._cache.write_entry(entry, content)
         if reporter:
             reporter.update_status("Committing to registry...")
-        self._git_ops.commit_all(self._work_dir, commit_message)
+        self._git_ops.commit_all(
+            self._work_dir,
+            commit_message,
+            paths=[written.relative_to(self._work_dir).as_posix()],
+        )
         if reporter:
             reporter.update_status("Pushing to registry...")
         self._git_ops.push_branch(self._work_dir, branch)
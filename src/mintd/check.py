@@ -34,6 +34,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -54,6 +55,11 @@ if TYPE_CHECKING:
 
 ProducerViewFactory = Callable[[str, str], "ProducerView | ProducerError"]
 
+# Upper bound on concurrent producer resolves under ``--upgrades``. Each
+# resolve is a git/HTTP round trip, so a handful of threads hides most of
+# the latency without opening a connection per import on big projects.
+_UPGRADE_RESOLVE_WORKERS = 8
+
 # Project types for which a `data_products.primary` is mandatory. Other types
 # (code/project/enclave) may declare a primary but are not required to — a
 # code/project repo publishes no consumable data product, and an enclave
@@ -106,11 +112,17 @@ def check_project(
     upgrades: bool = False,
     producer_view_factory: ProducerViewFactory | None = None,
     client: CatalogClient | None = None,
+    metadata: Metadata | None = None,
 ) -> list[CheckFinding]:
     """Validate a mintd project at `path` (the project directory).
 
     Returns a list of findings. Empty list means clean.
 
+    `metadata` is the project's already-validated metadata.json, for
+    callers that loaded it themselves (registry register, publish); the
+    producer checks then use it instead of re-reading and re-validating
+    the file.
+
     Slice 1 behavior — producer section only:
       - metadata.json missing → 1 error finding
       - metadata.json malformed JSON → 1 error finding
@@ -120,7 +132,7 @@ def check_project(
     Slice 4 added: imports.yaml validation, pin resolution.
     Slice 6 added: env hygiene (dvc/git/gh), --upgrades network checks.
     """
-    findings = _producer_findings(path)
+    findings = _producer_findings(path, metadata=metadata)
     findings.extend(
         _consumer_findings(
             path,
@@ -137,52 +149,58 @@ def check_project(
 # ---------------------------------------------------------------------------
 
 
-def _producer_findings(project_path: Path) -> list[CheckFinding]:
+def _producer_findings(
+    project_path: Path, *, metadata: Metadata | None = None
+) -> list[CheckFinding]:
     """Producer-section checks: everything derivable from metadata.json alone."""
     from ._storage_state import StorageState, inspect_storage, repair_hint
 
     metadata_path = project_path / "metadata.json"
-
-    if not metadata_path.is_file():
-        return [
-            CheckFinding(
-                severity="error",
-                section="producer",
-                message=f"metadata.json not found at {metadata_path}",
-                kind="metadata_missing",
-            )
-        ]
-
-    raw = metadata_path.read_text(encoding="utf-8")
-
-    try:
-        json.loads(raw)
-    except json.JSONDecodeError as e:
-        return [
-            CheckFinding(
-                severity="error",
-                section="producer",
-                message=f"malformed JSON in metadata.json: {e.msg} (line {e.lineno}, col {e.colno})",
-                kind="metadata_invalid",
-            )
-        ]
-
     findings: list[CheckFinding] = []
-    meta: Metadata | None = None
+    meta: Metadata | None = metadata
 
-    try:
-        meta = Metadata.model_validate_json(raw)
-    except ValidationError as e:
-        findings.extend(
-            CheckFinding(
-                severity="error",
-                section="producer",
-                message=err["msg"],
-                field_path=".".join(str(p) for p in err["loc"]) or None,
-                kind="metadata_invalid",
+    if meta is None:
+        # Read straight away and let a missing file surface as the error —
+        # an is_file() probe first would stat the path twice.
+        try:
+            raw = metadata_path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return [
+                CheckFinding(
+                    severity="error",
+                    section="producer",
+                    message=f"metadata.json not found at {metadata_path}",
+                    kind="metadata_missing",
+                )
+            ]
+
+        # Validate first: the happy path is one pass through pydantic's JSON
+        # parser. Only a failure pays the stdlib parse, whose line/col error
+        # is the message for malformed JSON.
+        try:
+            meta = Metadata.model_validate_json(raw)
+        except ValidationError as e:
+            try:
+                json.loads(raw)
+            except json.JSONDecodeError as je:
+                return [
+                    CheckFinding(
+                        severity="error",
+                        section="producer",
+                        message=f"malformed JSON in metadata.json: {je.msg} (line {je.lineno}, col {je.colno})",
+                        kind="metadata_invalid",
+                    )
+                ]
+            findings.extend(
+                CheckFinding(
+                    severity="error",
+                    section="producer",
+                    message=err["msg"],
+                    field_path=".".join(str(p) for p in err["loc"]) or None,
+                    kind="metadata_invalid",
+                )
+                for err in e.errors()
             )
-            for err in e.errors()
-        )
 
     # Slice 30: storage drift detection. Runs even when Pydantic validation
     # failed above — drift is independent of metadata-schema validity.
@@ -288,19 +306,18 @@ def _consumer_findings_from_dvc(
     findings: list[CheckFinding] = []
     factory = producer_view_factory if producer_view_factory is not None else ProducerView.try_at
 
-    for dep in deps:
-        if not upgrades:
-            findings.append(_summary_finding(dep))
-            continue
+    if not upgrades:
+        return [_summary_finding(dep) for dep in deps]
 
-        result_pin = factory(dep.producer_repo, dep.contract_pin)
+    resolved = _resolve_pins_and_heads(
+        factory, [(dep.producer_repo, dep.contract_pin) for dep in deps]
+    )
+    for dep, (result_pin, result_head) in zip(deps, resolved):
         if isinstance(result_pin, ProducerError):
             findings.append(_error_finding(dep, result_pin))
             continue
 
-        # Compare to HEAD — empty string sentinel is a test contract.
-        result_head = factory(dep.producer_repo, "")
-        if isinstance(result_head, ProducerError):
+        if not isinstance(result_head, ProducerView):
             # We could resolve the pin but not HEAD — degrade to "up to date"
             findings.append(_uptodate_finding(dep))
             continue
@@ -318,14 +335,15 @@ def _consumer_findings_from_enclave_manifest(
     client: CatalogClient | None,
 ) -> list[CheckFinding]:
     manifest_path = project_path / "enclave_manifest.yaml"
-    if not manifest_path.is_file():
-        return []
 
     # Lazy import to break the check.py ↔ enclave.py cycle.
     from .enclave import EnclaveManifest
 
     try:
         manifest = EnclaveManifest.load(manifest_path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        # Not an enclave project.
+        return []
     except (ValidationError, yaml.YAMLError) as e:
         return [
             CheckFinding(
@@ -337,13 +355,17 @@ def _consumer_findings_from_enclave_manifest(
             )
         ]
 
-    findings: list[CheckFinding] = []
+    findings: list[CheckFinding | None] = []
     factory = (
         producer_view_factory
         if producer_view_factory is not None
         else ProducerView.try_at
     )
 
+    # Products that need a producer resolve reserve a slot in ``findings``
+    # and are resolved together afterwards, so the report keeps manifest
+    # order while the network round trips overlap.
+    pending: list[tuple[int, str, str, ApprovedProduct]] = []
     for ap in manifest.approved_products:
         field_path = f"approved_products[{ap.repo}]"
         if client is None:
@@ -388,26 +410,55 @@ def _consumer_findings_from_enclave_manifest(
             )
             continue
 
-        result_pin = factory(repo_url, ap.pin)
-        if isinstance(result_pin, ProducerError):
-            findings.append(_error_finding_for(manifest_path, field_path, result_pin))
-            continue
+        pending.append((len(findings), field_path, repo_url, ap))
+        findings.append(None)
 
-        result_head = factory(repo_url, "")
-        if isinstance(result_head, ProducerError):
-            findings.append(_uptodate_finding_for(source=manifest_path, field_path=field_path))
-            continue
-
-        findings.append(
-            _drift_finding_from_views(
+    resolved = _resolve_pins_and_heads(
+        factory, [(repo_url, ap.pin) for _, _, repo_url, ap in pending]
+    )
+    for (slot, field_path, _, ap), (result_pin, result_head) in zip(pending, resolved):
+        if isinstance(result_pin, ProducerError):
+            findings[slot] = _error_finding_for(manifest_path, field_path, result_pin)
+        elif not isinstance(result_head, ProducerView):
+            findings[slot] = _uptodate_finding_for(source=manifest_path, field_path=field_path)
+        else:
+            findings[slot] = _drift_finding_from_views(
                 source=manifest_path,
                 field_path=field_path,
                 pin_view=result_pin,
                 head_view=result_head,
                 expected_output_path=ap.source_path,
             )
-        )
-    return findings
+    return [f for f in findings if f is not None]
+
+
+def _resolve_pins_and_heads(
+    factory: ProducerViewFactory,
+    targets: list[tuple[str, str]],
+) -> list[tuple[ProducerView | ProducerError, ProducerView | ProducerError | None]]:
+    """Resolve each ``(repo, pin)`` at its pin and at HEAD, concurrently.
+
+    Returns one ``(pin_result, head_result)`` pair per target, in input
+    order. HEAD is only resolved when the pin resolved — ``head_result``
+    is None otherwise, so callers narrow it with ``isinstance(...,
+    ProducerView)`` after handling the pin error. The empty-string pin is the HEAD sentinel (a test
+    contract). Targets are independent network round trips, so they run
+    on a small thread pool; a single target skips the pool entirely.
+    """
+
+    def _one(
+        target: tuple[str, str],
+    ) -> tuple[ProducerView | ProducerError, ProducerView | ProducerError | None]:
+        repo, pin = target
+        result_pin = factory(repo, pin)
+        if isinstance(result_pin, ProducerError):
+            return result_pin, None
+        return result_pin, factory(repo, "")
+
+    if len(targets) <= 1:
+        return [_one(t) for t in targets]
+    with ThreadPoolExecutor(max_workers=min(_UPGRADE_RESOLVE_WORKERS, len(targets))) as ex:
+        return list(ex.map(_one, targets))
 
 
 def _resolve_approved_product_url(client: CatalogClient, ap: ApprovedProduct) -> str:
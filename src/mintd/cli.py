@@ -18,15 +18,17 @@ import json
 import logging
 import os
 import posixpath
+import stat
 import sys
 import time
+from collections import defaultdict
 from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import Any, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, NoReturn, Optional
 
 from pydantic import ValidationError
 
-from . import __version__, config_ops, metadata_migrate
+from . import _yaml
 from ._console import Reporter
 from ._config import Config, ConfigError
 from ._dvc_ops import (
@@ -43,7 +45,7 @@ from ._subprocess import WallTimeoutExceeded
 from ._registry_git_ops import GitOpError
 from ._fast_sync_ops import FastSyncOps
 from ._registry_git_ops import RegistryGitOps, SubprocessRegistryGitOps  # noqa: F401
-from ._init_ops import InitOpError
+from ._init_ops import InitNonInteractive, InitOpError
 from .catalog import (
     CatalogAlreadyExists,
     CatalogClient,
@@ -63,30 +65,7 @@ from .data import (
     import_product,
 )
 from .data_ops import data_add, data_pull, data_push, data_remove, data_verify
-from ._s3_listing_ops import (
-    BucketAccessError,
-    BucketNotFound,
-    S3ListingResult,
-    list_product_objects,
-)
 from ._archive_ops import ArchiveAlreadyExists, UnsafeArchiveMember
-from ._share_ops import (
-    ShareError,
-    TransferError,
-    neutralize_control_chars,
-    resolve_share_user,
-    share_get,
-    share_put,
-)
-from ._cache_ops import (
-    CacheError,
-    CachePullSummary,
-    CachePushSummary,
-    cache_pull,
-    cache_push,
-    list_cache_objects,
-    resolve_repo_remote,
-)
 from .enclave import (
     AlreadyApproved,
     AppendOnlyViolation,
@@ -102,7 +81,7 @@ from .enclave import (
     enclave_remove,
     enclave_verify,
 )
-from .imports import scan_imports
+from .imports import DataDependency, scan_imports
 from .init import InitDestinationExists, InitNameInvalid, init_project
 from .model import Metadata
 from .pending_registrations import PendingRegistrations
@@ -113,8 +92,19 @@ from .publish import (
     PublishNonInteractive,
     PublishPreview,
     WorkingTreeDirty,
+    _apply_publish,
+    prepare_publish,
 )
 
+# Recovery hints shared by several handlers' error paths.
+_HINT_SEE_DATA_LIST = "run 'mintd data list' to see available products"
+_HINT_SEE_ENCLAVE_LIST = "'mintd enclave list' to see subscribed repos"
+_HINT_APPEND_ONLY = "approved_products is append-only; edit the manifest by hand"
+
+if TYPE_CHECKING:
+    from ._cache_ops import CachePullSummary, CachePushSummary
+    from ._s3_listing_ops import S3ListingResult, S3Object
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,16 +119,24 @@ def _load_metadata_with_schema_hint(path: Path) -> Metadata:
     """Read metadata.json. Raises ``MetadataSchemaTooOld`` when the file is
     on the v1 schema (so callers can hint at `mintd update metadata`); the
     underlying ``pydantic.ValidationError`` otherwise. ``FileNotFoundError``
-    propagates verbatim."""
-    raw = path.read_text(encoding="utf-8")
+    propagates verbatim.
+
+    Validates first: ``schema_version`` is ``Literal["2.0"]``, so any other
+    version fails validation anyway, and the happy path is a single pass
+    through pydantic's JSON parser. Only a failed validation pays the
+    stdlib ``json`` peek to pick the error to raise."""
+    raw = path.read_bytes()
     try:
-        peek = json.loads(raw)
-    except json.JSONDecodeError:
-        peek = {}
-    sv = peek.get("schema_version") if isinstance(peek, dict) else None
-    if sv is not None and sv != "2.0":
-        raise MetadataSchemaTooOld(path=path, found=str(sv))
-    return Metadata.model_validate_json(raw)
+        return Metadata.model_validate_json(raw)
+    except ValidationError:
+        try:
+            peek = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            peek = {}
+        sv = peek.get("schema_version") if isinstance(peek, dict) else None
+        if sv is not None and sv != "2.0":
+            raise MetadataSchemaTooOld(path=path, found=str(sv)) from None
+        raise
 
 
 def _add_global_output_flags(parser: argparse.ArgumentParser) -> None:
@@ -152,6 +150,49 @@ def _add_global_output_flags(parser: argparse.ArgumentParser) -> None:
                         help="Disable color output (also respects NO_COLOR env)")
 
 
+def _add_dvc_arg_flag(parser: argparse.ArgumentParser) -> None:
+    """The repeatable ``--dvc-arg`` passthrough shared by the dvc-backed
+    ``data`` verbs (import / pull / clone)."""
+    parser.add_argument(
+        "--dvc-arg", action="append", default=[], dest="dvc_args", metavar="ARG",
+        help="Append an arg to the underlying `dvc` invocation. "
+             "Use `--dvc-arg=VALUE` form for hyphen-prefixed values "
+             "(repeatable; ignored on fast-sync code paths).",
+    )
+
+
+def _add_project_path_flag(parser: argparse.ArgumentParser) -> None:
+    """The ``--path`` project-root option shared by every verb that acts on
+    an existing project checkout (cache push/pull/ls, data pull/verify/list,
+    publish)."""
+    parser.add_argument("--path", type=Path, default=Path("."),
+                        help="Project root (default: current directory)")
+
+
+def _add_config_file_flag(parser: argparse.ArgumentParser) -> None:
+    """The ``--path`` config-file override shared by the ``config`` verbs
+    (None means the default location)."""
+    parser.add_argument("--path", type=Path, default=None)
+
+
+# One shared default for every enclave verb's ``--manifest`` (Path is
+# immutable, and argparse never runs ``type`` over a non-string default).
+_DEFAULT_ENCLAVE_MANIFEST = Path("enclave_manifest.yaml")
+
+
+def _add_manifest_flag(parser: argparse.ArgumentParser) -> None:
+    """The ``--manifest`` option shared by every ``enclave`` verb."""
+    parser.add_argument("--manifest", type=Path, default=_DEFAULT_ENCLAVE_MANIFEST)
+
+
+def _add_subscription_scope_flags(parser: argparse.ArgumentParser) -> None:
+    """The mutually exclusive ``--source-path`` / ``--all`` pair that scopes
+    an ``enclave add`` / ``remove`` to one output or every output."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--source-path", dest="source_path")
+    group.add_argument("--all", action="store_true", dest="all_outputs")
+
+
 def _build_reporter(args: argparse.Namespace) -> Reporter:
     return Reporter(
         verbose=args.verbose,
@@ -181,6 +222,12 @@ _KIND_PREFIX: dict[str | None, str] = {
 _RECOVERABLE_KINDS: frozenset[str] = frozenset({"unreachable", "schema_too_old"})
 
 
+# Shared argparse choice tuples. ``_PROJECT_TYPES`` is also the canonical
+# display order for ``data list`` (see ``_CATALOG_TYPE_ORDER``).
+_PROJECT_TYPES: tuple[str, ...] = ("data", "code", "project", "enclave")
+_LANGUAGES: tuple[str, ...] = ("python", "r", "stata")
+
+
 class _MintdArgumentParser(argparse.ArgumentParser):
     """argparse subclass that exits 64 on misuse (instead of argparse's 2)."""
 
@@ -253,8 +300,13 @@ def _add_cache_parser(subs: Any) -> None:
         help="Report the would-upload/unchanged split without moving bytes "
              "(still performs the LIST + HEAD precheck)",
     )
-    p_cache_push.add_argument("--path", type=Path, default=Path("."),
-                              help="Project root (default: current directory)")
+    p_cache_push.add_argument(
+        "--rehash", action="store_true",
+        help="Re-hash every file instead of reusing digests of files whose "
+             "size and mtime match the last push (without it, a content change "
+             "that keeps the same size and mtime is not detected)",
+    )
+    _add_project_path_flag(p_cache_push)
     p_cache_push.set_defaults(_handler=_handle_cache_push)
 
     p_cache_pull = p_cache_sub.add_parser(
@@ -271,8 +323,7 @@ def _add_cache_parser(subs: Any) -> None:
         help="Overwrite existing working-tree files (default: skip-and-warn on a "
              "local file with different content)",
     )
-    p_cache_pull.add_argument("--path", type=Path, default=Path("."),
-                              help="Project root (default: current directory)")
+    _add_project_path_flag(p_cache_pull)
     p_cache_pull.set_defaults(_handler=_handle_cache_pull)
 
     p_cache_ls = p_cache_sub.add_parser(
@@ -285,25 +336,46 @@ def _add_cache_parser(subs: Any) -> None:
     p_cache_ls.add_argument("--remote", help="DVC remote name (default: the project's)")
     p_cache_ls.add_argument("--no-truncate", dest="no_truncate", action="store_true",
                             help="Render every row (default: truncate past 50 files)")
-    p_cache_ls.add_argument("--path", type=Path, default=Path("."),
-                            help="Project root (default: current directory)")
+    _add_project_path_flag(p_cache_ls)
     p_cache_ls.set_defaults(_handler=_handle_cache_ls)
 
 
+class _VersionAction(argparse.Action):
+    """``--version`` that looks the package version up only when the flag
+    is passed. argparse's stock action takes the string at parser build
+    time, which would pay the dist-info lookup on every invocation."""
+
+    def __init__(self, option_strings: Sequence[str], dest: str = argparse.SUPPRESS, **kwargs: Any) -> None:
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, **kwargs)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> NoReturn:
+        from . import __version__
+
+        print(f"{parser.prog} {__version__}")
+        parser.exit()
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = _MintdArgumentParser(
         prog="mintd",
         description="mintd: Lightweight data product framework for research labs",
     )
     _add_global_output_flags(parser)
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--version", action=_VersionAction)
     subs = parser.add_subparsers(dest="command")
 
     p_init = subs.add_parser("init", help="Create a new mintd project")
     p_init.add_argument(
         "project_type",
         metavar="type",
-        choices=["data", "code", "project", "enclave"],
+        choices=_PROJECT_TYPES,
     )
     p_init.add_argument("name")
     p_init.add_argument(
@@ -323,7 +395,7 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_init.add_argument(
         "--lang",
-        choices=["python", "r", "stata"],
+        choices=_LANGUAGES,
         default="python",
         help="Primary programming language for scaffold (ignored for enclave type).",
     )
@@ -346,12 +418,7 @@ def _build_parser() -> argparse.ArgumentParser:
     p_import.add_argument(
         "--dest-root", type=Path, default=Path("data/imports"), dest="dest_root"
     )
-    p_import.add_argument(
-        "--dvc-arg", action="append", default=[], dest="dvc_args", metavar="ARG",
-        help="Append an arg to the underlying `dvc` invocation. "
-             "Use `--dvc-arg=VALUE` form for hyphen-prefixed values "
-             "(repeatable; ignored on fast-sync code paths).",
-    )
+    _add_dvc_arg_flag(p_import)
     p_import.set_defaults(_handler=_handle_data_import, _parser=p_import)
 
     p_pull = p_data_sub.add_parser("pull", help="Pull DVC data")
@@ -362,13 +429,8 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_pull.add_argument("--remote")
     p_pull.add_argument("--jobs", type=int)
-    p_pull.add_argument("--path", type=Path, default=Path("."))
-    p_pull.add_argument(
-        "--dvc-arg", action="append", default=[], dest="dvc_args", metavar="ARG",
-        help="Append an arg to the underlying `dvc` invocation. "
-             "Use `--dvc-arg=VALUE` form for hyphen-prefixed values "
-             "(repeatable; ignored on fast-sync code paths).",
-    )
+    _add_project_path_flag(p_pull)
+    _add_dvc_arg_flag(p_pull)
     p_pull.set_defaults(_handler=_handle_data_pull)
 
     p_clone = p_data_sub.add_parser(
@@ -395,12 +457,7 @@ def _build_parser() -> argparse.ArgumentParser:
     p_clone.add_argument("--jobs", type=int, help="DVC parallelism")
     p_clone.add_argument("--timeout", type=float, default=None,
                          help="Wall-clock cap in seconds for the clone+pull (default: unbounded)")
-    p_clone.add_argument(
-        "--dvc-arg", action="append", default=[], dest="dvc_args", metavar="ARG",
-        help="Append an arg to the underlying `dvc` invocation. "
-             "Use `--dvc-arg=VALUE` form for hyphen-prefixed values "
-             "(repeatable; ignored on fast-sync code paths).",
-    )
+    _add_dvc_arg_flag(p_clone)
     p_clone.set_defaults(_handler=_handle_data_clone)
 
     p_push = p_data_sub.add_parser("push", help="Push DVC data")
@@ -419,7 +476,7 @@ def _build_parser() -> argparse.ArgumentParser:
 
     p_verify = p_data_sub.add_parser("verify", help="Verify DVC data")
     p_verify.add_argument("targets", nargs="*")
-    p_verify.add_argument("--path", type=Path, default=Path("."))
+    _add_project_path_flag(p_verify)
     p_verify.set_defaults(_handler=_handle_data_verify)
 
     p_remove = p_data_sub.add_parser("remove", help="Remove DVC data")
@@ -442,11 +499,12 @@ def _build_parser() -> argparse.ArgumentParser:
 
     p_data_list = p_data_sub.add_parser("list", help="List catalog entries or local imports")
     p_data_list.add_argument("--imported", action="store_true")
+    _add_project_path_flag(p_data_list)
     p_data_list.add_argument("--detailed", action="store_true", help="Show full descriptions (no truncation).")
     p_data_list.add_argument("--width", type=int, default=80, help="Description column width (default: 80).")
     p_data_list.add_argument(
         "--type", dest="project_type",
-        choices=["data", "code", "project", "enclave"],
+        choices=_PROJECT_TYPES,
     )
     p_data_list.set_defaults(_handler=_handle_data_list, _parser=p_data_list)
 
@@ -498,42 +556,32 @@ def _build_parser() -> argparse.ArgumentParser:
     p_enclave_sub = p_enclave.add_subparsers(dest="enclave_command")
     p_ebump = p_enclave_sub.add_parser("bump", help="Bump approved_products[].pin")
     p_ebump.add_argument("name")
-    p_ebump.add_argument(
-        "--manifest", type=Path, default=Path("enclave_manifest.yaml")
-    )
+    _add_manifest_flag(p_ebump)
     p_ebump.add_argument("--force", action="store_true")
     p_ebump.set_defaults(_handler=_handle_enclave_bump)
 
     p_elist = p_enclave_sub.add_parser("list", help="List manifest entries")
     p_elist.add_argument("repo", nargs="?")
-    p_elist.add_argument(
-        "--manifest", type=Path, default=Path("enclave_manifest.yaml")
-    )
+    _add_manifest_flag(p_elist)
     p_elist.set_defaults(_handler=_handle_enclave_list)
 
     p_eadd = p_enclave_sub.add_parser("add", help="Subscribe to a producer")
     p_eadd.add_argument("repo")
     p_eadd.add_argument("--pin")
-    _eadd_mutex = p_eadd.add_mutually_exclusive_group()
-    _eadd_mutex.add_argument("--source-path", dest="source_path")
-    _eadd_mutex.add_argument("--all", action="store_true", dest="all_outputs")
-    p_eadd.add_argument(
-        "--manifest", type=Path, default=Path("enclave_manifest.yaml")
-    )
+    _add_subscription_scope_flags(p_eadd)
+    _add_manifest_flag(p_eadd)
     p_eadd.set_defaults(_handler=_handle_enclave_add)
 
     p_erm = p_enclave_sub.add_parser("remove", help="Unsubscribe from a producer")
     p_erm.add_argument("repo")
-    _erm_mutex = p_erm.add_mutually_exclusive_group()
-    _erm_mutex.add_argument("--source-path", dest="source_path")
-    _erm_mutex.add_argument("--all", action="store_true", dest="all_outputs")
-    p_erm.add_argument("--manifest", type=Path, default=Path("enclave_manifest.yaml"))
+    _add_subscription_scope_flags(p_erm)
+    _add_manifest_flag(p_erm)
     p_erm.set_defaults(_handler=_handle_enclave_remove)
 
     p_epull = p_enclave_sub.add_parser("pull", help="Fetch subscribed data")
     p_epull.add_argument("repo", nargs="?")
     p_epull.add_argument("--force", action="store_true")
-    p_epull.add_argument("--manifest", type=Path, default=Path("enclave_manifest.yaml"))
+    _add_manifest_flag(p_epull)
     p_epull.set_defaults(_handler=_handle_enclave_pull)
 
     p_epkg = p_enclave_sub.add_parser(
@@ -541,18 +589,14 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     p_epkg.add_argument("repo", nargs="?")
     p_epkg.add_argument("--output", type=Path, dest="output_archive")
-    p_epkg.add_argument(
-        "--manifest", type=Path, default=Path("enclave_manifest.yaml")
-    )
+    _add_manifest_flag(p_epkg)
     p_epkg.set_defaults(_handler=_handle_enclave_package)
 
     p_ever = p_enclave_sub.add_parser(
         "verify", help="Reconcile an extracted transfer into the manifest"
     )
     p_ever.add_argument("extracted_dir", type=Path)
-    p_ever.add_argument(
-        "--manifest", type=Path, default=Path("enclave_manifest.yaml")
-    )
+    _add_manifest_flag(p_ever)
     p_ever.add_argument("--data-root", type=Path, dest="data_root")
     p_ever.set_defaults(_handler=_handle_enclave_verify)
 
@@ -571,7 +615,7 @@ def _build_parser() -> argparse.ArgumentParser:
     p_reg_status = p_registry_sub.add_parser(
         "status", help="Show registration status (or list pending)"
     )
-    p_reg_status.add_argument("name", nargs="?")
+    p_reg_status.add_argument("names", nargs="*", metavar="name")
     p_reg_status.set_defaults(_handler=_handle_registry_status)
 
     p_reg_sync = p_registry_sub.add_parser("sync", help="Refresh the registry cache")
@@ -582,21 +626,21 @@ def _build_parser() -> argparse.ArgumentParser:
     p_publish.add_argument("--dry-run", action="store_true", dest="dry_run")
     p_publish.add_argument("--yes", "-y", action="store_true", dest="assume_yes", help="Skip the interactive preview confirmation. Required when stdin is not a TTY.")
     p_publish.add_argument("--message", "-m")
-    p_publish.add_argument("--path", type=Path, default=Path("."))
+    _add_project_path_flag(p_publish)
     p_publish.set_defaults(_handler=_handle_publish)
 
     p_config = subs.add_parser("config", help="Inspect, edit, and validate mintd config")
     p_config_sub = p_config.add_subparsers(dest="config_command")
 
     p_config_show = p_config_sub.add_parser("show", help="Pretty-print the current config")
-    p_config_show.add_argument("--path", type=Path, default=None)
+    _add_config_file_flag(p_config_show)
     p_config_show.set_defaults(_handler=_handle_config_show)
 
     p_config_setup = p_config_sub.add_parser(
         "setup",
         help="Update config fields (interactive when no flags are given)",
     )
-    p_config_setup.add_argument("--path", type=Path, default=None)
+    _add_config_file_flag(p_config_setup)
     setup_group = p_config_setup.add_mutually_exclusive_group(required=False)
     setup_group.add_argument(
         "--set", action="append", dest="set_pairs", metavar="KEY=VALUE",
@@ -616,7 +660,7 @@ def _build_parser() -> argparse.ArgumentParser:
     p_config_validate = p_config_sub.add_parser(
         "validate", help="Schema + AWS profile + S3 connectivity check"
     )
-    p_config_validate.add_argument("--path", type=Path, default=None)
+    _add_config_file_flag(p_config_validate)
     p_config_validate.add_argument(
         "--bucket", default=None,
         help="S3 bucket to test head_bucket against (auto-discovery is slice-22+).",
@@ -655,6 +699,13 @@ def _resolve_catalog_client(config: Config) -> CatalogClient:
     )
 
 
+def _catalog_preflight(args: argparse.Namespace) -> tuple[Reporter, CatalogClient]:
+    """Shared setup for the enclave/registry verbs that only need the
+    reporter and a catalog client built from the loaded config."""
+    reporter = getattr(args, "_reporter", None) or Reporter()
+    return reporter, _resolve_catalog_client(Config.load())
+
+
 def _resolve_clients(config: Config, reporter: Optional[Reporter] = None) -> tuple[CatalogClient, DvcOps]:
     """Build production ``GitCatalogClient`` + ``SubprocessDvcOps`` from
     config. Tests monkeypatch this function to inject fakes.
@@ -698,6 +749,7 @@ def _resolve_s3_listing_ops(config: Config):
     except ImportError as exc:
         logger.warning("data ls unavailable (boto3 not importable): %s", exc)
         return None
+    from ._s3_listing_ops import list_product_objects
     return list_product_objects
 
 
@@ -742,12 +794,8 @@ def _handle_check(args: argparse.Namespace) -> int:
 
 
 def _handle_init(args: argparse.Namespace) -> int:
-    from ._config import Config
-    from ._console import Reporter
-    from ._init_ops import InitNonInteractive
-    from .init import (
-        _prompt_classification,
-    )
+    # Looked up at call time: tests replace mintd.init._prompt_classification.
+    from .init import _prompt_classification
 
     reporter = getattr(args, "_reporter", None) or Reporter()
     # Slice 30 P1 (reviewer-flagged): enclave projects don't use DVC storage
@@ -786,27 +834,34 @@ def _handle_init(args: argparse.Namespace) -> int:
             endpoint=endpoint,
             profile=profile,
             reporter=reporter,
+            config=config,
         )
     except (InitDestinationExists, InitNameInvalid, InitOpError) as exc:
         reporter.error(str(exc))
         return 1
     # Render paths relative to cwd when possible so the user sees the subdir.
+    # Every written file lives under ``project_path``, so resolve that once
+    # instead of a realpath per file, and emit the whole summary in one
+    # write rather than a flushed line per scaffold file.
     cwd = Path.cwd().resolve()
+    root = project_path.resolve()
     try:
-        rel = project_path.resolve().relative_to(cwd)
+        rel = root.relative_to(cwd)
     except ValueError:
         rel = project_path
+    lines: list[str] = []
     for p in written:
         try:
-            line = p.resolve().relative_to(cwd)
+            line = (root / p.relative_to(project_path)).relative_to(cwd)
         except ValueError:
             line = p
-        print(f"created: {line}")
-    print("initialized: git")
+        lines.append(f"created: {line}")
+    lines.append("initialized: git")
     if args.project_type in {"data", "code", "project"}:
-        print("initialized: dvc")
+        lines.append("initialized: dvc")
     if str(rel) != ".":
-        print(f"Next: cd {rel}")
+        lines.append(f"Next: cd {rel}")
+    print("\n".join(lines))
     return 0
 
 
@@ -960,6 +1015,8 @@ def _share_boto3_available(reporter: Reporter) -> bool:
 
 
 def _handle_share_put(args: argparse.Namespace) -> int:
+    from ._share_ops import ShareError, TransferError, resolve_share_user, share_put
+
     reporter = getattr(args, "_reporter", None) or Reporter()
     config = Config.load()
     if not _share_boto3_available(reporter):
@@ -1008,6 +1065,8 @@ def _handle_share_put(args: argparse.Namespace) -> int:
 
 
 def _handle_share_get(args: argparse.Namespace) -> int:
+    from ._share_ops import ShareError, TransferError, share_get
+
     reporter = getattr(args, "_reporter", None) or Reporter()
     config = Config.load()
     if not _share_boto3_available(reporter):
@@ -1065,6 +1124,9 @@ def _cache_project_preflight(args: argparse.Namespace) -> tuple[Reporter, Path,
 
 
 def _handle_cache_push(args: argparse.Namespace) -> int:
+    from ._cache_ops import CacheError, cache_push
+    from ._share_ops import TransferError
+
     pre = _cache_project_preflight(args)
     if isinstance(pre, int):
         return pre
@@ -1079,6 +1141,7 @@ def _handle_cache_push(args: argparse.Namespace) -> int:
             jobs=args.jobs,
             dry_run=args.dry_run,
             s3_client_factory=factory,
+            rehash=args.rehash,
         )
     except (CacheError, TransferError) as exc:
         reporter.error(str(exc), hint=getattr(exc, "hint", None))
@@ -1131,6 +1194,9 @@ def _render_cache_push(summary: CachePushSummary, reporter: Reporter) -> int:
 
 
 def _handle_cache_pull(args: argparse.Namespace) -> int:
+    from ._cache_ops import CacheError, cache_pull
+    from ._share_ops import TransferError
+
     pre = _cache_project_preflight(args)
     if isinstance(pre, int):
         return pre
@@ -1200,6 +1266,9 @@ def _render_cache_pull(summary: CachePullSummary, reporter: Reporter) -> int:
 
 
 def _handle_cache_ls(args: argparse.Namespace) -> int:
+    from ._cache_ops import CacheError, list_cache_objects, resolve_repo_remote
+    from ._s3_listing_ops import BucketAccessError, BucketNotFound
+
     pre = _cache_project_preflight(args)
     if isinstance(pre, int):
         return pre
@@ -1330,12 +1399,10 @@ def _handle_data_verify(args: argparse.Namespace) -> int:
     if not status_map:
         print("clean")
         return 0
-    dirty = False
-    for path, status in sorted(status_map.items()):
-        print(f"{path}: {status}")
-        if status != "clean":
-            dirty = True
-    return 1 if dirty else 0
+    # Build the whole listing, then emit it in one write.
+    rows = sorted(status_map.items())
+    print("\n".join(f"{path}: {status}" for path, status in rows))
+    return 1 if any(status != "clean" for _, status in rows) else 0
 
 
 def _handle_data_remove(args: argparse.Namespace) -> int:
@@ -1355,6 +1422,8 @@ def _handle_data_remove(args: argparse.Namespace) -> int:
 
 
 def _handle_data_ls(args: argparse.Namespace) -> int:
+    from ._s3_listing_ops import BucketAccessError, BucketNotFound
+
     reporter = args._reporter
     config = Config.load()
     client = _resolve_catalog_client(config)
@@ -1366,7 +1435,7 @@ def _handle_data_ls(args: argparse.Namespace) -> int:
     try:
         entry = client.fetch(args.name)
     except CatalogNotFound as exc:
-        reporter.error(str(exc), hint="run 'mintd data list' to see available products")
+        reporter.error(str(exc), hint=_HINT_SEE_DATA_LIST)
         return 1
 
     dumped = entry.model_dump()
@@ -1431,24 +1500,35 @@ def _data_ls_payload(name: str, result: S3ListingResult, *, include_versions: bo
         }
         for o in result.objects
     ]
-    files = [o for o in result.objects if not o.is_dir]
-    dirs = [o for o in result.objects if o.is_dir]
+    # Counts and totals reflect FILES only (slice-31 review P1). Tallied in
+    # one pass: a big prefix lists many thousands of objects, and the
+    # file/dir split is only ever counted and summed, never kept.
+    total_bytes = 0
+    file_count = 0
+    dir_count = 0
+    first_file: S3Object | None = None
+    for o in result.objects:
+        if o.is_dir:
+            dir_count += 1
+            continue
+        file_count += 1
+        total_bytes += o.size
+        if first_file is None:
+            first_file = o
     payload: dict = {
         "name": name,
         "bucket": result.bucket,
         "prefix": result.prefix,
         "endpoint": result.endpoint,
         "objects": objects,
-        # Counts and totals reflect FILES only (slice-31 review P1).
-        "total_bytes": sum(o.size for o in files),
-        "file_count": len(files),
-        "dir_count": len(dirs),
+        "total_bytes": total_bytes,
+        "file_count": file_count,
+        "dir_count": dir_count,
     }
     # Slice-31 review P1a: hint must point at a file, not a directory.
     # Slice-31 review P1b: keys are relative to sub_path; prepend it so the
     # hint command works from the project root (where `mintd data pull`
     # expects paths).
-    first_file = next((o for o in result.objects if not o.is_dir), None)
     if first_file is not None:
         sub = result.truncated_to_prefix or ""
         sub = sub.strip("/") + "/" if sub.strip("/") else ""
@@ -1482,6 +1562,8 @@ _DATA_LS_ROW_CAP = 50
 def _pretty_data_ls(
     payload: dict, *, name: str, versions: bool, no_truncate: bool = False,
 ) -> str:
+    from ._share_ops import neutralize_control_chars
+
     lines = [f"s3://{payload['bucket']}/{payload['prefix']}"]
     if not payload["objects"]:
         lines.append("(no objects)")
@@ -1588,7 +1670,7 @@ def _handle_data_clone(args: argparse.Namespace) -> int:
             aws_profile_name=config.aws_profile_name,
         )
     except CatalogNotFound as exc:
-        reporter.error(str(exc), hint="run 'mintd data list' to see available products")
+        reporter.error(str(exc), hint=_HINT_SEE_DATA_LIST)
         return 1
     except MissingPrimaryDataProduct as exc:
         reporter.error(str(exc), hint="drop --primary to pull every tracked output")
@@ -1670,7 +1752,7 @@ def _read_primary_from_clone(dest: Path) -> str | None:
     `clone_and_pull_product` is stubbed and `dest` doesn't exist on disk).
     """
     try:
-        meta = json.loads((dest / "metadata.json").read_text(encoding="utf-8"))
+        meta = json.loads((dest / "metadata.json").read_bytes())
         primary = meta.get("data_products", {}).get("primary")
         return primary if isinstance(primary, str) else None
     except (OSError, json.JSONDecodeError):
@@ -1688,18 +1770,20 @@ def _measure_clone_result(dest: Path) -> tuple[int, int]:
     total = 0
     try:
         for p in dest.rglob("*"):
-            if not p.is_file():
-                continue
             # Skip clone metadata: .git internals and the .dvc dir
             # (cache/tmp/config) — neither is data product content.
             parts = p.relative_to(dest).parts
             if ".git" in parts or ".dvc" in parts:
                 continue
-            files += 1
+            # One stat answers both "regular file?" and "how big?".
             try:
-                total += p.stat().st_size
+                st = p.stat()
             except OSError:
-                pass
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            files += 1
+            total += st.st_size
     except OSError:
         pass
     return files, total
@@ -1731,9 +1815,6 @@ def _import_summary(produced: list[Path]) -> dict:
     """Derive provenance + size facts from the produced `.dvc` files for the
     `data import` completion line (slice 38b). Best-effort: a non-import-shaped
     `.dvc` degrades to a count-only summary rather than raising."""
-    import yaml as _yaml
-    from .imports import DataDependency
-
     pin: str | None = None
     repo: str | None = None
     total_bytes = 0
@@ -1746,7 +1827,7 @@ def _import_summary(produced: list[Path]) -> dict:
         except Exception:
             pass
         try:
-            raw = _yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+            raw = _yaml.safe_load(p.read_bytes()) or {}
             for out in raw.get("outs", []):
                 total_bytes += int(out.get("size", 0) or 0)
                 file_count += int(out.get("nfiles", 1) or 1)
@@ -1820,7 +1901,7 @@ def _handle_data_import(args: argparse.Namespace) -> int:
             reporter=reporter,
         )
     except CatalogNotFound as exc:
-        reporter.error(str(exc), hint="run 'mintd data list' to see available products")
+        reporter.error(str(exc), hint=_HINT_SEE_DATA_LIST)
         return 1
     except (
         MissingPrimaryDataProduct,
@@ -1858,7 +1939,7 @@ def _handle_data_list(args: argparse.Namespace) -> int:
         return 2
 
     if args.imported:
-        deps = scan_imports(Path("."))
+        deps = scan_imports(args.path)
         payload = [
             {"local_path": str(d.local_path),
              "producer_repo": d.producer_repo,
@@ -1866,8 +1947,8 @@ def _handle_data_list(args: argparse.Namespace) -> int:
              "output_path": d.output_path}
             for d in deps
         ]
-        pretty = (lambda _p: "no imports") if not deps else _pretty_imports
-        reporter.result(payload, pretty=pretty)
+        pretty_imports = (lambda _p: "no imports") if not deps else _pretty_imports
+        reporter.result(payload, pretty=pretty_imports)
         return 0
 
     config = Config.load()
@@ -1882,11 +1963,13 @@ def _handle_data_list(args: argparse.Namespace) -> int:
     # For pretty mode, use the slice-22 grouped table (grouped by project_type
     # with the canonical data → code → project → enclave order, name-column
     # truncation, "(no description)" placeholder for empty descriptions).
-    if not entries:
-        pretty_text = "no entries"
-    else:
-        pretty_text = _render_catalog_table(entries, detailed=args.detailed, width=args.width)
-    reporter.result(catalog_payload, pretty=lambda _p: pretty_text)
+    # Rendered inside the callback so `--json` consumers never build it.
+    def pretty(_p: object) -> str:
+        if not entries:
+            return "no entries"
+        return _render_catalog_table(entries, detailed=args.detailed, width=args.width)
+
+    reporter.result(catalog_payload, pretty=pretty)
     return 0
 
 
@@ -1897,7 +1980,7 @@ def _pretty_imports(payload: list[dict]) -> str:
     return "\n".join(lines)
 
 
-_CATALOG_TYPE_ORDER = ("data", "code", "project", "enclave")
+_CATALOG_TYPE_ORDER = _PROJECT_TYPES
 
 
 def _render_catalog_table(entries, *, detailed: bool, width: int) -> str:
@@ -1908,8 +1991,6 @@ def _render_catalog_table(entries, *, detailed: bool, width: int) -> str:
     Descriptions truncate to ``width`` chars (with ``...``) unless
     ``detailed`` is True. Multi-line descriptions collapse to the first line.
     """
-    from collections import defaultdict
-
     groups: dict[str, list] = defaultdict(list)
     for entry in entries:
         groups[entry.project_type].append(entry)
@@ -1923,15 +2004,20 @@ def _render_catalog_table(entries, *, detailed: bool, width: int) -> str:
         header = f"{ptype} ({len(members)})"
         underline = ("-" * name_col) + "  " + ("-" * width)
         rows = [header, f"{'name'.ljust(name_col)}  description", underline]
-        for entry in members:
-            desc = (entry.description or "").splitlines()[0] if entry.description else ""
+        # ``partition`` stops at the first newline instead of splitting the
+        # whole description just to keep line one.
+        first_lines = [
+            (entry.name, (entry.description or "").partition("\n")[0].rstrip("\r"))
+            for entry in members
+        ]
+        for name, desc in first_lines:
             if not desc:
                 rendered = "(no description)"
             elif not detailed and len(desc) > width:
                 rendered = desc[: max(0, width - 3)] + "..."
             else:
                 rendered = desc
-            rows.append(f"{entry.name.ljust(name_col)}  {rendered}")
+            rows.append(f"{name.ljust(name_col)}  {rendered}")
         sections.append("\n".join(rows))
     return "\n\n".join(sections)
 
@@ -1948,40 +2034,50 @@ def _handle_enclave_list(args: argparse.Namespace) -> int:
         return 1
     repo_filter: str | None = args.repo
 
-    approved = [ap for ap in manifest.approved_products if repo_filter is None or ap.repo == repo_filter]
-    downloaded = [d for d in manifest.downloaded if repo_filter is None or d.repo == repo_filter]
-    transferred = [t for t in manifest.transferred if repo_filter is None or t.repo == repo_filter]
-
-    if repo_filter is not None and not approved and not downloaded and not transferred:
-        print(f"no entries for {repo_filter}")
-        return 0
+    # Unfiltered, the manifest's lists are rendered as they are; only a
+    # repo filter needs a pass over each one.
+    approved = manifest.approved_products
+    downloaded = manifest.downloaded
+    transferred = manifest.transferred
+    if repo_filter is not None:
+        approved = [ap for ap in approved if ap.repo == repo_filter]
+        downloaded = [d for d in downloaded if d.repo == repo_filter]
+        transferred = [t for t in transferred if t.repo == repo_filter]
+        if not approved and not downloaded and not transferred:
+            print(f"no entries for {repo_filter}")
+            return 0
 
-    print("approved_products:")
+    # Build the whole listing, then emit it in one write.
+    lines = ["approved_products:"]
     if not approved:
-        print("  (none)")
-    for ap in approved:
-        path = ap.source_path or "<primary>"
-        print(f"  {ap.repo}@{ap.pin[:7]} (path: {path})")
+        lines.append("  (none)")
+    lines.extend(
+        f"  {ap.repo}@{ap.pin[:7]} (path: {ap.source_path or '<primary>'})"
+        for ap in approved
+    )
 
-    print("downloaded:")
+    lines.append("downloaded:")
     if not downloaded:
-        print("  (none)")
-    for d in downloaded:
-        print(f"  {d.repo} @ {d.contract_pin[:7]} → {d.local_path} ({d.fetch_strategy})")
+        lines.append("  (none)")
+    lines.extend(
+        f"  {d.repo} @ {d.contract_pin[:7]} → {d.local_path} ({d.fetch_strategy})"
+        for d in downloaded
+    )
 
-    print("transferred:")
+    lines.append("transferred:")
     if not transferred:
-        print("  (none)")
-    for t in transferred:
-        print(f"  {t.repo} @ {t.contract_pin[:7]} ({t.transfer_date}) → {t.local_path}")
+        lines.append("  (none)")
+    lines.extend(
+        f"  {t.repo} @ {t.contract_pin[:7]} ({t.transfer_date}) → {t.local_path}"
+        for t in transferred
+    )
 
+    print("\n".join(lines))
     return 0
 
 
 def _handle_enclave_bump(args: argparse.Namespace) -> int:
-    reporter = getattr(args, "_reporter", None) or Reporter()
-    config = Config.load()
-    client = _resolve_catalog_client(config)
+    reporter, client = _catalog_preflight(args)
     try:
         with reporter.status(f"Bumping {args.name}..."):
             result = enclave_bump(
@@ -1993,19 +2089,19 @@ def _handle_enclave_bump(args: argparse.Namespace) -> int:
     except BumpBlocked as exc:
         return _render_bump_blocked(exc)
     except ImportNotFound as exc:
-        reporter.error(str(exc), hint="'mintd enclave list' to see subscribed repos")
+        reporter.error(str(exc), hint=_HINT_SEE_ENCLAVE_LIST)
         return 1
     except PrimaryRemovedAtHead as exc:
         reporter.error(str(exc), hint="pin to an older SHA or unsubscribe with 'mintd enclave remove'")
         return 1
     except AppendOnlyViolation as exc:
-        reporter.error(str(exc), hint="approved_products is append-only; edit the manifest by hand")
+        reporter.error(str(exc), hint=_HINT_APPEND_ONLY)
         return 1
     except CatalogNotFound as exc:
         # `--force` resolves the producer's catalog entry directly (bypassing
         # check_project, which folds this into a BumpBlocked finding), so a
         # removed/offline entry surfaces here. Render clean, not a traceback.
-        reporter.error(str(exc), hint="run 'mintd data list' to see available products")
+        reporter.error(str(exc), hint=_HINT_SEE_DATA_LIST)
         return 1
     except ValidationError as exc:
         # pydantic ValidationError subclasses ValueError, so it would otherwise
@@ -2028,9 +2124,7 @@ def _handle_enclave_bump(args: argparse.Namespace) -> int:
 
 
 def _handle_enclave_add(args: argparse.Namespace) -> int:
-    reporter = getattr(args, "_reporter", None) or Reporter()
-    config = Config.load()
-    client = _resolve_catalog_client(config)
+    reporter, client = _catalog_preflight(args)
     try:
         path = enclave_add(
             client,
@@ -2044,13 +2138,13 @@ def _handle_enclave_add(args: argparse.Namespace) -> int:
         reporter.error(str(exc), hint="already subscribed; 'mintd enclave list' to review")
         return 1
     except CatalogNotFound as exc:
-        reporter.error(str(exc), hint="run 'mintd data list' to see available products")
+        reporter.error(str(exc), hint=_HINT_SEE_DATA_LIST)
         return 1
     except MissingPrimaryDataProduct as exc:
         reporter.error(str(exc), hint="pass --path <output> or --all")
         return 1
     except AppendOnlyViolation as exc:
-        reporter.error(str(exc), hint="approved_products is append-only; edit the manifest by hand")
+        reporter.error(str(exc), hint=_HINT_APPEND_ONLY)
         return 1
     except (ProducerError, ValueError) as exc:
         reporter.error(str(exc), hint="check the repo/pin arguments")
@@ -2064,9 +2158,7 @@ def _handle_enclave_add(args: argparse.Namespace) -> int:
 
 
 def _handle_enclave_remove(args: argparse.Namespace) -> int:
-    reporter = getattr(args, "_reporter", None) or Reporter()
-    config = Config.load()
-    client = _resolve_catalog_client(config)
+    reporter, client = _catalog_preflight(args)
     try:
         enclave_remove(
             client,
@@ -2076,10 +2168,10 @@ def _handle_enclave_remove(args: argparse.Namespace) -> int:
             all_=args.all_outputs,
         )
     except ImportNotFound as exc:
-        reporter.error(str(exc), hint="'mintd enclave list' to see subscribed repos")
+        reporter.error(str(exc), hint=_HINT_SEE_ENCLAVE_LIST)
         return 1
     except AppendOnlyViolation as exc:
-        reporter.error(str(exc), hint="approved_products is append-only; edit the manifest by hand")
+        reporter.error(str(exc), hint=_HINT_APPEND_ONLY)
         return 1
     msg = f"removed: {args.repo}"
     if args.source_path:
@@ -2205,17 +2297,17 @@ def _handle_enclave_verify(args: argparse.Namespace) -> int:
     if not written:
         print("nothing to verify (all entries already in transferred[])")
         return 0
-    for item in written:
-        print(
+    print(
+        "\n".join(
             f"verified: {item.repo} @ {item.contract_pin[:7]} → {item.local_path}"
+            for item in written
         )
+    )
     return 0
 
 
 def _handle_registry_register(args: argparse.Namespace) -> int:
-    reporter = getattr(args, "_reporter", None) or Reporter()
-    config = Config.load()
-    client = _resolve_catalog_client(config)
+    reporter, client = _catalog_preflight(args)
     try:
         metadata = _load_metadata_with_schema_hint(args.path / "metadata.json")
     except FileNotFoundError as exc:
@@ -2233,7 +2325,7 @@ def _handle_registry_register(args: argparse.Namespace) -> int:
             hint="run 'mintd check' to see field-level details",
         )
         return 1
-    findings = check_project(args.path, upgrades=False)
+    findings = check_project(args.path, upgrades=False, metadata=metadata)
     error_findings = [f for f in findings if f.severity == "error"]
     if error_findings:
         return _render_findings(error_findings, json_out=False)
@@ -2260,9 +2352,7 @@ def _handle_registry_register(args: argparse.Namespace) -> int:
 
 
 def _handle_registry_update(args: argparse.Namespace) -> int:
-    reporter = getattr(args, "_reporter", None) or Reporter()
-    config = Config.load()
-    client = _resolve_catalog_client(config)
+    reporter, client = _catalog_preflight(args)
     try:
         metadata = _load_metadata_with_schema_hint(args.path / "metadata.json")
     except FileNotFoundError as exc:
@@ -2314,14 +2404,18 @@ def _handle_registry_update(args: argparse.Namespace) -> int:
 
 def _handle_registry_status(args: argparse.Namespace) -> int:
     config = Config.load()
-    if args.name:
+    if args.names:
         # Per-name status needs the catalog client (looks at cache + PRs).
+        # One status_many call refreshes the registry cache once for all
+        # requested names.
         client = _resolve_catalog_client(config)
-        status = client.status(args.name)
-        line = f"{args.name}: {status.state}"
-        if status.pr_number is not None:
-            line += f" (PR #{status.pr_number})"
-        print(line)
+        lines = []
+        for name, status in client.status_many(args.names).items():
+            line = f"{name}: {status.state}"
+            if status.pr_number is not None:
+                line += f" (PR #{status.pr_number})"
+            lines.append(line)
+        print("\n".join(lines))
         return 0
     # No name → just list the local pending file. No registry_url needed.
     pending_path = config.resolved_cache_dir() / "registry" / ".mintd_pending.json"
@@ -2330,15 +2424,12 @@ def _handle_registry_status(args: argparse.Namespace) -> int:
     if not entries:
         print("no pending registrations")
         return 0
-    for entry in entries:
-        print(f"{entry.name} ({entry.kind}): PR #{entry.pr_number}")
+    print("\n".join(f"{entry.name} ({entry.kind}): PR #{entry.pr_number}" for entry in entries))
     return 0
 
 
 def _handle_registry_sync(args: argparse.Namespace) -> int:
-    reporter = getattr(args, "_reporter", None) or Reporter()
-    config = Config.load()
-    client = _resolve_catalog_client(config)
+    reporter, client = _catalog_preflight(args)
     with reporter.status("Refreshing registry cache..."):
         count = client.sync()
     print(f"synced ({count} entries)")
@@ -2346,7 +2437,6 @@ def _handle_registry_sync(args: argparse.Namespace) -> int:
 
 
 def _handle_publish(args: argparse.Namespace) -> int:
-    from .publish import prepare_publish, _apply_publish
     reporter = getattr(args, "_reporter", None) or Reporter()
     config = Config.load()
     client, dvc_ops = _resolve_clients(config)
@@ -2464,6 +2554,8 @@ def _prompt_publish_confirm(
 
 
 def _handle_config_show(args: argparse.Namespace) -> int:
+    from . import config_ops
+
     try:
         config = Config.load(args.path) if args.path is not None else Config.load()
     except ConfigError as exc:
@@ -2477,6 +2569,8 @@ def _handle_config_show(args: argparse.Namespace) -> int:
 
 
 def _handle_config_setup(args: argparse.Namespace) -> int:
+    from . import config_ops
+
     write = not args.dry_run
     try:
         if args.from_file is not None:
@@ -2500,19 +2594,27 @@ def _handle_config_setup(args: argparse.Namespace) -> int:
 
 
 def _handle_config_validate(args: argparse.Namespace) -> int:
+    from . import config_ops
+
     reporter = getattr(args, "_reporter", None) or Reporter()
+    # Parse once: the same Config feeds validate_config and the success
+    # line below. A schema failure leaves it None and validate_config
+    # re-raises internally to report the step.
+    try:
+        config: Config | None = Config.load(args.path)
+    except ConfigError:
+        config = None
     with reporter.status("Validating S3 connectivity..."):
-        steps = config_ops.validate_config(args.path, bucket=args.bucket)
+        steps = config_ops.validate_config(args.path, bucket=args.bucket, config=config)
     text, exit_code = config_ops.render_validation(steps, json_out=args.json_out)
     print(text)
     if not args.json_out:
         s3_step = next((s for s in steps if s.name == "s3"), None)
         if s3_step is not None and s3_step.status == "ok":
-            try:
-                config = Config.load()
+            if config is not None:
                 endpoint = config.storage_endpoint or "default AWS endpoint"
                 profile = config.aws_profile_name or "default"
-            except Exception:
+            else:
                 endpoint, profile = "default AWS endpoint", "default"
             ms_clause = f" — 200 OK, {s3_step.latency_ms}ms" if s3_step.latency_ms is not None else " — 200 OK"
             reporter.success(f"✓ s3://{args.bucket} via {endpoint} (profile: {profile}){ms_clause}")
@@ -2528,6 +2630,8 @@ def _handle_update_metadata(args: argparse.Namespace) -> int:
     - 2 — migration produced a dict that fails v2 validation (user must
       hand-fix the field path surfaced in the message)
     """
+    from . import metadata_migrate
+
     try:
         report = metadata_migrate.apply_metadata_migration(
             args.path, dry_run=args.dry_run
@@ -2558,15 +2662,12 @@ def _handle_update_metadata(args: argparse.Namespace) -> int:
             )
         )
         return 0
-    if args.dry_run:
-        print("# dry-run: would apply the following migration")
-    print(f"schema_version: {report.schema_before} → {report.schema_after}")
-    for src, dst in report.moved:
-        print(f"  → {src} → {dst}")
-    for name in report.defaulted:
-        print(f"  + {name} (defaulted)")
-    for name in report.dropped:
-        print(f"  - {name} (dropped)")
+    lines = ["# dry-run: would apply the following migration"] if args.dry_run else []
+    lines.append(f"schema_version: {report.schema_before} → {report.schema_after}")
+    lines.extend(f"  → {src} → {dst}" for src, dst in report.moved)
+    lines.extend(f"  + {name} (defaulted)" for name in report.defaulted)
+    lines.extend(f"  - {name} (dropped)" for name in report.dropped)
+    print("\n".join(lines))
     return 0
 
 
@@ -2580,36 +2681,41 @@ def _resolve_prefix(kind: str | None) -> str:
 
 
 def _render_findings(findings: list[CheckFinding], *, json_out: bool) -> int:
+    # Collect every line and emit them in one write: a project with many
+    # imports reports a finding (and often a hint) per import.
+    lines: list[str] = []
     if json_out:
-        for f in findings:
-            print(
-                json.dumps(
-                    {
-                        "severity": f.severity,
-                        "section": f.section,
-                        "message": f.message,
-                        "field_path": f.field_path,
-                        "source": str(f.source) if f.source else None,
-                        "kind": f.kind,
-                        "hint": f.hint,
-                    }
-                )
+        lines.extend(
+            json.dumps(
+                {
+                    "severity": f.severity,
+                    "section": f.section,
+                    "message": f.message,
+                    "field_path": f.field_path,
+                    "source": str(f.source) if f.source else None,
+                    "kind": f.kind,
+                    "hint": f.hint,
+                }
             )
+            for f in findings
+        )
     else:
         for f in findings:
             prefix = _resolve_prefix(f.kind)
             loc = f.source if f.source else "<project>"
-            print(f"{prefix} [{f.severity}] {loc}: {f.message}")
+            lines.append(f"{prefix} [{f.severity}] {loc}: {f.message}")
             if f.hint:
-                print(f"    💡 {f.hint}")
+                lines.append(f"    💡 {f.hint}")
         if not findings:
-            print("no issues found")
+            lines.append("no issues found")
         else:
             n_err = sum(1 for f in findings if f.severity == "error")
             n_warn = sum(1 for f in findings if f.severity == "warning")
             sections = sorted({f.section for f in findings if f.section})
             across = f" across {' + '.join(sections)}" if sections else ""
-            print(f"{n_err} error(s), {n_warn} warning(s){across}")
+            lines.append(f"{n_err} error(s), {n_warn} warning(s){across}")
+    if lines:
+        print("\n".join(lines))
     return 1 if any(f.severity == "error" for f in findings) else 0
 
 
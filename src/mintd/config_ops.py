@@ -13,6 +13,8 @@ write-side concerns.
 
 from __future__ import annotations
 
+import functools
+import json
 import os
 import sys
 import time
@@ -22,6 +24,7 @@ from typing import Literal
 import yaml
 from pydantic import BaseModel, ConfigDict, ValidationError
 
+from . import _yaml
 from ._atomic import _try_fsync_parent_dir
 from ._config import Config, ConfigError, _default_config_path
 
@@ -43,10 +46,20 @@ def _atomic_write_yaml(path: Path, content: str) -> None:
     in ``publish.py``; uses ``r+``/``f.flush()``/``os.fsync(fileno)``
     rather than ``O_RDONLY``+``fsync`` because the latter only flushes
     inode metadata on Linux, not the file contents.
+
+    No-op when ``path`` already holds exactly ``content`` — e.g. the setup
+    wizard with every prompt left at its current value — so an unchanged
+    config skips the tmp write, both fsyncs and the rename.
     """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(content, encoding="utf-8")
+    tmp.write_bytes(data)
     with open(tmp, "r+") as f:
         f.flush()
         os.fsync(f.fileno())
@@ -117,6 +130,7 @@ def _check_unknown_keys(data: dict) -> None:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
 def render_config(config: Config, *, json_out: bool = False) -> str:
     """Render ``config`` as YAML (default) or JSON.
 
@@ -124,9 +138,11 @@ def render_config(config: Config, *, json_out: bool = False) -> str:
     could paste back through ``--from FILE``. ``mode="json"`` ensures
     ``Path`` values serialize as strings (matters for both YAML and JSON
     paths through ``yaml.safe_dump``).
-    """
-    import json
 
+    Memoized: ``Config`` is frozen (hashable by value), and ``config
+    setup`` renders the same config twice — once for the atomic write,
+    once for the echo — so the second is a cache hit.
+    """
     data = config.model_dump(exclude_none=True, mode="json")
     if json_out:
         return json.dumps(data, indent=2)
@@ -138,6 +154,23 @@ def render_config(config: Config, *, json_out: bool = False) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _read_existing_yaml(path: Path) -> object:
+    """Raw YAML payload of the on-disk config, or ``{}`` when absent.
+
+    Shared by ``--set`` and the setup wizard so both read the file the
+    same way ``Config.load`` does: one ``read_bytes`` and a parse from
+    bytes. Callers decide what a non-mapping payload means.
+    """
+    try:
+        raw = path.read_bytes()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return {}
+    try:
+        return _yaml.safe_load(raw) or {}
+    except yaml.YAMLError as e:
+        raise ConfigError(f"malformed YAML in {path}: {e}") from e
+
+
 def _validate_data(data: dict) -> Config:
     _check_unknown_keys(data)
     try:
@@ -160,13 +193,7 @@ def apply_set_updates(
     config is returned without touching disk.
     """
     path = _resolve_path(config_path)
-    if path.is_file():
-        try:
-            data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        except yaml.YAMLError as e:
-            raise ConfigError(f"malformed YAML in {path}: {e}") from e
-    else:
-        data = {}
+    data = _read_existing_yaml(path)
     if not isinstance(data, dict):
         raise ConfigError(f"config at {path} is not a YAML mapping")
     for key, value in updates:
@@ -201,7 +228,7 @@ def apply_from_file(
         except FileNotFoundError as e:
             raise ConfigError(f"--from FILE not found: {source}") from e
     try:
-        data = yaml.safe_load(text) or {}
+        data = _yaml.safe_load(text) or {}
     except yaml.YAMLError as e:
         raise ConfigError(f"malformed YAML from --from source: {e}") from e
     if not isinstance(data, dict):
@@ -230,6 +257,7 @@ def validate_config(
     config_path: Path | None,
     *,
     bucket: str | None = None,
+    config: Config | None = None,
 ) -> list[ValidationStep]:
     """Run three checks in order: schema → AWS profile → S3 connectivity.
 
@@ -239,10 +267,14 @@ def validate_config(
     boto3 credential source will be used but never fails. The S3 step
     is only meaningful when a ``bucket`` is supplied; otherwise it's
     ``skipped`` (auto-discovery from the registry repo is slice-22+).
+
+    Callers that already hold the loaded ``Config`` pass it as
+    ``config`` so the file is not parsed a second time.
     """
     path = _resolve_path(config_path)
     try:
-        config = Config.load(path)
+        if config is None:
+            config = Config.load(path)
     except ConfigError as e:
         return [
             ValidationStep(name="schema", status="fail", message=str(e)),
@@ -414,7 +446,7 @@ def apply_migrate_v1(
     except FileNotFoundError as e:
         raise ConfigError(f"--migrate-v1 source not found: {source}") from e
     try:
-        v1_data = yaml.safe_load(text) or {}
+        v1_data = _yaml.safe_load(text) or {}
     except yaml.YAMLError as e:
         raise ConfigError(f"malformed YAML in {source}: {e}") from e
     if not isinstance(v1_data, dict):
@@ -489,17 +521,11 @@ def interactive_setup(
             secret_prompt_fn = prompt_fn
 
     path = _resolve_path(config_path)
-    if path.is_file():
-        try:
-            existing = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        except yaml.YAMLError as e:
-            raise ConfigError(f"malformed YAML in {path}: {e}") from e
-        if not isinstance(existing, dict):
-            existing = {}
-        # Drop v1-shaped keys so the wizard starts from a clean v2 base.
-        existing = {k: v for k, v in existing.items() if k in Config.model_fields}
-    else:
+    existing = _read_existing_yaml(path)
+    if not isinstance(existing, dict):
         existing = {}
+    # Drop v1-shaped keys so the wizard starts from a clean v2 base.
+    existing = {k: v for k, v in existing.items() if k in Config.model_fields}
 
     print(f"Interactive setup for {path}")
     print("Press <return> to keep the current value; type a value to change it.")
@@ -573,8 +599,6 @@ def render_validation(
 ) -> tuple[str, int]:
     """Render validation steps as text or JSON; return (text, exit_code)."""
     if json_out:
-        import json
-
         # JSON shape: {step_name: {"status": ..., "message": ...}}. Tests
         # assert structure (keys present) rather than exact message strings.
         text = json.dumps(
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import shutil
 from collections.abc import Callable
 from contextlib import nullcontext
@@ -24,6 +25,7 @@ from ._dvc_ops import DvcOps
 from ._fast_sync_ops import FastSyncOps, normalize_target
 from ._registry_git_ops import GitOpError, RegistryGitOps
 from ._templates import project_full_name
+from ._templates._render import _TYPE_PREFIX
 from .catalog import CatalogClient
 from .check import CheckFinding, check_project
 from .data_ops import data_pull
@@ -170,25 +172,31 @@ def import_product(
         else nullcontext()
     )
 
+    # Every output lands directly under `nested_root`, so one listing of it
+    # answers the `.dvc` conflict check for all of them — and checking up
+    # front means a conflict on output N no longer leaves outputs 1..N-1
+    # half-imported.
+    leaf_names = [Path(p.rstrip("/")).name for p in paths]
+    if not force:
+        existing = _dir_entry_names(nested_root)
+        for leaf in leaf_names:
+            if f"{leaf}.dvc" in existing:
+                raise ImportDestinationExists(
+                    f"{nested_root / (leaf + '.dvc')} already exists; "
+                    "pass force=True or remove it"
+                )
+    # `dvc import` requires the destination's parent directory to already
+    # exist; it doesn't auto-create it. Create it here so a fresh consumer
+    # project (no `data/imports/<namespace>/` yet) doesn't fail with the
+    # cryptic "stage working dir ... does not exist".
+    nested_root.mkdir(parents=True, exist_ok=True)
+
     produced: list[Path] = []
     with status_cm:
-        for i, p in enumerate(paths, 1):
+        for i, (p, leaf) in enumerate(zip(paths, leaf_names), 1):
             if multi and reporter is not None:
-                reporter.update_status(
-                    f"Importing {Path(p.rstrip('/')).name} ({i}/{len(paths)})..."
-                )
-            dest = nested_root / Path(p.rstrip("/")).name
-            target_dvc = dest.parent / (dest.name + ".dvc")
-            if target_dvc.exists() and not force:
-                raise ImportDestinationExists(
-                    f"{target_dvc} already exists; pass force=True or remove it"
-                )
-            # `dvc import` requires the destination's parent directory to
-            # already exist; it doesn't auto-create it. Create here so a
-            # fresh consumer project (no `data/imports/<namespace>/` yet)
-            # doesn't fail with the cryptic "stage working dir ... does not
-            # exist".
-            dest.parent.mkdir(parents=True, exist_ok=True)
+                reporter.update_status(f"Importing {leaf} ({i}/{len(paths)})...")
+            dest = nested_root / leaf
             produced.append(
                 dvc_ops.import_(
                     repo_url=repo_url,
@@ -202,6 +210,15 @@ def import_product(
     return produced
 
 
+def _dir_entry_names(directory: Path) -> set[str]:
+    """Names in ``directory`` from a single ``os.scandir``; empty if absent."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def _resolve_paths(
     entry: dict[str, Any],
     *,
@@ -287,7 +304,7 @@ def _cloned_metadata_entry(
     from an older tag). Falls back to the catalog entry when the file is
     missing, malformed, or has no usable `data_products` block."""
     try:
-        data = json.loads((dest / "metadata.json").read_text(encoding="utf-8"))
+        data = json.loads((dest / "metadata.json").read_bytes())
     except (OSError, ValueError):
         return fallback
     if not isinstance(data, dict) or not isinstance(
@@ -305,11 +322,17 @@ def _require_repo_url(entry: dict[str, Any], *, name: str) -> str:
     return url
 
 
-_NAME_FORBIDDEN = ("/", "\\", "..")
+# Path separators or a parent-dir hop anywhere in the name; one regex scan
+# instead of a substring search per forbidden token.
+_NAME_FORBIDDEN_RE = re.compile(r"[/\\]|\.\.")
+
+# Type prefixes a catalog name may already carry (``data_foo``); stripped
+# before ``project_full_name`` re-applies the entry's own type prefix.
+_CLONE_NAME_PREFIXES = (_TYPE_PREFIX["data"], _TYPE_PREFIX["project"])
 
 
 def _validate_clone_name(name: str) -> None:
-    if not name or name in {".", ".."} or any(s in name for s in _NAME_FORBIDDEN):
+    if not name or name == "." or _NAME_FORBIDDEN_RE.search(name):
         raise ValueError(f"invalid product name: {name!r}")
 
 
@@ -320,7 +343,7 @@ def _resolve_clone_dest(
         return dest
     project_type = (entry.get("project") or {}).get("type") or "data"
     base = name
-    for prefix in ("data_", "prj_"):
+    for prefix in _CLONE_NAME_PREFIXES:
         if base.startswith(prefix):
             base = base[len(prefix):]
             break
@@ -601,8 +624,7 @@ def _imports_index(project_path: Path) -> dict[str, Path]:
     """
     index: dict[str, Path] = {}
     imports_dir = project_path / "data" / "imports"
-    if not imports_dir.exists():
-        return index
+    # rglob over a missing directory yields nothing; no exists() probe needed.
     for dvc_path in sorted(imports_dir.rglob("*.dvc")):
         try:
             dep = DataDependency.from_dvc_file(dvc_path)
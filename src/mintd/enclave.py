@@ -5,7 +5,11 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import date, datetime, timezone
+import hashlib
+import logging
 import os
+import time
+import uuid
 from pathlib import Path
 import shutil
 import tempfile
@@ -14,6 +18,7 @@ from typing import TYPE_CHECKING, Literal
 import yaml
 from pydantic import BaseModel, ConfigDict, ValidationError
 
+from . import _yaml
 from ._archive_ops import ArchiveOps, TarGzArchiveOps
 from ._atomic import _try_fsync_parent_dir
 from .catalog import CatalogClient
@@ -31,6 +36,8 @@ if TYPE_CHECKING:
     from ._console import Reporter
     from .check import CheckFinding
 
+logger = logging.getLogger(__name__)
+
 __all__ = [
     "AlreadyApproved",
     "AppendOnlyViolation",
@@ -142,6 +149,85 @@ class TransferredItem(BaseModel):
     transfer_id: str
     local_path: str
 
+# Parsed manifests keyed by absolute path, each tagged with the file's
+# ``(st_mtime_ns, st_size)`` when it was read or written. Repeat loads of an
+# unchanged file in one process (bump -> check_project, save's append-only
+# check) cost a stat instead of a YAML parse + validation. A file modified
+# within the racy window could change again without moving its mtime, so
+# only settled files are remembered.
+_MANIFEST_CACHE: dict[str, tuple[tuple[int, int], "EnclaveManifest"]] = {}
+_MANIFEST_CACHE_RACY_WINDOW_NS = 2_000_000_000
+
+
+# The in-process cache above dies with the CLI process, and every mintd
+# invocation is a new process. Each manifest's validated model is also
+# kept as JSON under ``~/.cache/mintd/enclave`` (one file per manifest path,
+# first line the sha256 of the YAML bytes it was parsed from), which
+# pydantic reads back far faster than a YAML parse + validation. The key is
+# the content, not the stat: a same-size replacement that keeps the mtime
+# (``cp -p``, ``rsync -t``, a restore) must not serve the old transferred[].
+# The YAML file stays the only source of truth — it is committed and
+# reviewed, so it keeps its format — and a stale, missing or corrupt cache
+# entry just falls through to the YAML. Entries not read for
+# ``_PARSE_CACHE_MAX_AGE_S`` (moved or deleted manifests) are pruned on write.
+_PARSE_CACHE_MAX_AGE_S = 30 * 24 * 3600
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse_cache_dir() -> Path:
+    return Path.home() / ".cache" / "mintd" / "enclave"
+
+
+def _parse_cache_path(abspath: str) -> Path:
+    name = hashlib.sha256(abspath.encode("utf-8")).hexdigest()[:16]
+    return _parse_cache_dir() / f"{name}.json"
+
+
+def _read_parse_cache(abspath: str, digest: str) -> "EnclaveManifest | None":
+    path = _parse_cache_path(abspath)
+    try:
+        header, _, body = path.read_bytes().partition(b"\n")
+        if header != digest.encode("ascii"):
+            return None
+        manifest = EnclaveManifest.model_validate_json(body)
+        # Reads keep the entry's mtime fresh so the age prune spares it.
+        os.utime(path)
+        return manifest
+    except (OSError, ValueError):  # ValidationError is a ValueError
+        return None
+
+
+def _prune_parse_cache(directory: Path) -> None:
+    cutoff = time.time() - _PARSE_CACHE_MAX_AGE_S
+    try:
+        entries = list(directory.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            continue
+
+
+def _write_parse_cache(abspath: str, digest: str, manifest: "EnclaveManifest") -> None:
+    path = _parse_cache_path(abspath)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(digest.encode("ascii") + b"\n" + manifest.model_dump_json().encode("utf-8"))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("could not save enclave manifest parse cache to %s: %s", path, exc)
+        return
+    _prune_parse_cache(path.parent)
+
+
 class EnclaveManifest(BaseModel):
     schema_version: Literal["2.0"] = "2.0"
     enclave_name: str
@@ -151,28 +237,61 @@ class EnclaveManifest(BaseModel):
 
     @classmethod
     def load(cls, path: Path) -> "EnclaveManifest":
-        with path.open(encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or {}
-        return cls.model_validate(data)
+        key = _stat_key(path)
+        cache_key = os.path.abspath(path)
+        cached = _MANIFEST_CACHE.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[1].model_copy(deep=True)
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        manifest = _read_parse_cache(cache_key, digest)
+        if manifest is None:
+            # Bytes straight to the loader: libyaml decodes UTF-8 itself, so
+            # a text-mode read would only decode for it to re-encode.
+            data = _yaml.safe_load(raw) or {}
+            manifest = cls.model_validate(data)
+            _write_parse_cache(cache_key, digest, manifest)
+        if time.time_ns() - key[0] > _MANIFEST_CACHE_RACY_WINDOW_NS:
+            _MANIFEST_CACHE[cache_key] = (key, manifest.model_copy(deep=True))
+        return manifest
 
     def save(self, path: Path) -> None:
-        if path.exists():
-            existing = EnclaveManifest.load(path)
+        content = _yaml.safe_dump(
+            self.model_dump(mode="json"), sort_keys=False, encoding="utf-8"
+        )
+        try:
+            existing_bytes: bytes | None = path.read_bytes()
+        except FileNotFoundError:
+            existing_bytes = None
+        # Saving an unchanged manifest (e.g. enclave_pull's flush when
+        # nothing was pulled) is a no-op: identical bytes can't violate the
+        # append-only check, so skip the re-validate and the atomic write.
+        if existing_bytes == content:
+            return
+        if existing_bytes is not None:
+            # Validate the bytes just read rather than going through load():
+            # its in-process cache is keyed on (mtime_ns, size), and the append-only
+            # check must see what is on disk now, not a same-tick stale model.
+            existing = EnclaveManifest.model_validate(_yaml.safe_load(existing_bytes) or {})
             changed = _diff_transferred(existing.transferred, self.transferred)
             if changed:
                 raise AppendOnlyViolation(path, changed)
-        content = yaml.safe_dump(self.model_dump(mode="json"), sort_keys=False)
         # Atomic write (tmp -> fsync -> replace). enclave_pull now flushes this
         # manifest from its BaseException handler, so a crashed/interrupted write
         # (e.g. a second Ctrl-C mid-write) must never leave a truncated file —
         # transferred[] provenance is append-only and not re-derivable.
+        # One open for write + fsync, rather than writing and then reopening
+        # the temp file just to fsync it.
         tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(content, encoding="utf-8")
-        with open(tmp, "r+") as f:
+        with open(tmp, "wb") as f:
+            f.write(content)
             f.flush()
             os.fsync(f.fileno())
         tmp.replace(path)
         _try_fsync_parent_dir(path)
+        key = _stat_key(path)
+        if time.time_ns() - key[0] > _MANIFEST_CACHE_RACY_WINDOW_NS:
+            _MANIFEST_CACHE[os.path.abspath(path)] = (key, self.model_copy(deep=True))
 
     def apply_pin_bump(self, *, repo: str, new_pin: str) -> "EnclaveManifest":
         for i, ap in enumerate(self.approved_products):
@@ -203,13 +322,14 @@ def enclave_add(
     repo_url = entry.repo_url
     if not repo_url:
         raise ValueError(f"catalog entry {name!r} has no repository.github_url")
-    if manifest_path.exists():
+    try:
         manifest = EnclaveManifest.load(manifest_path)
+    except FileNotFoundError:
+        manifest = EnclaveManifest(enclave_name=manifest_path.parent.name)
+    else:
         for ap in manifest.approved_products:
             if ap.repo == name:
                 raise AlreadyApproved(name, manifest_path)
-    else:
-        manifest = EnclaveManifest(enclave_name=manifest_path.parent.name)
     if pin is None:
         factory = producer_view_factory or ProducerView.at_head
         head_view, resolved_pin = factory(repo_url)
@@ -326,20 +446,27 @@ def enclave_remove(
     del client
     # all_ accepted for CLI parity but unused as bare `remove` wipes all entries
     manifest = EnclaveManifest.load(manifest_path)
-    def _matches_approved(ap: ApprovedProduct) -> bool:
-        if ap.repo != name:
-            return False
-        if source_path is not None:
-            return ap.source_path == source_path
-        return True
-    matched = [ap for ap in manifest.approved_products if _matches_approved(ap)]
-    if not matched:
+    # One pass per list: partition out the removed entries and note, on the
+    # way, whether anything kept still references this repo (the wipe guard
+    # below) instead of re-scanning the kept lists afterwards.
+    removed_any = False
+    still_approved = False
+    new_approved: list[ApprovedProduct] = []
+    for ap in manifest.approved_products:
+        if ap.repo == name and (source_path is None or ap.source_path == source_path):
+            removed_any = True
+            continue
+        still_approved = still_approved or ap.repo == name
+        new_approved.append(ap)
+    if not removed_any:
         raise ImportNotFound(f"{name!r} not in approved_products[] in {manifest_path}")
-    new_approved = [ap for ap in manifest.approved_products if not _matches_approved(ap)]
-    new_downloaded = [
-        d for d in manifest.downloaded
-        if d.repo != name or (source_path is not None and d.output != source_path)
-    ]
+    still_downloaded = False
+    new_downloaded: list[DownloadedItem] = []
+    for d in manifest.downloaded:
+        if d.repo == name and (source_path is None or d.output == source_path):
+            continue
+        still_downloaded = still_downloaded or d.repo == name
+        new_downloaded.append(d)
     new_manifest = manifest.model_copy(
         update={"approved_products": new_approved, "downloaded": new_downloaded}
     )
@@ -350,11 +477,7 @@ def enclave_remove(
     # Guards: no remaining approved_products[] entry for this repo, AND no
     # remaining downloaded[] entry for this repo. transferred[] entries point at
     # data/<repo>/... (different root) so they don't gate this wipe.
-    if (
-        repo_downloads.exists()
-        and not any(ap.repo == name for ap in new_approved)
-        and not any(d.repo == name for d in new_downloaded)
-    ):
+    if not still_approved and not still_downloaded and repo_downloads.exists():
         shutil.rmtree(repo_downloads)
     return manifest_path
 
@@ -386,6 +509,7 @@ def enclave_pull(
     today_iso = (today or date.today()).isoformat()
     factory = producer_view_factory or (lambda url, pin: ProducerView.at(url, pin))
     new_downloaded: list[DownloadedItem] = list(manifest.downloaded)
+    already = _DownloadedIndex(manifest.downloaded)
     written: list[DownloadedItem] = []
     created_target_dirs: set[Path] = set()
 
@@ -407,7 +531,7 @@ def enclave_pull(
             reporter.update_status(f"Fetching {ap.repo}... ({i}/{len(targets)})")
         # Idempotence: skip resolving if all outputs are already present.
         # A skip mutates nothing, so it stays outside the try/save below.
-        if not force and _all_already_downloaded(manifest.downloaded, ap):
+        if not force and _all_already_downloaded(already, ap):
              continue
 
         try:
@@ -417,7 +541,7 @@ def enclave_pull(
                 raise ValueError(f"catalog entry {ap.repo!r} has no repository.github_url")
             outputs = _resolve_outputs(ap, repo_url, factory)
             for output in outputs:
-                if not force and _already_downloaded(manifest.downloaded, ap.repo, output, ap.pin):
+                if not force and _already_downloaded(already, ap.repo, output, ap.pin):
                     continue
                 staging_dir = downloads_root / ap.repo / "_staging"
                 # Defensive: clear stale _staging from a prior interrupted run.
@@ -515,15 +639,25 @@ def _resolve_outputs(
         return view.output_paths()
     return [view.primary_or_raise()]
 
+class _DownloadedIndex:
+    """Set-backed lookups over a manifest's ``downloaded[]`` snapshot.
+
+    ``enclave_pull`` asks "already downloaded?" once per approved product and
+    once per resolved output; scanning the list each time is
+    O(products x rows). Built once per pull, each check is a set lookup.
+    """
+
+    def __init__(self, downloaded: list[DownloadedItem]) -> None:
+        self.outputs = {(d.repo, d.output, d.contract_pin) for d in downloaded}
+        self.pins = {(d.repo, d.contract_pin) for d in downloaded}
+
+
 def _already_downloaded(
-    downloaded: list[DownloadedItem], repo: str, output: str, pin: str
+    downloaded: _DownloadedIndex, repo: str, output: str, pin: str
 ) -> bool:
-    return any(
-        d.repo == repo and d.output == output and d.contract_pin == pin
-        for d in downloaded
-    )
+    return (repo, output, pin) in downloaded.outputs
 
-def _all_already_downloaded(downloaded: list[DownloadedItem], ap: ApprovedProduct) -> bool:
+def _all_already_downloaded(downloaded: _DownloadedIndex, ap: ApprovedProduct) -> bool:
     # An `all` product's output set can GROW (the producer may add outputs
     # later), so it must never be fast-skipped here — the inner
     # _already_downloaded check governs per-output re-fetch instead.
@@ -543,10 +677,10 @@ def _all_already_downloaded(downloaded: list[DownloadedItem], ap: ApprovedProduc
     # row recorded for this repo+pin under a source_path output (from a prior
     # reconfiguration without a pin bump) could wrongly fast-skip this primary;
     # the heavier dvc import stays guarded by the inner _already_downloaded check.
-    return any(d.repo == ap.repo and d.contract_pin == ap.pin for d in downloaded)
+    return (ap.repo, ap.pin) in downloaded.pins
 
 def _read_artifact_pin(dvc_path: Path) -> str:
-    data = yaml.safe_load(dvc_path.read_text(encoding="utf-8"))
+    data = _yaml.safe_load(dvc_path.read_bytes())
     outs = data.get("outs") or []
     if not outs:
         raise ValueError(f"{dvc_path} has no outs[]")
@@ -654,11 +788,12 @@ def enclave_package(
             transfer_id=transfer_id,
             contents=contents,
         )
-        (tmp / "_transfer_manifest.yaml").write_text(
-            yaml.safe_dump(
-                transfer_manifest.model_dump(mode="json"), sort_keys=False
-            ),
-            encoding="utf-8",
+        (tmp / "_transfer_manifest.yaml").write_bytes(
+            _yaml.safe_dump(
+                transfer_manifest.model_dump(mode="json"),
+                sort_keys=False,
+                encoding="utf-8",
+            )
         )
 
         ops = archive_ops or TarGzArchiveOps()
@@ -711,13 +846,15 @@ def enclave_verify(
     newly-appended `TransferredItem`s.
     """
     manifest_yaml = extracted_dir / "_transfer_manifest.yaml"
-    if not manifest_yaml.is_file():
+    try:
+        raw_manifest = manifest_yaml.read_bytes()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         raise InvalidTransferManifest(
             f"_transfer_manifest.yaml not found at {manifest_yaml}"
-        )
+        ) from None
 
     try:
-        raw = yaml.safe_load(manifest_yaml.read_text(encoding="utf-8")) or {}
+        raw = _yaml.safe_load(raw_manifest) or {}
         transfer = TransferManifest.model_validate(raw)
     except (yaml.YAMLError, ValidationError) as e:
         raise InvalidTransferManifest(str(e)) from e
@@ -13,9 +13,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Literal
 
-import yaml
 from pydantic import BaseModel, ConfigDict
 
+from . import _yaml
+
 
 class NotAnImportError(Exception):
     """Raised when a `.dvc` file has no `deps[*].repo` — it's a `dvc add` track,
@@ -107,8 +108,11 @@ def scan_imports(
                 continue
 
     lock_path = repo_root / "dvc.lock"
-    if lock_path.exists():
+    try:
         lock = _read_yaml(lock_path)
+    except (FileNotFoundError, NotADirectoryError):
+        lock = {}
+    if lock:
         for stage_name, stage_block in (lock.get("stages") or {}).items():
             if isinstance(stage_block, dict):
                 results.extend(
@@ -131,8 +135,7 @@ def _dedup(deps: list[DataDependency]) -> list[DataDependency]:
 
 
 def _read_yaml(path: Path) -> dict[str, Any]:
-    with path.open(encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    data = _yaml.safe_load(path.read_bytes())
     if not isinstance(data, dict):
         return {}
     return data
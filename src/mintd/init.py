@@ -13,7 +13,7 @@ import shutil
 import sys
 from collections.abc import Callable
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from ._console import Reporter
 from ._init_ops import InitNonInteractive, InitOpError, InitOps, SubprocessInitOps
@@ -22,6 +22,9 @@ from ._templates import InitNameInvalid, project_full_name, render_scaffold
 from .model import DvcStorage, Metadata, Storage
 from .publish import atomic_write_json
 
+if TYPE_CHECKING:
+    from ._config import Config
+
 _DVC_INIT_TYPES: frozenset[str] = frozenset({"data", "code", "project"})
 
 _TIERS: list[tuple[str, str]] = [
@@ -35,6 +38,27 @@ class InitDestinationExists(Exception):
     """`metadata.json` already exists at the target. Refusing to overwrite."""
 
 
+# The line ``_render_metadata_json`` emits for the unset storage block
+# (``exclude_none=False``, ``indent=2``).
+_NULL_STORAGE_LINE = '\n  "storage": null,\n'
+
+
+def _splice_storage(text: str, storage: Storage) -> str | None:
+    """Swap the rendered ``"storage": null`` line for ``storage``.
+
+    A freshly rendered metadata.json is already a validated ``Metadata``
+    dump; re-parsing and re-serializing the whole document just to fill
+    one block is wasted work. Returns None when the placeholder isn't
+    there exactly once (a template emitted something else) so the caller
+    falls back to the defensive parse + validate path.
+    """
+    if text.count(_NULL_STORAGE_LINE) != 1:
+        return None
+    block = storage.model_dump_json(by_alias=True, exclude_none=False, indent=2)
+    block = block.replace("\n", "\n  ")
+    return text.replace(_NULL_STORAGE_LINE, f'\n  "storage": {block},\n')
+
+
 def _prompt_classification(
     *,
     reporter: Reporter,
@@ -74,7 +98,7 @@ def _prompt_classification(
             if not slug:
                 reporter.warn("Slug is required for licensed tier.")
                 continue
-            if not SLUG_REGEX.match(slug):
+            if not SLUG_REGEX.fullmatch(slug):
                 reporter.warn(
                     f"Invalid slug {slug!r}. Must match {SLUG_REGEX.pattern}."
                 )
@@ -98,8 +122,14 @@ def init_project(
     profile: str | None = None,
     ops: InitOps | None = None,
     reporter: Reporter | None = None,
+    config: "Config | None" = None,
 ) -> tuple[Path, list[Path]]:
-    """Initialize a fresh mintd project with storage configuration."""
+    """Initialize a fresh mintd project with storage configuration.
+
+    ``config`` is forwarded to the scaffold renderer so a caller that has
+    already loaded it (the CLI reads bucket/endpoint from it) doesn't pay
+    a second read + parse of the config file.
+    """
     if use_current_repo:
         project_path = target_dir
     else:
@@ -115,6 +145,7 @@ def init_project(
         name=name,
         language=language,
         target_dir=project_path,
+        config=config,
     )
 
     ops = ops or SubprocessInitOps()
@@ -147,18 +178,7 @@ def init_project(
                 profile=profile,
             )
 
-            # Slice 30 defensive raw-dict pop:
-            # Don't call Metadata.model_validate_json on the file
-            # directly — if a template (current or future) emits a
-            # partial storage block, model_validate_json would crash
-            # before our patch can fix it. Read raw dict, drop any
-            # pre-existing storage key, then validate. The pop is a
-            # no-op in the standard v2 path (templates strip storage
-            # entirely) but survives template regressions.
-            raw = json.loads(metadata_path.read_text(encoding="utf-8"))
-            raw.pop("storage", None)
-            metadata = Metadata.model_validate(raw)
-            metadata.storage = Storage(
+            storage = Storage(
                 provider="s3",
                 bucket=bucket,
                 prefix=prefix,
@@ -166,11 +186,24 @@ def init_project(
                 versioning=True,
                 dvc=DvcStorage(remote_name=remote_name),
             )
-            atomic_write_json(
-                metadata_path,
-                metadata.model_dump_json(by_alias=True, exclude_none=False, indent=2)
-                + "\n",
-            )
+            text = metadata_path.read_text(encoding="utf-8")
+            patched = _splice_storage(text, storage)
+            if patched is None:
+                # Slice 30 defensive raw-dict pop:
+                # Don't call Metadata.model_validate_json on the file
+                # directly — if a template (current or future) emits a
+                # partial storage block, model_validate_json would crash
+                # before our patch can fix it. Read raw dict, drop any
+                # pre-existing storage key, then validate.
+                raw = json.loads(text)
+                raw.pop("storage", None)
+                metadata = Metadata.model_validate(raw)
+                metadata.storage = storage
+                patched = (
+                    metadata.model_dump_json(by_alias=True, exclude_none=False, indent=2)
+                    + "\n"
+                )
+            atomic_write_json(metadata_path, patched)
         except Exception:
             # Rollback boundary: remove .dvc/ on remote-add or patch
             # failure. metadata.json is left in place (atomic write +
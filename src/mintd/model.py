@@ -170,8 +170,8 @@ class Metadata(BaseModel):
         if the bytes don't parse as JSON, or pydantic.ValidationError if the
         shape doesn't match the model.
         """
-        data = path.read_text(encoding="utf-8")
-        return cls.model_validate_json(data)
+        # Pydantic's JSON parser takes the raw UTF-8 bytes; no str decode.
+        return cls.model_validate_json(path.read_bytes())
 
     def to_catalog_entry(self) -> CatalogEntry:
         """Project this Metadata onto a CatalogEntry. The catalog stores
@@ -48,12 +48,17 @@ class PendingRegistrations:
 
     Concurrent processes are not supported — mintd commands are single-user,
     single-shell. Atomic write protects against crash, not against races.
+
+    Parsed entries are memoized against the file's ``(st_mtime_ns,
+    st_size)``: a register flow's ``find`` → ``add`` and repeated
+    ``status`` lookups cost one ``stat`` each after the first read.
     """
 
     _SCHEMA_VERSION = 1
 
     def __init__(self, *, path: Path) -> None:
         self._path = path
+        self._cached: tuple[tuple[int, int], list[PendingRegistration]] | None = None
 
     @property
     def path(self) -> Path:
@@ -84,10 +89,21 @@ class PendingRegistrations:
     # ------------------------------------------------------------------
 
     def _read(self) -> list[PendingRegistration]:
-        if not self._path.exists():
+        try:
+            st = self._path.stat()
+        except FileNotFoundError:
+            self._cached = None
+            return []
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cached is not None and self._cached[0] == key:
+            return list(self._cached[1])
+        try:
+            # Single read; json.loads takes the UTF-8 bytes directly.
+            raw = json.loads(self._path.read_bytes())
+        except FileNotFoundError:
+            self._cached = None
             return []
-        raw = json.loads(self._path.read_text(encoding="utf-8"))
-        return [
+        entries = [
             PendingRegistration(
                 name=item["name"],
                 pr_number=int(item["pr_number"]),
@@ -96,6 +112,11 @@ class PendingRegistrations:
             )
             for item in raw.get("entries", [])
         ]
+        self._cached = (key, entries)
+        return list(entries)
+
+    def _mkstemp(self) -> tuple[int, str]:
+        return tempfile.mkstemp(dir=self._path.parent, prefix=".mintd_pending.", suffix=".tmp")
 
     def _write(self, entries: list[PendingRegistration]) -> None:
         payload = {
@@ -110,9 +131,14 @@ class PendingRegistrations:
                 for e in entries
             ],
         }
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        # Atomic write: tempfile + rename.
-        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix=".mintd_pending.", suffix=".tmp")
+        # Atomic write: tempfile + rename. The parent only needs creating on
+        # the first write into a fresh cache, so try the tempfile first
+        # rather than re-walking the directory chain on every write.
+        try:
+            fd, tmp_name = self._mkstemp()
+        except FileNotFoundError:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = self._mkstemp()
         try:
             with os.fdopen(fd, "w", encoding="utf-8") as f:
                 json.dump(payload, f, indent=2)
@@ -124,3 +150,5 @@ class PendingRegistrations:
             except FileNotFoundError:
                 pass
             raise
+        st = self._path.stat()
+        self._cached = ((st.st_mtime_ns, st.st_size), list(entries))
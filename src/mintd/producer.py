@@ -209,13 +209,15 @@ class ProducerView:
                 raise ProducerError.from_fetch_error(e) from e
             cache.write(repo, pin, raw)
 
-        peeked = _peek_schema_version(raw)
-        if peeked is not None and peeked != "2.0":
-            raise ProducerError.schema_too_old(repo, pin, detail=f"schema_version={peeked}")
-
+        # Validate first (``schema_version`` is ``Literal["2.0"]``, so an old
+        # schema fails here too); only a failure pays the stdlib peek that
+        # tells "too old" apart from "invalid".
         try:
             meta = Metadata.model_validate_json(raw)
         except ValidationError as e:
+            peeked = _peek_schema_version(raw)
+            if peeked is not None and peeked != "2.0":
+                raise ProducerError.schema_too_old(repo, pin, detail=f"schema_version={peeked}") from None
             raise ProducerError.metadata_invalid(repo, pin, detail=str(e)) from e
 
         return cls(repo=repo, pin=pin, metadata=meta)
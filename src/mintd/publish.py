@@ -5,12 +5,14 @@ DVC failure rolls back metadata.json. Tag/catalog failures leave the
 manifest bumped + DVC pushed; the CLI prints partial-state warnings.
 """
 
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from ._atomic import _try_fsync_parent_dir
 from ._dvc_ops import DvcOpError, DvcOps
 from ._registry_git_ops import GitOpError, GitTagAlreadyExists, RegistryGitOps
 from .catalog import CatalogClient, CatalogNotFound, FieldChange, _dict_diff, _diff_entries
@@ -107,12 +109,19 @@ def prepare_publish(
     now: datetime | None = None,
 ) -> PublishPreview:
     metadata_path = project_path / "metadata.json"
-    findings = check_project(project_path, upgrades=False)
+    # Parse metadata.json once: a valid file feeds both the producer checks
+    # and the bump below. Anything unreadable / invalid is left to
+    # check_project, which reports it as findings.
+    try:
+        loaded: Metadata | None = Metadata.from_json_file(metadata_path)
+    except (OSError, ValueError):
+        loaded = None
+    findings = check_project(project_path, upgrades=False, metadata=loaded)
     error_findings = [f for f in findings if f.severity == "error"]
     if error_findings:
         raise PublishBlocked(error_findings)
 
-    current = Metadata.from_json_file(metadata_path)
+    current = loaded if loaded is not None else Metadata.from_json_file(metadata_path)
     new_version = _resolve_version(current.mint.version, version)
     
     clean = git_ops.is_working_tree_clean(project_path)
@@ -286,14 +295,14 @@ def publish_project(
 
 
 def _resolve_version(current: str, requested: str | None) -> str:
-    m = _SEMVER_RE.match(current)
+    m = _SEMVER_RE.fullmatch(current)
     if not m:
         raise InvalidCurrentVersion(f"current mint.version {current!r} is not valid semver (MAJOR.MINOR.PATCH expected)")
     
     if requested is None:
         return f"{m.group(1)}.{m.group(2)}.{int(m.group(3)) + 1}"
     
-    rm = _SEMVER_RE.match(requested)
+    rm = _SEMVER_RE.fullmatch(requested)
     if not rm:
         raise VersionNotIncreasing(f"requested version {requested!r} is not valid semver")
         
@@ -304,7 +313,7 @@ def _resolve_version(current: str, requested: str | None) -> str:
 
 
 def _semver_tuple(v: str) -> tuple[int, int, int]:
-    m = _SEMVER_RE.match(v)
+    m = _SEMVER_RE.fullmatch(v)
     assert m
     return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
 
@@ -317,8 +326,6 @@ def _atomic_write_json(path: Path, content: str) -> None:
     ensures the rename is durable on POSIX. NOT calling `os.sync()` —
     that's a system-wide flush which can stall on slow filesystems.
     """
-    import os
-    from ._atomic import _try_fsync_parent_dir
     tmp = path.with_suffix(path.suffix + ".tmp")
     tmp.write_text(content, encoding="utf-8")
     with open(tmp, "r+") as f:
@@ -236,8 +236,7 @@ def generate_schema_file(
     })
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(combined, f, indent=2)
+    output_path.write_text(json.dumps(combined, indent=2), encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -106,10 +106,12 @@ class _FakeRegistryGitOps:
         # Mirrors production: -B force-creates-or-resets so retries work.
         self._git(["checkout", "-B", branch], cwd=repo_dir)
 
-    def commit_all(self, repo_dir: Path, message: str) -> None:
+    def commit_all(
+        self, repo_dir: Path, message: str, *, paths: list[str] | None = None,
+    ) -> None:
         if self.commit_all_raises:
             raise self.commit_all_raises
-        self._git(["add", "-A"], cwd=repo_dir)
+        self._git(["add", "--", *paths] if paths else ["add", "-A"], cwd=repo_dir)
         # Configure local user.email/user.name so commits don't require a global config.
         self._git(["-c", "user.email=test@mintd", "-c", "user.name=test", "commit", "-m", message],
                   cwd=repo_dir)
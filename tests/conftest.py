@@ -89,3 +89,22 @@ def s3_versioned():
             Bucket=bucket, VersioningConfiguration={"Status": "Enabled"}
         )
         yield client, bucket
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home_caches(tmp_path_factory, monkeypatch):
+    """Keep mintd's best-effort caches under ~/.cache out of the real home:
+    the enclave parse cache, the Jinja bytecode cache, the cache-push digest
+    store and the ssh ControlMaster socket dir. One test (or run) can't
+    serve another a remembered result, and the suite never writes to the
+    developer's home."""
+    import mintd._cache_ops as cache_ops_mod
+    import mintd._registry_git_ops as registry_git_ops_mod
+    import mintd._templates.engine as engine_mod
+    import mintd.enclave as enclave_mod
+
+    cache_root = tmp_path_factory.mktemp("mintd-cache")
+    monkeypatch.setattr(enclave_mod, "_parse_cache_dir", lambda: cache_root / "enclave")
+    monkeypatch.setattr(engine_mod, "_bytecode_cache_dir", lambda: cache_root / "jinja")
+    monkeypatch.setattr(cache_ops_mod, "_default_digest_dir", lambda: cache_root / "digests")
+    monkeypatch.setattr(registry_git_ops_mod, "_ssh_mux_dir", lambda: cache_root / "ssh")
@@ -112,6 +112,10 @@ def test_has_profile_false_when_file_missing(tmp_path: Path) -> None:
     assert has_profile("mintd", credentials_path=tmp_path / "nope") is False
 
 
+def test_has_profile_false_when_path_is_directory(tmp_path: Path) -> None:
+    assert has_profile("mintd", credentials_path=tmp_path) is False
+
+
 def test_has_profile_false_when_keys_blank(tmp_path: Path) -> None:
     creds = tmp_path / "credentials"
     creds.write_text("[mintd]\naws_access_key_id =\naws_secret_access_key =\n")
@@ -10,6 +10,7 @@ from __future__ import annotations
 import ast
 import os
 import re
+import time
 from pathlib import Path
 
 import pytest
@@ -364,6 +365,22 @@ def test_enumerate_collects_any_repo_files(tmp_path: Path) -> None:
     assert scan.symlinks == [] and scan.refused == [] and scan.empty_args == []
 
 
+def test_enumerate_walks_top_down_in_sorted_order(tmp_path: Path) -> None:
+    # Same order os.walk gave: a directory's own files (sorted), then each
+    # subdirectory depth-first in name order. Sizes come from the walk's stat.
+    _write(tmp_path / "data" / "z.bin", "zz")
+    _write(tmp_path / "data" / "b" / "y.bin", "y")
+    _write(tmp_path / "data" / "a" / "deep" / "x.bin", "xxx")
+    _write(tmp_path / "data" / "a" / "w.bin", "w")
+    scan = _enum(tmp_path, ["data"])
+    assert [(i.rel, i.size) for i in scan.items] == [
+        ("data/z.bin", 2),
+        ("data/a/w.bin", 1),
+        ("data/a/deep/x.bin", 3),
+        ("data/b/y.bin", 1),
+    ]
+
+
 def test_enumerate_collects_a_top_level_file(tmp_path: Path) -> None:
     _write(tmp_path / "notes.txt", "x")
     scan = _enum(tmp_path, ["notes.txt"])
@@ -468,9 +485,8 @@ def test_enumerate_names_each_symlinked_file_individually(tmp_path: Path) -> Non
 def test_enumerate_skips_symlinked_subdirectory_not_silently_dropped(
     tmp_path: Path,
 ) -> None:
-    # A symlinked SUBDIRECTORY must not be silently omitted:
-    # os.walk(followlinks=False) yields its name but never descends, so files
-    # beneath it would vanish from the push with no error/warning/ledger entry.
+    # A symlinked SUBDIRECTORY must not be silently omitted: the walk never
+    # descends into it (no-follow), so files beneath it would vanish from the push with no error/warning/ledger entry.
     outside = tmp_path.parent / "outside"
     (outside).mkdir()
     (outside / "secret.bin").write_text("secret")
@@ -624,6 +640,95 @@ def test_push_incremental_skip_matrix(s3_versioned, tmp_path: Path) -> None:
     assert counter2.calls["upload_file"] == 3
 
 
+def test_push_reuses_digest_of_file_unchanged_since_last_push(
+    s3_versioned, tmp_path: Path, monkeypatch
+) -> None:
+    s3, bucket = s3_versioned
+    proj = _project(tmp_path / "proj", bucket)
+    (proj / "cache").mkdir()
+    f = proj / "cache" / "a.bin"
+    f.write_bytes(b"a" * 64)
+    old = time.time_ns() - 60 * 10**9  # outside the racy window
+    os.utime(f, ns=(old, old))
+    digest_dir = tmp_path / "digests"
+    hashed: list[Path] = []
+    real_sha = c.file_sha256
+    monkeypatch.setattr(c, "file_sha256", lambda p: hashed.append(p) or real_sha(p))
+
+    def _push(**kw):
+        return c.cache_push(
+            project_path=proj, paths=["cache"], config=_cfg(),
+            reporter=Reporter(json_mode=True), s3_client_factory=_factory(s3),
+            digest_dir=digest_dir, **kw,
+        )
+
+    assert _push().uploaded == 1
+    assert len(hashed) == 1
+    assert _push().unchanged == 1
+    assert len(hashed) == 1  # size + mtime matched: remembered digest, no read
+    assert _push(rehash=True).unchanged == 1
+    assert len(hashed) == 2
+
+    # Same size, new content and mtime -> re-hashed, uploaded.
+    f.write_bytes(b"b" * 64)
+    os.utime(f, ns=(old + 10**9, old + 10**9))
+    assert _push().uploaded == 1
+    assert len(hashed) == 3
+
+
+def test_push_forgets_digests_of_files_gone_from_a_pushed_dir(
+    s3_versioned, tmp_path: Path
+) -> None:
+    s3, bucket = s3_versioned
+    proj = _project(tmp_path / "proj", bucket)
+    (proj / "cache").mkdir()
+    (proj / "other").mkdir()
+    old = time.time_ns() - 60 * 10**9  # outside the racy window
+    for rel in ("cache/a.bin", "cache/b.bin", "other/c.bin"):
+        (proj / rel).write_bytes(b"x" * 16)
+        os.utime(proj / rel, ns=(old, old))
+    digest_dir = tmp_path / "digests"
+
+    def _push(paths):
+        c.cache_push(
+            project_path=proj, paths=paths, config=_cfg(),
+            reporter=Reporter(json_mode=True), s3_client_factory=_factory(s3),
+            digest_dir=digest_dir,
+        )
+        return c._LocalDigests.load(digest_dir, proj.resolve())._entries
+
+    # Upload once so the next push HEADs (and so hashes) size-matching files.
+    _push(["cache", "other"])
+    assert set(_push(["cache", "other"])) == {"cache/a.bin", "cache/b.bin", "other/c.bin"}
+
+    (proj / "cache" / "b.bin").rename(proj / "cache" / "renamed.bin")
+    (proj / "other" / "c.bin").unlink()
+    (proj / "other" / "d.bin").write_bytes(b"d")
+    # Only cache/ was walked: its vanished entry goes, other/'s stays.
+    entries = _push(["cache"])
+    assert "cache/b.bin" not in entries
+    assert "cache/a.bin" in entries
+    assert "other/c.bin" in entries
+
+
+def test_push_and_pull_walk_dvc_outs_once(s3_versioned, tmp_path: Path, monkeypatch) -> None:
+    # The collision guard and the tracked-path set share one DVC-out scan.
+    s3, bucket = s3_versioned
+    proj = _project(tmp_path, bucket)
+    (proj / "cache").mkdir()
+    (proj / "cache" / "a.bin").write_bytes(b"a" * 8)
+    walks: list[Path] = []
+    real_discover = c.discover_all_outs
+    monkeypatch.setattr(c, "discover_all_outs", lambda p: walks.append(p) or real_discover(p))
+
+    c.cache_push(project_path=proj, paths=["cache"], config=_cfg(),
+                 reporter=Reporter(json_mode=True), s3_client_factory=_factory(s3))
+    assert len(walks) == 1
+    c.cache_pull(project_path=proj, config=_cfg(),
+                 reporter=Reporter(json_mode=True), s3_client_factory=_factory(s3))
+    assert len(walks) == 2
+
+
 def test_push_metadata_stripped_object_is_never_skipped(s3_versioned, tmp_path: Path) -> None:
     s3, bucket = s3_versioned
     proj = _project(tmp_path, bucket)
@@ -842,25 +947,59 @@ def test_enumeration_stat_toctou_becomes_failed_not_traceback(
     s3_versioned, tmp_path: Path, monkeypatch
 ) -> None:
     # The REAL enumeration stat() TOCTOU (distinct from the test above, which
-    # injects a pre-built _PushItem so the stat at _add_file never runs): os.walk
-    # lists a directory's filenames as a batch, then _add_file stat()s them one
-    # at a time. A file present at walk-time but gone by stat-time must resolve to
-    # a per-file `failed` ledger entry, never a bare FileNotFoundError aborting
-    # the whole push as a raw traceback out of cache_push -> cli.main().
+    # injects a pre-built _PushItem so the stat at _add_file never runs): the
+    # walk lists a directory's entries as a batch, then _add_file stat()s them
+    # one at a time. A file present at walk-time but gone by stat-time must
+    # resolve to a per-file `failed` ledger entry, never a bare FileNotFoundError
+    # aborting the whole push as a raw traceback out of cache_push -> cli.main().
     s3, bucket = s3_versioned
     proj = _project(tmp_path, bucket)
     (proj / "cache").mkdir()
     (proj / "cache" / "ok.bin").write_bytes(b"ok" * 10)
+    ghost = proj / "cache" / "ghost.bin"
+    ghost.write_bytes(b"gone")
+
+    real_scandir = c.os.scandir
+
+    class _Listing:
+        """An already-read scandir result (iterator + context manager)."""
+
+        def __init__(self, entries):
+            self._it = iter(entries)
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            return next(self._it)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def close(self):
+            pass
+
+    def _vanishing_scandir(path="."):
+        with real_scandir(path) as it:
+            entries = list(it)
+        # A producer removes it between the directory listing and _add_file's
+        # stat().
+        ghost.unlink(missing_ok=True)
+        return _Listing(entries)
 
-    real_walk = c.os.walk
+    real_enumerate = c.enumerate_push_items
 
-    def _ghost_walk(top, **kw):
-        for dirpath, dirnames, filenames in real_walk(top, **kw):
-            # A filename that never existed on disk (a producer removed it between
-            # os.walk's directory listing and _add_file's stat()).
-            yield dirpath, dirnames, filenames + ["ghost.bin"]
+    def _enumerate_with_vanishing_file(*args, **kwargs):
+        # Only the push enumeration's listing races; the tracked-outs walk
+        # before it sees the file as usual.
+        with monkeypatch.context() as m:
+            m.setattr(c.os, "scandir", _vanishing_scandir)
+            return real_enumerate(*args, **kwargs)
 
-    monkeypatch.setattr(c.os, "walk", _ghost_walk)
+    monkeypatch.setattr(c, "enumerate_push_items", _enumerate_with_vanishing_file)
     summary = c.cache_push(
         project_path=proj, paths=["cache"], config=_cfg(),
         reporter=Reporter(json_mode=True), jobs=2, s3_client_factory=_factory(s3),
@@ -17,6 +17,7 @@ import pytest
 
 from mintd.catalog import (
     CatalogAlreadyExists,
+    CatalogEntry,
     CatalogClient,
     CatalogFilter,
     CatalogNotFound,
@@ -143,6 +144,54 @@ def test_update_missing_raises_not_found(client: CatalogClient) -> None:
         client.update(_load_metadata(name="never_registered"))
 
 
+def test_git_register_commits_only_the_catalog_entry(
+    tmp_path: Path, remote_registry_empty: Path,
+) -> None:
+    """The PR commit stages just the written yaml — the untracked
+    `.mintd_pending.json` left by an earlier register must not ride along."""
+    import subprocess
+
+    git_client = GitCatalogClient(
+        registry_repo_url=str(remote_registry_empty),
+        work_dir=tmp_path / "cache",
+        git_ops=_FakeRegistryGitOps(),
+    )
+    git_client.register(_load_metadata(name="first"))
+    assert (tmp_path / "cache" / ".mintd_pending.json").is_file()
+    git_client.register(_load_metadata(name="second"))
+
+    tree = subprocess.run(
+        ["git", "ls-tree", "-r", "--name-only", "main"],
+        cwd=str(remote_registry_empty), capture_output=True, text=True, check=True,
+    ).stdout.split()
+    assert ".mintd_pending.json" not in tree
+    assert "catalog/data/second.yaml" in tree
+
+
+def test_git_reads_refresh_cache_once_per_client(
+    tmp_path: Path, remote_registry_empty: Path,
+) -> None:
+    """Repeated fetch/list/status on one client reuse the first refresh;
+    a write leaves main, so the next read refreshes again."""
+    git_ops = _FakeRegistryGitOps()
+    git_client = GitCatalogClient(
+        registry_repo_url=str(remote_registry_empty),
+        work_dir=tmp_path / "cache",
+        git_ops=git_ops,
+    )
+    git_client.register(_load_metadata(name="proj"))
+    resets = len(git_ops.reset_hard_calls)
+
+    git_client.fetch("proj")
+    git_client.fetch("proj")
+    git_client.list()
+    git_client.status("proj")
+    assert len(git_ops.reset_hard_calls) == resets + 1
+
+    git_client.sync()
+    assert len(git_ops.reset_hard_calls) == resets + 2
+
+
 def test_catalog_update_empty_diff_short_circuits_no_git_ops(
     tmp_path: Path, remote_registry_empty: Path,
 ) -> None:
@@ -282,6 +331,14 @@ def test_status_registered_after_register(client: CatalogClient) -> None:
     assert status.state == "registered"
 
 
+def test_status_many_reports_each_name_in_input_order(client: CatalogClient) -> None:
+    client.register(_load_metadata(name="data_alpha"))
+    result = client.status_many(["unknown", "data_alpha"])
+    assert list(result) == ["unknown", "data_alpha"]
+    assert result["unknown"].state == "not_found"
+    assert result["data_alpha"].state == "registered"
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -328,6 +385,22 @@ def test_catalog_entry_repo_url_property(client: CatalogClient) -> None:
     assert entry.repo_url == "https://github.com/example-org/provider-xw"
 
 
+def test_catalog_entry_properties_read_fields_without_dumping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    entry = CatalogEntry.model_validate(
+        {"project": {"name": "alpha", "type": "data"}, "metadata": {"description": 7}}
+    )
+
+    def _no_dump(self, **kwargs):
+        raise AssertionError("property access dumped the whole entry")
+
+    monkeypatch.setattr(CatalogEntry, "model_dump", _no_dump)
+    assert (entry.name, entry.project_type) == ("alpha", "data")
+    assert entry.description == ""  # non-str
+    assert entry.repo_url == ""  # missing
+
+
 # ---------------------------------------------------------------------------
 # Slice 36 — Pattern C: phase relabeling via reporter.update_status
 # ---------------------------------------------------------------------------
@@ -384,3 +457,18 @@ def test_catalog_update_updates_status_between_phases(
         "Pushing to registry...",
         "Opening PR...",
     ]
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/org/registry", "https://github.com/org/registry/pull/7"),
+        ("https://github.com/org/registry.git", "https://github.com/org/registry/pull/7"),
+        ("git@github.com:org/registry.git", "https://github.com/org/registry/pull/7"),
+        ("/tmp/bare/registry.git", None),
+    ],
+)
+def test_pr_url_from_registry_url(url: str, expected: str | None) -> None:
+    from mintd.catalog import _pr_url
+
+    assert _pr_url(url, 7) == expected
@@ -84,6 +84,25 @@ def test_ensure_fresh_picks_up_remote_change(tmp_path: Path, remote_registry: Pa
     assert entry is not None
 
 
+def test_ensure_fresh_skips_checkout_when_already_on_main(
+    tmp_path: Path, remote_registry: Path
+) -> None:
+    work = tmp_path / "cache"
+    cache = _make_cache(remote_registry, work)
+    cache.ensure_fresh()
+    checkouts: list[str] = []
+    real_checkout = cache._git_ops.checkout
+    cache._git_ops.checkout = lambda d, ref, **kw: (checkouts.append(ref), real_checkout(d, ref, **kw))  # type: ignore[method-assign]
+
+    cache.ensure_fresh()
+    assert checkouts == []
+
+    cache._git_ops.checkout_new_branch(work, "register/stuck")
+    cache.ensure_fresh()
+    assert checkouts == ["main"]
+    assert (work / ".git" / "HEAD").read_text().strip() == "ref: refs/heads/main"
+
+
 # ---------------------------------------------------------------------------
 # read_entry / list_entries
 # ---------------------------------------------------------------------------
@@ -96,6 +115,34 @@ def test_read_entry_returns_none_for_missing(tmp_path: Path, remote_registry: Pa
     assert cache.read_entry("does_not_exist") is None
 
 
+def test_has_entry_reports_existence(tmp_path: Path, remote_registry: Path) -> None:
+    work = tmp_path / "cache"
+    cache = _make_cache(remote_registry, work)
+    cache.ensure_fresh()
+    assert cache.has_entry("seed_alpha")
+    assert not cache.has_entry("does_not_exist")
+
+
+def test_entry_names_lists_every_type_dir(tmp_path: Path, remote_registry: Path) -> None:
+    work = tmp_path / "cache"
+    cache = _make_cache(remote_registry, work)
+    cache.ensure_fresh()
+    (work / "catalog" / "code").mkdir(exist_ok=True)
+    (work / "catalog" / "code" / "tool_beta.yaml").write_text("project: {}\n")
+    (work / "catalog" / "stray").mkdir()
+    (work / "catalog" / "stray" / "ignored.yaml").write_text("project: {}\n")
+    assert cache.entry_names() == {"seed_alpha", "tool_beta"}
+
+
+def test_has_entry_ignores_non_type_dirs(tmp_path: Path, remote_registry: Path) -> None:
+    work = tmp_path / "cache"
+    cache = _make_cache(remote_registry, work)
+    cache.ensure_fresh()
+    (work / "catalog" / "stray").mkdir()
+    (work / "catalog" / "stray" / "ghost.yaml").write_text("project: {}\n")
+    assert not cache.has_entry("ghost")
+
+
 def test_read_entry_returns_seed(tmp_path: Path, remote_registry: Path) -> None:
     work = tmp_path / "cache"
     cache = _make_cache(remote_registry, work)
@@ -114,6 +161,21 @@ def test_list_entries_walks_all_type_dirs(tmp_path: Path, remote_registry: Path)
     assert "seed_alpha" in names
 
 
+def test_list_entries_orders_by_type_dir_then_name(
+    tmp_path: Path, remote_registry: Path
+) -> None:
+    work = tmp_path / "cache"
+    cache = _make_cache(remote_registry, work)
+    cache.ensure_fresh()
+    for type_name, name in [("code", "aaa_tool"), ("data", "zzz_data")]:
+        (work / "catalog" / type_name).mkdir(exist_ok=True)
+        (work / "catalog" / type_name / f"{name}.yaml").write_text(
+            f"project:\n  name: {name}\n  type: {type_name}\n"
+        )
+    names = [e.model_dump()["project"]["name"] for e in cache.list_entries()]
+    assert names == ["seed_alpha", "zzz_data", "aaa_tool"]
+
+
 def test_list_entries_filter_by_type(tmp_path: Path, remote_registry: Path) -> None:
     work = tmp_path / "cache"
     cache = _make_cache(remote_registry, work)
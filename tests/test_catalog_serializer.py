@@ -13,7 +13,7 @@ from pathlib import Path
 
 import yaml
 
-from mintd._catalog_serializer import deserialize, serialize
+from mintd._catalog_serializer import deserialize, serialize, serialize_entry
 from mintd.model import CATALOG_EXCLUDED_PATHS, Metadata
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -52,6 +52,16 @@ def test_round_trip_preserves_full_catalog_subset():
     assert _round(entry.model_dump()) == _round(m.to_catalog_entry().model_dump())
 
 
+def test_serialize_entry_matches_serialize_and_round_trips():
+    """Dumping a pre-projected entry is byte-identical to `serialize`, and
+    parsing it back yields the same entry (what `update`'s diff relies on)."""
+    m = _full_metadata()
+    entry = m.to_catalog_entry()
+    text = serialize_entry(entry)
+    assert text == serialize(m)
+    assert deserialize(text).model_dump() == entry.model_dump()
+
+
 def test_round_trip_preserves_storage():
     """storage.* is now in the catalog yaml."""
     m = _full_metadata()
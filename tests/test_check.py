@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import shutil
+import threading
 from pathlib import Path
 
 import pytest
@@ -47,6 +48,43 @@ def test_check_clean_file_returns_empty(tmp_path: Path):
     assert findings == []
 
 
+def test_check_uses_preloaded_metadata_without_reparsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Callers that already validated metadata.json (registry register,
+    publish) hand it in; the producer checks don't parse the file again."""
+    shutil.copy(MINIMAL, tmp_path / "metadata.json")
+    meta = Metadata.from_json_file(tmp_path / "metadata.json")
+
+    def _no_parse(*a, **kw):
+        raise AssertionError("metadata.json re-validated")
+
+    monkeypatch.setattr(Metadata, "model_validate_json", _no_parse)
+    assert check_project(tmp_path, metadata=meta) == []
+
+
+def test_check_valid_file_parses_json_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Valid metadata.json goes straight to pydantic; the stdlib parse only
+    runs to word a failure."""
+    from types import SimpleNamespace
+
+    import mintd.check as check_mod
+
+    shutil.copy(MINIMAL, tmp_path / "metadata.json")
+
+    def _no_stdlib_parse(*a, **kw):
+        raise AssertionError("stdlib json parse on the happy path")
+
+    monkeypatch.setattr(
+        check_mod,
+        "json",
+        SimpleNamespace(loads=_no_stdlib_parse, JSONDecodeError=json.JSONDecodeError),
+    )
+    assert check_project(tmp_path) == []
+
+
 # ---------------------------------------------------------------------------
 # Failure modes
 # ---------------------------------------------------------------------------
@@ -71,6 +109,18 @@ def test_check_missing_file_returns_error(tmp_path: Path):
     assert "metadata.json" in f.message
 
 
+def test_check_on_regular_file_reports_missing_metadata(tmp_path: Path):
+    """A path that is a file, not a project directory, is reported as a
+    missing metadata.json rather than raising NotADirectoryError."""
+    not_a_project = tmp_path / "notes.txt"
+    not_a_project.write_text("x")
+
+    findings = check_project(not_a_project)
+
+    assert [f.kind for f in findings] == ["metadata_missing"]
+    assert "metadata.json not found" in findings[0].message
+
+
 def test_check_malformed_json_returns_error(tmp_path: Path):
     """When metadata.json contains malformed JSON, return an error finding.
 
@@ -376,6 +426,31 @@ def test_upgrades_walk_continues_after_one_error(tmp_path: Path):
     assert sum(1 for f in consumer_findings if f.severity == "info") == 2
 
 
+def test_upgrades_resolves_imports_concurrently_in_scan_order(tmp_path: Path):
+    _write_metadata(tmp_path)
+    _stage_dvc_fixture(tmp_path, "standalone_import.dvc", "dep1.dvc")
+    _stage_dvc_fixture(tmp_path, "standalone_import.dvc", "dep2.dvc")
+    dep2 = tmp_path / "data" / "imports" / "dep2.dvc"
+    dep2.write_text(dep2.read_text(encoding="utf-8").replace("provider-xw", "other2"))
+
+    # Both pin resolves must be in flight at once to get past the barrier;
+    # a serial walk would time out on the first one.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def factory(repo: str, pin: str):
+        if pin != "":
+            barrier.wait()
+        if repo.endswith("other2"):
+            return ProducerError.unreachable(repo, pin, "failed")
+        return _view_with_primary("outputs/cms_based/")
+
+    findings = check_project(tmp_path, upgrades=True, producer_view_factory=factory)
+    consumer_findings = [f for f in findings if f.section == "consumer"]
+
+    assert [f.severity for f in consumer_findings] == ["info", "warning"]
+    assert consumer_findings[1].source.name == "dep2.dvc"
+
+
 def test_upgrades_factory_called_once_per_dep_when_factory_at_head_errors(tmp_path: Path):
     _write_metadata(tmp_path)
     _stage_dvc_fixture(tmp_path, "standalone_import.dvc", "standalone_import.dvc")
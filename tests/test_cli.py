@@ -20,7 +20,12 @@ import pytest
 from mintd.model import FastPullResult
 from tests._fakes.fast_sync_ops import _FakeFastSyncOps
 from mintd import cli
-from mintd.catalog import CatalogAlreadyExists, CatalogNotFound, InMemoryCatalogClient
+from mintd.catalog import (
+    CatalogAlreadyExists,
+    CatalogNotFound,
+    InMemoryCatalogClient,
+    RegistrationStatus,
+)
 from mintd.check import CheckFinding
 from mintd.data import BumpBlocked
 from mintd.model import Metadata
@@ -589,6 +594,23 @@ def test_cli_registry_register_v1_schema_emits_migrate_hint(
     assert "Traceback" not in err
 
 
+def test_load_metadata_v2_parses_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    patched_init_ops,
+) -> None:
+    """A valid v2 file goes straight through pydantic; the stdlib json peek
+    only runs when validation fails."""
+    assert cli.main(["init", "data", "foo", "--path", str(tmp_path)]) == 0
+    path = tmp_path / "data_foo" / "metadata.json"
+
+    def _no_peek(*_a: object, **_k: object) -> None:
+        pytest.fail("json.loads must not run for a valid v2 metadata.json")
+
+    monkeypatch.setattr(cli.json, "loads", _no_peek)
+    assert cli._load_metadata_with_schema_hint(path).project.name == "foo"
+
+
 def test_cli_registry_update_v2_validation_error_renders_clean(
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
@@ -734,6 +756,34 @@ def test_registry_status_no_name_works_without_registry_url(
     assert "no pending registrations" in out
 
 
+def test_registry_status_multiple_names_uses_one_status_many_call(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    cfg = cli.Config(cache_dir=tmp_path)
+    monkeypatch.setattr(
+        "mintd.cli.Config.load",
+        classmethod(lambda cls, path=None: cfg),
+    )
+    calls: list[list[str]] = []
+
+    class _Client:
+        def status_many(self, names: list[str]) -> dict[str, Any]:
+            calls.append(list(names))
+            return {
+                "data_a": RegistrationStatus(state="registered"),
+                "data_b": RegistrationStatus(state="pending", pr_number=7),
+            }
+
+    monkeypatch.setattr("mintd.cli._resolve_catalog_client", lambda config: _Client())
+
+    rc = cli.main(["registry", "status", "data_a", "data_b"])
+    out = capsys.readouterr().out
+    assert rc == 0
+    assert calls == [["data_a", "data_b"]]
+    assert "data_a: registered" in out
+    assert "data_b: pending (PR #7)" in out
+
+
 # ---------------------------------------------------------------------------
 # Subprocess smoke (Decision #6 hybrid)
 # ---------------------------------------------------------------------------
@@ -758,6 +808,47 @@ def test_python_m_mintd_version_smoke() -> None:
     assert reported  # non-empty
     assert reported == pkg_version("mintd")  # CLI derives from installed metadata
 
+
+def test_building_parser_defers_version_lookup() -> None:
+    """The dist-info scan behind ``__version__`` only runs for ``--version``."""
+    code = (
+        "import mintd, mintd.cli; mintd.cli._build_parser(); "
+        "print('__version__' in vars(mintd))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=15
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_importing_cli_does_not_import_boto3() -> None:
+    """boto3 is imported on first S3 use, so `--help` / local verbs skip it."""
+    code = "import sys, mintd.cli; print('boto3' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=15
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+
+def test_importing_cli_defers_verb_specific_modules() -> None:
+    """Modules behind one verb group load only when one of its verbs runs."""
+    deferred = (
+        "mintd.config_ops", "mintd.metadata_migrate",
+        "mintd._cache_ops", "mintd._share_ops", "mintd._s3_listing_ops",
+    )
+    code = (
+        "import sys, mintd.cli; "
+        f"print(sorted(m for m in {deferred!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=15
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
 def test_data_list_catalog_empty(patched_clients, capsys):
     cli.main(["data", "list"])
     out, _ = capsys.readouterr()
@@ -794,6 +885,15 @@ def test_data_list_imported_populated(patched_clients, capsys, tmp_path, monkeyp
     assert "provider-xw" in out
     assert "4f7c2a1" in out
 
+def test_data_list_imported_scans_path_flag(patched_clients, capsys, tmp_path, monkeypatch):
+    project = tmp_path / "proj"
+    project.mkdir()
+    _stage_dvc_import(project)
+    monkeypatch.chdir(tmp_path)
+    cli.main(["data", "list", "--imported", "--path", str(project)])
+    out, _ = capsys.readouterr()
+    assert "provider-xw" in out
+
 def test_data_list_imported_with_type_exits_64(patched_clients, capsys):
     # Slice 25: handler now uses reporter.error + return 2 (architectural
     # consistency) instead of argparse's SystemExit(64) for arg-combo errors.
@@ -904,6 +1004,19 @@ def test_cli_data_list_json_does_not_truncate(patched_clients, capsys):
     assert payload[0]["description"] == long_desc
 
 
+def test_cli_data_list_json_skips_table_render(patched_clients, capsys, monkeypatch):
+    """Scripting consumers (`--json`) never pay for the pretty table."""
+    client, _ = patched_clients
+    _register_with_type(client, "alpha", "data", "Alpha desc")
+
+    def _boom(*a, **k):
+        raise AssertionError("table rendered in --json mode")
+
+    monkeypatch.setattr(cli, "_render_catalog_table", _boom)
+    assert cli.main(["--json", "data", "list"]) == 0
+    assert json.loads(capsys.readouterr().out)[0]["name"] == "alpha"
+
+
 # Slice 22: data pull friendly DVC-repo probe ------------------------------
 
 
@@ -1167,6 +1280,18 @@ transferred: []
     assert "provider-xw" in out
     assert "other-provider" not in out
 
+def test_enclave_list_emits_listing_in_one_write(patched_clients, capsys, tmp_path, monkeypatch):
+    manifest_path = tmp_path / "enclave_manifest.yaml"
+    shutil.copy(ENCLAVE_FIXTURE, manifest_path)
+    calls: list[tuple] = []
+    real_print = print
+    monkeypatch.setattr("builtins.print", lambda *a, **k: (calls.append(a), real_print(*a, **k)))
+    cli.main(["enclave", "list", "--manifest", str(manifest_path)])
+    out, _ = capsys.readouterr()
+    assert len(calls) == 1
+    assert out.splitlines()[0] == "approved_products:"
+    assert out.endswith("\n")
+
 def test_enclave_list_missing_manifest_exits_one(patched_clients, capsys, tmp_path):
     rc = cli.main(["enclave", "list", "--manifest", str(tmp_path / "nope.yaml")])
     assert rc == 1
@@ -1464,6 +1589,20 @@ def test_init_data_project_happy_path(
     assert patched_init_ops.dvc_calls == [project_path]
 
 
+def test_init_lists_created_files_relative_to_cwd(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    patched_init_ops,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    rc = cli.main(["init", "data", "my_proj", "--path", "."])
+    assert rc == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert "created: data_my_proj/metadata.json" in lines
+    assert lines[-3:] == ["initialized: git", "initialized: dvc", "Next: cd data_my_proj"]
+
+
 def test_init_use_current_repo_writes_into_path(
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
@@ -1955,8 +2094,8 @@ def test_cli_config_validate_shows_connectivity_status(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, recording_reporter
 ) -> None:
     monkeypatch.setattr("mintd.cli.Config.load", classmethod(lambda cls, path=None: cls()))
-    monkeypatch.setattr("mintd.cli.config_ops.validate_config", lambda *a, **k: [])
-    monkeypatch.setattr("mintd.cli.config_ops.render_validation", lambda *a, **k: ("ok", 0))
+    monkeypatch.setattr("mintd.config_ops.validate_config", lambda *a, **k: [])
+    monkeypatch.setattr("mintd.config_ops.render_validation", lambda *a, **k: ("ok", 0))
     cli.main(["config", "validate"])
     assert ("status", "Validating S3 connectivity...") in recording_reporter.events
 
@@ -2447,7 +2586,7 @@ def test_cli_config_validate_success_shows_target_and_latency(
 
     monkeypatch.setattr("mintd.cli.Config.load", classmethod(lambda cls, path=None: _Cfg()))
     monkeypatch.setattr(
-        "mintd.cli.config_ops.validate_config",
+        "mintd.config_ops.validate_config",
         lambda *a, **k: [ValidationStep(name="s3", status="ok", message="ok", latency_ms=42)],
     )
     rc = cli.main(["config", "validate", "--bucket", "my-bucket"])
@@ -2685,3 +2824,94 @@ def test_cli_data_clone_zero_pull_errors_keeps_success_line(
         "cloned provider-xw" in msg
         for _, msg in recording_reporter.events_of("success")
     )
+
+
+def test_cli_data_list_multiline_description_shows_first_line(patched_clients, capsys):
+    """Only the first line of a multi-line description is rendered; CRLF
+    line endings don't leak a stray ``\\r`` into the row."""
+    client, _ = patched_clients
+    _register_with_type(client, "multi", "data", "First line\r\nSecond line\nThird")
+    cli.main(["data", "list"])
+    out = capsys.readouterr().out
+    row = next(line for line in out.splitlines() if "multi" in line)
+    assert row.rstrip().endswith("First line")
+    assert "Second line" not in out
+    assert "\r" not in out
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["cache", "push", "x"],
+        ["cache", "pull"],
+        ["cache", "ls"],
+        ["data", "pull"],
+        ["data", "verify"],
+        ["publish"],
+    ],
+)
+def test_project_path_flag_shared_default(argv: list[str]) -> None:
+    """Every project-root verb takes the same `--path` (default: cwd)."""
+    parser = cli._build_parser()
+    assert parser.parse_args(argv).path == Path(".")
+    assert parser.parse_args([*argv, "--path", "proj"]).path == Path("proj")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["enclave", "bump", "r"],
+        ["enclave", "list"],
+        ["enclave", "add", "r"],
+        ["enclave", "remove", "r"],
+        ["enclave", "pull"],
+        ["enclave", "package"],
+        ["enclave", "verify", "x"],
+    ],
+)
+def test_enclave_manifest_flag_shared_default(argv: list[str]) -> None:
+    """Every enclave verb takes the same `--manifest` (default: ./enclave_manifest.yaml)."""
+    parser = cli._build_parser()
+    assert parser.parse_args(argv).manifest == Path("enclave_manifest.yaml")
+    assert parser.parse_args([*argv, "--manifest", "m.yaml"]).manifest == Path("m.yaml")
+
+
+@pytest.mark.parametrize("verb", ["add", "remove"])
+def test_enclave_subscription_scope_flags_are_exclusive(verb: str) -> None:
+    parser = cli._build_parser()
+    args = parser.parse_args(["enclave", verb, "r", "--source-path", "out/"])
+    assert (args.source_path, args.all_outputs) == ("out/", False)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["enclave", verb, "r", "--source-path", "out/", "--all"])
+
+
+def test_project_type_and_language_choices_are_shared() -> None:
+    """`init` and `data list --type` accept the same project types, in the
+    canonical order `data list` groups by."""
+    parser = cli._build_parser()
+    assert parser.parse_args(["init", "enclave", "x", "--lang", "stata"]).lang == "stata"
+    assert parser.parse_args(["data", "list", "--type", "code"]).project_type == "code"
+    assert cli._CATALOG_TYPE_ORDER is cli._PROJECT_TYPES
+    with pytest.raises(SystemExit):
+        parser.parse_args(["init", "widget", "x"])
+
+
+def test_data_ls_payload_counts_files_only_and_hints_first_file() -> None:
+    from mintd._s3_listing_ops import S3ListingResult, S3Object
+
+    result = S3ListingResult(
+        bucket="b",
+        prefix="p/",
+        endpoint="",
+        objects=[
+            S3Object(key="raw/", size=0, last_modified=None, version_count=0, is_dir=True),
+            S3Object(key="a.parquet", size=10, last_modified=None, version_count=1),
+            S3Object(key="final/", size=0, last_modified=None, version_count=0, is_dir=True),
+            S3Object(key="b.parquet", size=32, last_modified=None, version_count=1),
+        ],
+        truncated_to_prefix="data/",
+    )
+    payload = cli._data_ls_payload("prod", result, include_versions=False)
+    assert (payload["file_count"], payload["dir_count"], payload["total_bytes"]) == (2, 2, 42)
+    assert len(payload["objects"]) == 4
+    assert payload["hint"] == "mintd data pull prod data/a.parquet"
@@ -20,6 +20,12 @@ def test_load_missing_file_returns_defaults(tmp_path: Path) -> None:
     assert cfg.timeouts.transfer is None
 
 
+def test_load_directory_path_returns_defaults(tmp_path: Path) -> None:
+    (tmp_path / "config.yaml").mkdir()
+    cfg = Config.load(tmp_path / "config.yaml")
+    assert cfg == Config()
+
+
 def test_load_valid_yaml() -> None:
     cfg = Config.load(FIXTURE)
     assert cfg.registry_url == "https://example.com/registry.git"
@@ -51,6 +57,31 @@ def test_legacy_dvc_timeout_key_raises_clear_error(tmp_path: Path) -> None:
     assert "timeouts" in str(exc.value).lower()
 
 
+def test_load_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    import mintd._config as config_mod
+    import mintd._yaml as yaml_mod
+
+    monkeypatch.setattr(config_mod, "_CONFIG_CACHE", {})
+    path = tmp_path / "config.yaml"
+    path.write_text("registry_url: https://example.com/a.git\n")
+    settled = path.stat().st_mtime_ns - 10_000_000_000
+    os.utime(path, ns=(settled, settled))
+    first = Config.load(path)
+
+    real_load = yaml_mod.safe_load
+    monkeypatch.setattr(yaml_mod, "safe_load", lambda _raw: pytest.fail("re-parsed"))
+    second = Config.load(path)
+    assert second == first and second is not first
+
+    monkeypatch.setattr(yaml_mod, "safe_load", real_load)
+    path.write_text("registry_url: https://example.com/b.git\n")
+    assert Config.load(path).registry_url == "https://example.com/b.git"
+
+
 def test_resolved_cache_dir_defaults_when_none() -> None:
     cfg = Config()
     assert cfg.resolved_cache_dir() == Path.home() / ".cache" / "mintd"
@@ -86,3 +117,16 @@ def test_aws_profile_name_no_credentials_file(tmp_path: Path) -> None:
     home.mkdir()
     with patch("pathlib.Path.home", return_value=home):
         assert Config().aws_profile_name is None
+
+
+def test_aws_profile_name_resolved_once_per_instance(tmp_path: Path) -> None:
+    home = tmp_path / "home"
+    (home / ".aws").mkdir(parents=True)
+    creds = home / ".aws" / "credentials"
+    creds.write_text("[mintd]\naws_access_key_id = 123\n")
+    with patch("pathlib.Path.home", return_value=home):
+        cfg = Config()
+        assert cfg.aws_profile_name == "mintd"
+        creds.unlink()
+        assert cfg.aws_profile_name == "mintd"
+        assert Config().aws_profile_name is None
@@ -39,6 +39,17 @@ def test_render_config_yaml_omits_none() -> None:
     assert "fast: 30.0" in out
 
 
+def test_render_config_reuses_write_render_for_echo(tmp_path: Path) -> None:
+    """`config setup` writes render_config(config) and then echoes it; the
+    echo must not re-serialize."""
+    render_config.cache_clear()
+    config = apply_set_updates(tmp_path / "c.yaml", [("author", "Jane")])
+    before = render_config.cache_info()
+    text = render_config(config)
+    assert render_config.cache_info().hits == before.hits + 1
+    assert (tmp_path / "c.yaml").read_text(encoding="utf-8") == text
+
+
 def test_render_config_json() -> None:
     cfg = Config(registry_url="x")
     out = render_config(cfg, json_out=True)
@@ -64,6 +75,27 @@ def test_apply_set_writes_atomic(tmp_path: Path) -> None:
     assert not (tmp_path / "cfg.yaml.tmp").exists()
 
 
+def test_apply_set_skips_write_when_config_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Re-applying the values already on disk leaves the file untouched —
+    no tmp write, fsync or rename."""
+    from mintd import config_ops
+
+    p = tmp_path / "cfg.yaml"
+    apply_set_updates(p, [("author", "someone")])
+    before = p.read_bytes()
+
+    fsyncs: list[Path] = []
+    monkeypatch.setattr(config_ops, "_try_fsync_parent_dir", fsyncs.append)
+    apply_set_updates(p, [("author", "someone")])
+    assert fsyncs == []
+    assert p.read_bytes() == before
+
+    apply_set_updates(p, [("author", "someone-else")])
+    assert fsyncs == [p]
+
+
 def test_apply_set_validates_types(tmp_path: Path) -> None:
     p = tmp_path / "cfg.yaml"
     with pytest.raises(ConfigError):
@@ -166,6 +198,17 @@ def test_validate_reports_aws_profile_when_present(
     assert "mintd" in profile_step.message
 
 
+def test_validate_uses_preloaded_config_without_reparsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _boom(cls, path=None):
+        raise AssertionError("Config.load must not be called")
+
+    monkeypatch.setattr("mintd.config_ops.Config.load", classmethod(_boom))
+    steps = validate_config(tmp_path / "cfg.yaml", config=Config(registry_url="x"))
+    assert steps[0].status == "ok"
+
+
 def test_validate_s3_head_bucket_success(tmp_path: Path) -> None:
     cfg = tmp_path / "cfg.yaml"
     cfg.write_text("registry_url: x\n")
@@ -1,6 +1,18 @@
+import io
 import logging
+
+from rich.console import Console
+
 from mintd._console import Reporter
 
+
+def _tty_reporter() -> Reporter:
+    """A Reporter whose stderr console believes it is a terminal, so the
+    spinner / progress machinery actually runs under pytest."""
+    reporter = Reporter(no_color=True)
+    reporter._stderr = Console(file=io.StringIO(), no_color=True, force_terminal=True)
+    return reporter
+
 def test_reporter_json_suppression(capsys):
     reporter = Reporter(json_mode=True)
     reporter.info("should not show")
@@ -80,7 +92,7 @@ def test_progress_suppressed_when_total_zero(capsys):
 def test_progress_suspends_and_resumes_active_status():
     """Opening progress inside an active status block suspends the status
     for the duration; resumes on exit with the same base text."""
-    reporter = Reporter(no_color=True)
+    reporter = _tty_reporter()
     # Open a status (slice 25 spinner machinery)
     with reporter.status("Cloning foo..."):
         before_status = reporter._active_status
@@ -99,7 +111,7 @@ def test_progress_suspends_and_resumes_active_status():
 
 def test_reporter_update_status_updates_label():
     """Pattern C: update_status mutates the active status spinner's label."""
-    reporter = Reporter(no_color=True)
+    reporter = _tty_reporter()
     with reporter.status("A"):
         assert reporter._status_base == "A"
         reporter.update_status("B")
@@ -122,7 +134,7 @@ def test_reporter_update_status_noop_when_no_active_status():
 
 def test_reporter_update_progress_desc_updates_description():
     """Pattern D: update_progress_desc changes the active Progress task's desc."""
-    reporter = Reporter(no_color=True)
+    reporter = _tty_reporter()
     with reporter.progress(100, desc="A") as adv:
         assert reporter._active_progress is not None
         assert reporter._progress_task_id is not None
@@ -156,7 +168,7 @@ def test_reporter_status_resets_active_status_on_exit():
     Manifested in `mintd data clone` as the spinner showing
     'Cloning <name> repository...' during dvc checkout / trailing
     dvc pull even though the git-clone phase had long finished."""
-    reporter = Reporter(no_color=True)
+    reporter = _tty_reporter()
     with reporter.status("Cloning foo repository..."):
         assert reporter._active_status is not None
     # Critical: status closed → reference must be cleared.
@@ -167,3 +179,94 @@ def test_reporter_status_resets_active_status_on_exit():
     with reporter.progress(100, desc="pulling") as adv:
         adv(10)
     assert reporter._active_status is None
+
+
+def test_status_and_progress_skip_live_rendering_off_tty(capsys):
+    """Piped / CI stderr: no spinner or progress widget is started, so no
+    refresh thread runs and nothing lands in the log."""
+    reporter = Reporter(no_color=True)
+    assert not reporter._stderr.is_terminal
+    with reporter.status("Pushing..."):
+        assert reporter._active_status is None
+        reporter.update_status("still pushing")
+        with reporter.progress(100, desc="x") as adv:
+            assert reporter._active_progress is None
+            adv(100)
+    _, err = capsys.readouterr()
+    assert err == ""
+
+
+def test_status_spinner_not_started_for_fast_blocks():
+    """A block that ends before the start delay never brings up the Live
+    display (no thread, no cursor-hide escape codes)."""
+    reporter = _tty_reporter()
+    with reporter.status("Quick...") as st:
+        assert not st._live.is_started
+    assert not st._live.is_started
+    assert reporter._stderr.file.getvalue() == ""
+
+
+def test_status_spinner_starts_after_delay(monkeypatch):
+    import time
+
+    import mintd._console as console_mod
+
+    monkeypatch.setattr(console_mod, "_STATUS_START_DELAY_S", 0.0)
+    reporter = _tty_reporter()
+    with reporter.status("Slow...") as st:
+        deadline = time.monotonic() + 2
+        while not st._live.is_started and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert st._live.is_started
+    assert not st._live.is_started
+    assert reporter._active_status is None
+
+
+def test_importing_console_defers_live_widgets():
+    """rich.status / rich.progress load on first spinner or bar, not at
+    import — `--help` and the list/show verbs never draw one."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mintd.cli; "
+        "print(any(m in sys.modules for m in ('rich.status', 'rich.progress', 'rich.live')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=15
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+def test_passthrough_stderr_keeps_only_the_live_tick(capsys):
+    """A \r-only progress stream (no spinner, e.g. piped to a log) must not
+    accumulate its overwritten history; the final line still prints once."""
+    reporter = Reporter(no_color=True)
+    for pct in range(100):
+        reporter.passthrough_stderr(f"Receiving objects: {pct:3d}% ({pct}/99)\r")
+    assert reporter._stderr_buf == "\r"
+    reporter.passthrough_stderr("Receiving objects: 100% (99/99), done.\n")
+    _, err = capsys.readouterr()
+    assert err == "Receiving objects: 100% (99/99), done.\n"
+
+
+def test_passthrough_stderr_spinner_shows_last_complete_tick():
+    reporter = _tty_reporter()
+    with reporter.status("Cloning") as status:
+        reporter.passthrough_stderr("Receiving 10%\rReceiving 2")
+        assert "Receiving 10%" in str(status.renderable.text)
+        reporter.passthrough_stderr("0%\rRecei")
+        assert "Receiving 20%" in str(status.renderable.text)
+        assert reporter._stderr_buf == "\rRecei"
+
+
+def test_error_and_hint_lines_render_in_one_print(monkeypatch):
+    reporter = Reporter(no_color=True)
+    calls = []
+    monkeypatch.setattr(reporter._stderr, "print", lambda *a, **k: calls.append(a))
+    reporter.error("push failed", hint="check credentials\nor retry with -v")
+    assert calls == [("error: push failed\n  hint: check credentials\n  hint: or retry with -v",)]
+
+    calls.clear()
+    reporter.passthrough_stderr("Counting\rCounting done\nCompressing: 5%\rCompressing done\npartial")
+    assert calls == [("Counting done\nCompressing done",)]
@@ -235,7 +235,7 @@ class _AssertNotFetchedClient:
         raise AssertionError("update should not be called")
 
 
-@pytest.mark.parametrize("bad_name", ["../escape", "foo/bar", "..", ".", ""])
+@pytest.mark.parametrize("bad_name", ["../escape", "foo/bar", "foo\\bar", "a..b", "..", ".", ""])
 def test_clone_and_pull_product_rejects_bad_name(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, bad_name: str
 ) -> None:
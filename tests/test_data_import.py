@@ -290,6 +290,26 @@ def test_import_product_refuses_existing_dvc(tmp_path: Path) -> None:
     assert fake.calls == []
 
 
+def test_import_product_all_outputs_checks_conflicts_before_importing(
+    tmp_path: Path,
+) -> None:
+    """A conflict on a later output is caught before any `dvc import` runs."""
+    client = InMemoryCatalogClient()
+    _register(
+        client,
+        mutate=_with_outputs("outputs/a.csv", "outputs/b.csv", "outputs/c.csv"),
+    )
+    fake = _FakeDvcOps()
+    (tmp_path / "data_provider_xw").mkdir(parents=True)
+    (tmp_path / "data_provider_xw" / "c.csv.dvc").write_text("preexisting")
+
+    with pytest.raises(ImportDestinationExists, match="c.csv.dvc"):
+        import_product(
+            client, fake, "provider_xw", all_outputs=True, dest_root=tmp_path
+        )
+    assert fake.calls == []
+
+
 def test_import_product_force_overwrites(tmp_path: Path) -> None:
     client = InMemoryCatalogClient()
     _register(client, mutate=_with_primary("outputs/main.parquet"))
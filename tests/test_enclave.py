@@ -33,6 +33,156 @@ def test_save_missing_parent_dir_raises_filenotfound(tmp_path):
     with pytest.raises(FileNotFoundError):
         EnclaveManifest(enclave_name="test").save(tmp_path / "nonexistent" / "out.yaml")
 
+def test_save_unchanged_manifest_skips_write(tmp_path, monkeypatch):
+    import mintd.enclave as enclave_mod
+
+    p = tmp_path / "out.yaml"
+    m = EnclaveManifest.load(FIXTURE)
+    m.save(p)
+    fsyncs = []
+    monkeypatch.setattr(enclave_mod, "_try_fsync_parent_dir", fsyncs.append)
+    EnclaveManifest.load(p).save(p)
+    assert fsyncs == []
+    m.model_copy(update={"enclave_name": "renamed"}).save(p)
+    assert fsyncs == [p]
+
+def test_manifest_roundtrip_uses_shared_yaml_helpers(tmp_path, monkeypatch):
+    import mintd._yaml as yaml_mod
+
+    calls = []
+    real_load, real_dump = yaml_mod.safe_load, yaml_mod.safe_dump
+    monkeypatch.setattr(yaml_mod, "safe_load", lambda s: calls.append("load") or real_load(s))
+    monkeypatch.setattr(yaml_mod, "safe_dump", lambda d, **kw: calls.append("dump") or real_dump(d, **kw))
+    src = tmp_path / "in.yaml"
+    src.write_bytes(FIXTURE.read_bytes())
+    p = tmp_path / "out.yaml"
+    m = EnclaveManifest.load(src)
+    m.save(p)
+    assert calls == ["load", "dump"]
+    assert EnclaveManifest.load(p) == m
+    assert not p.with_suffix(".yaml.tmp").exists()
+
+def test_load_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    import time
+
+    import mintd._yaml as yaml_mod
+    import mintd.enclave as enclave_mod
+
+    # Every write below lands well outside the racy window.
+    real_time_ns = time.time_ns
+    monkeypatch.setattr(enclave_mod.time, "time_ns", lambda: real_time_ns() + 10_000_000_000)
+    parses = []
+    real_load = yaml_mod.safe_load
+    monkeypatch.setattr(yaml_mod, "safe_load", lambda s: parses.append(1) or real_load(s))
+    p = tmp_path / "enclave_manifest.yaml"
+    p.write_bytes(FIXTURE.read_bytes())
+    first = EnclaveManifest.load(p)
+    first.approved_products.clear()
+    second = EnclaveManifest.load(p)
+    assert len(parses) == 1
+    assert second == EnclaveManifest.load(FIXTURE)
+
+    p.write_text("enclave_name: other\n", encoding="utf-8")
+    assert EnclaveManifest.load(p).enclave_name == "other"
+    assert len(parses) == 2
+
+    renamed = second.model_copy(update={"enclave_name": "saved"})
+    renamed.save(p)
+    assert len(parses) == 3  # save's append-only check parses the on-disk bytes
+    assert EnclaveManifest.load(p).enclave_name == "saved"
+    assert len(parses) == 3  # the reload hits the entry save refreshed
+
+def test_recently_modified_manifest_is_not_kept_in_process(tmp_path):
+    import os
+
+    import mintd.enclave as enclave_mod
+
+    p = tmp_path / "enclave_manifest.yaml"
+    p.write_text("enclave_name: e\n", encoding="utf-8")
+    m = EnclaveManifest.load(p)
+    assert os.path.abspath(p) not in enclave_mod._MANIFEST_CACHE
+    m.model_copy(update={"enclave_name": "f"}).save(p)
+    assert os.path.abspath(p) not in enclave_mod._MANIFEST_CACHE
+
+def test_load_reuses_on_disk_parse_across_processes(tmp_path, monkeypatch):
+    import mintd._yaml as yaml_mod
+    import mintd.enclave as enclave_mod
+
+    p = tmp_path / "enclave_manifest.yaml"
+    p.write_bytes(FIXTURE.read_bytes())
+    expected = EnclaveManifest.load(p)
+    real_load = yaml_mod.safe_load
+
+    # A new process starts with an empty in-memory cache; the YAML must not
+    # be parsed again while the file is unchanged.
+    enclave_mod._MANIFEST_CACHE.clear()
+    monkeypatch.setattr(yaml_mod, "safe_load", lambda s: pytest.fail("re-parsed"))
+    assert EnclaveManifest.load(p) == expected
+
+    monkeypatch.setattr(yaml_mod, "safe_load", real_load)
+    enclave_mod._MANIFEST_CACHE.clear()
+    p.write_text("enclave_name: edited\n", encoding="utf-8")
+    assert EnclaveManifest.load(p).enclave_name == "edited"
+
+def test_on_disk_parse_detects_same_size_same_mtime_replacement(tmp_path):
+    import os
+
+    import mintd.enclave as enclave_mod
+
+    p = tmp_path / "enclave_manifest.yaml"
+    p.write_text("enclave_name: aaaa\n", encoding="utf-8")
+    before = p.stat().st_mtime_ns - 10_000_000_000
+    os.utime(p, ns=(before, before))
+    assert EnclaveManifest.load(p).enclave_name == "aaaa"
+
+    # cp -p / rsync -t / a restore: different bytes, same size and mtime.
+    p.write_text("enclave_name: bbbb\n", encoding="utf-8")
+    os.utime(p, ns=(before, before))
+    enclave_mod._MANIFEST_CACHE.clear()
+    assert EnclaveManifest.load(p).enclave_name == "bbbb"
+
+def test_parse_cache_write_prunes_entries_not_read_for_a_month(tmp_path):
+    import os
+    import time
+
+    import mintd.enclave as enclave_mod
+
+    cache_dir = enclave_mod._parse_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    orphan = cache_dir / "0000000000000000.json"
+    orphan.write_text("x\n{}", encoding="utf-8")
+    old = time.time() - enclave_mod._PARSE_CACHE_MAX_AGE_S - 60
+    os.utime(orphan, (old, old))
+
+    p = tmp_path / "enclave_manifest.yaml"
+    p.write_text("enclave_name: e\n", encoding="utf-8")
+    EnclaveManifest.load(p)
+    assert not orphan.exists()
+    assert enclave_mod._parse_cache_path(os.path.abspath(p)).exists()
+
+def test_non_ascii_manifest_round_trips_through_bytes(tmp_path):
+    p = tmp_path / "enclave_manifest.yaml"
+    p.write_bytes("enclave_name: Sj\u00f6berg-enclave\n".encode("utf-8"))
+    m = EnclaveManifest.load(p)
+    assert m.enclave_name == "Sj\u00f6berg-enclave"
+    m.model_copy(update={"enclave_name": "\u00c5rhus"}).save(p)
+    assert EnclaveManifest.load(p).enclave_name == "\u00c5rhus"
+
+def test_append_only_check_ignores_stale_cached_manifest(tmp_path):
+    import os
+
+    import mintd.enclave as enclave_mod
+
+    p = tmp_path / "base.yaml"
+    item = TransferredItem(repo="r", contract_pin="c", artifact_pin="a", transfer_date=date(2026, 5, 14), transfer_id="t1", local_path="lp")
+    EnclaveManifest(enclave_name="e", transferred=[item]).save(p)
+    # A cache entry whose stat key still matches but whose model predates the
+    # on-disk transferred[] row (a same-size rewrite within one tick).
+    stale = EnclaveManifest(enclave_name="e")
+    enclave_mod._MANIFEST_CACHE[os.path.abspath(p)] = (enclave_mod._stat_key(p), stale)
+    with pytest.raises(AppendOnlyViolation):
+        stale.model_copy(update={"enclave_name": "renamed"}).save(p)
+
 def test_save_appends_transferred_entries_cleanly(tmp_path):
     m = EnclaveManifest.load(FIXTURE)
     new_m = m.model_copy(update={"transferred": [
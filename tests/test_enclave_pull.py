@@ -432,6 +432,23 @@ def test_all_already_downloaded_fires_for_primary(tmp_path):
     assert written == []
 
 
+def test_downloaded_index_keys_match_skip_rules():
+    from mintd.enclave import _DownloadedIndex, _all_already_downloaded, _already_downloaded
+
+    index = _DownloadedIndex([
+        DownloadedItem(repo="a", output="data/final/", contract_pin="1", artifact_pin="p",
+                       fetch_strategy="dvc-import", downloaded_at=datetime.now(), local_path="lp"),
+    ])
+    assert _already_downloaded(index, "a", "data/final/", "1")
+    assert not _already_downloaded(index, "a", "data/other/", "1")
+    assert _all_already_downloaded(index, ApprovedProduct(repo="a", registry_entry="e", pin="1"))
+    assert not _all_already_downloaded(index, ApprovedProduct(repo="a", registry_entry="e", pin="2"))
+    assert not _all_already_downloaded(
+        index, ApprovedProduct(repo="a", registry_entry="e", pin="1", source_path="data/other/")
+    )
+    assert not _all_already_downloaded(index, ApprovedProduct(repo="a", registry_entry="e", pin="1", all=True))
+
+
 def test_pull_force_failure_preserves_failing_products_row(tmp_path):
     """Under --force a row is pruned+re-appended atomically on success; if a
     product's re-import FAILS, its pre-existing downloaded[] row must survive
@@ -130,3 +130,31 @@ def test_remove_source_path_preserves_repo_downloads_dir(tmp_path):
 
     # Output "y" still references downloads/a; the wipe must leave it intact.
     assert (downloads_dir / "marker").exists()
+
+
+def test_remove_keeps_downloads_dir_while_a_downloaded_row_remains(tmp_path):
+    """The approved entry is the repo's last, but a downloaded[] row for a
+    different output still points into downloads/<repo>/ — keep the dir."""
+    m_path = tmp_path / "enclave_manifest.yaml"
+    d_root = tmp_path / "downloads"
+    r_dir = d_root / "a"
+    r_dir.mkdir(parents=True)
+    EnclaveManifest(
+        enclave_name="test",
+        approved_products=[
+            ApprovedProduct(repo="a", registry_entry="e", pin="1", source_path="x"),
+            ApprovedProduct(repo="b", registry_entry="e", pin="1"),
+        ],
+        downloaded=[
+            DownloadedItem(
+                repo="a", output="y", contract_pin="1", artifact_pin="kept",
+                fetch_strategy="dvc-import", downloaded_at=datetime(2026, 1, 1),
+                local_path="downloads/a/kept-2026-01-01",
+            ),
+        ],
+    ).save(m_path)
+    enclave_remove(_Client(), manifest_path=m_path, name="a", source_path="x", downloads_root=d_root)
+    m = EnclaveManifest.load(m_path)
+    assert [ap.repo for ap in m.approved_products] == ["b"]
+    assert [d.output for d in m.downloaded] == ["y"]
+    assert r_dir.is_dir()
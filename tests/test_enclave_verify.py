@@ -163,6 +163,28 @@ def test_verify_rejects_invalid_manifest_yaml(tmp_path: Path) -> None:
         )
 
 
+def test_verify_rejects_missing_transfer_manifest(tmp_path: Path) -> None:
+    extracted = tmp_path / "extracted"
+    extracted.mkdir()
+    m_path = _new_inside_manifest(tmp_path)
+    with pytest.raises(InvalidTransferManifest, match="not found"):
+        enclave_verify(extracted_dir=extracted, manifest_path=m_path)
+    (extracted / "_transfer_manifest.yaml").mkdir()
+    with pytest.raises(InvalidTransferManifest, match="not found"):
+        enclave_verify(extracted_dir=extracted, manifest_path=m_path)
+
+
+def test_verify_rejects_non_utf8_transfer_manifest(tmp_path: Path) -> None:
+    """The manifest is handed to the YAML loader as bytes; undecodable
+    input surfaces as the typed error, not a raw UnicodeDecodeError."""
+    extracted = tmp_path / "extracted"
+    extracted.mkdir()
+    (extracted / "_transfer_manifest.yaml").write_bytes(b"enclave_name: \xff\xfe\xfa\n")
+    m_path = _new_inside_manifest(tmp_path)
+    with pytest.raises(InvalidTransferManifest):
+        enclave_verify(extracted_dir=extracted, manifest_path=m_path)
+
+
 def test_verify_rejects_traversal_via_relative_path(tmp_path: Path) -> None:
     """`version_folder = "../escape"` is caught by the string-level
     pre-check, before any filesystem access — so the test does not need
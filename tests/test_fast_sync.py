@@ -23,6 +23,7 @@ from moto import mock_aws
 from mintd._fast_sync_ops import (
     SubprocessFastSyncOps,
     _check_dvc,
+    _make_cache_shard_dirs,
     cache_path_for,
     check_bucket_versioning,
     classify_targets,
@@ -42,6 +43,7 @@ from mintd._fast_sync_ops import (
     s3_key_for,
     s3_key_for_out,
     spot_check_versions,
+    verify_download,
     DvcFileEntry,
     DvcOut,
 )
@@ -204,6 +206,13 @@ def test_parse_dvc_outs_extracts_version_id_from_cloud(tmp_path: Path) -> None:
     assert parse_dvc_outs(f, "origin")[0].version_id == "vid-2"
 
 
+def test_parse_dvc_outs_reads_utf8_paths(tmp_path: Path) -> None:
+    """.dvc files are read as UTF-8 regardless of the process locale."""
+    f = tmp_path / "u.dvc"
+    f.write_bytes("outs:\n  - path: données\n    md5: abc\n".encode("utf-8"))
+    assert parse_dvc_outs(f, "origin")[0].path == "données"
+
+
 # ---------- slice 29: dvc-import detection ---------------------------
 
 def test_parse_dvc_outs_detects_dvc_import_via_deps_repo(tmp_path: Path) -> None:
@@ -265,6 +274,14 @@ def test_is_cached_missing_vs_present(tmp_path: Path) -> None:
     assert is_cached(tmp_path, "xyz") is True
 
 
+def test_make_cache_shard_dirs_creates_each_shard_once(tmp_path: Path) -> None:
+    _make_cache_shard_dirs(tmp_path, ["aa11", "aa22", "bb33", ""])
+    shards = sorted(p.name for p in (tmp_path / "files" / "md5").iterdir())
+    assert shards == ["aa", "bb"]
+    # Idempotent — a second batch over existing shards is fine.
+    _make_cache_shard_dirs(tmp_path, ["aa44"])
+
+
 # ---------- s3 config (5) ----------
 
 def test_parse_s3_url_happy() -> None:
@@ -415,6 +432,17 @@ def test_fetch_to_cache_happy(s3_versioned, tmp_path: Path) -> None:
     assert cp.read_bytes() == body
 
 
+def test_verify_download_hashes_across_buffer_boundaries(tmp_path: Path) -> None:
+    body = b"x" * (1 << 20) + b"tail"
+    cp = tmp_path / "blob"
+    cp.write_bytes(body)
+    result = verify_download(cp, _md5_of(body))
+    assert result.ok and result.actual == _md5_of(body)
+    assert cp.exists()
+    assert not verify_download(cp, "0" * 32).ok
+    assert not cp.exists()
+
+
 def test_fetch_to_cache_md5_mismatch_unlinks(s3_versioned, tmp_path: Path) -> None:
     s3, bucket = s3_versioned
     body = b"payload"
@@ -666,7 +694,10 @@ def test_try_fast_pull_advance_fires_once_on_single_file_cache_hit(
     ],
 )
 def test_check_dvc(returncode: int, stdout: str, stderr: str, exception: Exception | None, expected_ok: bool, expected_reason: str | None) -> None:
-    with patch("mintd._fast_sync_ops.subprocess.run") as run:
+    """Subprocess fallback, taken when dvc has no dist-info in mintd's env."""
+    _check_dvc.cache_clear()
+    with patch("mintd._fast_sync_ops._installed_dvc_version", return_value=None), \
+         patch("mintd._fast_sync_ops.subprocess.run") as run:
         if exception:
             run.side_effect = exception
         else:
@@ -675,10 +706,47 @@ def test_check_dvc(returncode: int, stdout: str, stderr: str, exception: Excepti
             run.return_value.stderr = stderr
 
         ok, reason = _check_dvc()
+        _check_dvc.cache_clear()
         assert ok is expected_ok
         assert reason == expected_reason
 
 
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        ("3.66.1", (True, None)),
+        ("4.0.0", (False, "dvc 4.0 above ceiling 4.0")),
+        ("3.65.9", (False, "dvc 3.65 below floor 3.66")),
+    ],
+)
+def test_check_dvc_reads_installed_version_without_spawning(
+    version: str, expected: tuple[bool, str | None]
+) -> None:
+    _check_dvc.cache_clear()
+    try:
+        with patch("mintd._fast_sync_ops._installed_dvc_version", return_value=version), \
+             patch("mintd._fast_sync_ops.subprocess.run") as run:
+            assert _check_dvc() == expected
+        run.assert_not_called()
+    finally:
+        _check_dvc.cache_clear()
+
+
+def test_check_dvc_probes_once_per_process() -> None:
+    _check_dvc.cache_clear()
+    try:
+        with patch("mintd._fast_sync_ops._installed_dvc_version", return_value=None), \
+             patch("mintd._fast_sync_ops.subprocess.run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = "3.66.1\n"
+            run.return_value.stderr = ""
+            assert _check_dvc() == (True, None)
+            assert _check_dvc() == (True, None)
+        assert run.call_count == 1
+    finally:
+        _check_dvc.cache_clear()
+
+
 # ---------- normalize_target ----------
 
 @pytest.mark.parametrize("raw,expected", [
@@ -947,11 +1015,11 @@ def test_fetch_to_cache_retries_on_503_then_succeeds(tmp_path: Path) -> None:
 
 
 def test_try_fast_pull_with_missing_boto3_falls_back(tmp_path: Path) -> None:
-    """Step-6 reviewer-P1 regression: when boto3 is None at module scope,
-    the orchestrator routes everything to fallback rather than crashing."""
+    """Step-6 reviewer-P1 regression: when boto3 isn't importable, the
+    orchestrator routes everything to fallback rather than crashing."""
     _write_dvc_config(tmp_path, "irrelevant")
     _write_dvc_file_md5(tmp_path, "a", "deadbeef")
-    with patch("mintd._fast_sync_ops.boto3", None), \
+    with patch("mintd._fast_sync_ops._boto3", return_value=None), \
          patch("mintd._fast_sync_ops._check_dvc", return_value=(True, None)):
         result = SubprocessFastSyncOps().try_fast_pull(
             project_path=tmp_path, targets=["a"], remote_name="origin"
@@ -1819,6 +1887,7 @@ def test_fast_syncable_pipeline_outs_exclude_files_format_dir_with_missing_per_f
 def test_dvc_cmd_smoke() -> None:
     from mintd._fast_sync_ops import _check_dvc
     # the integration tag ensures we actually run the shell command in the dev env
+    _check_dvc.cache_clear()
     ok, reason = _check_dvc()
     assert ok is True, f"bundled dvc probe failed: {reason}"
 
@@ -2208,3 +2277,26 @@ def test_retry_transient_backoff_caps_at_8s() -> None:
     assert [c.args[0] for c in mock_sleep.call_args_list] == [
         0.5, 1.0, 2.0, 4.0, 8.0, 8.0, 8.0, 8.0, 8.0,
     ]
+
+
+def test_s3_session_shared_per_profile(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mintd import _fast_sync_ops
+
+    created: list[str | None] = []
+
+    class _Session:
+        def __init__(self, profile_name: str | None = None) -> None:
+            created.append(profile_name)
+
+        def client(self, *args: object, **kwargs: object) -> object:
+            return object()
+
+    _fast_sync_ops._s3_session.cache_clear()
+    monkeypatch.setattr(boto3, "Session", _Session)
+    try:
+        _fast_sync_ops._create_s3_client({"endpointurl": "http://a"}, "mintd")
+        _fast_sync_ops._create_s3_client({"endpointurl": "http://b"}, "mintd")
+        _fast_sync_ops._create_s3_client({}, None)
+    finally:
+        _fast_sync_ops._s3_session.cache_clear()
+    assert created == ["mintd", None]
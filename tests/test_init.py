@@ -180,6 +180,28 @@ def test_init_project_writes_full_storage_block(tmp_path: Path) -> None:
     assert m.storage.dvc.remote_name == "data_foo"
 
 
+def test_init_storage_splice_matches_full_reserialization(tmp_path: Path) -> None:
+    """The in-place storage splice writes exactly what the parse + validate
+    + dump fallback would have written."""
+    project_path, _ = init_project(
+        project_type="data",
+        name="foo",
+        target_dir=tmp_path,
+        classification="labonly",
+        bucket="cooper-globus",
+        endpoint="https://s3.wasabisys.com",
+        ops=_FakeInitOps(),
+    )
+    text = (project_path / "metadata.json").read_text(encoding="utf-8")
+    expected = (
+        Metadata.model_validate_json(text).model_dump_json(
+            by_alias=True, exclude_none=False, indent=2
+        )
+        + "\n"
+    )
+    assert text == expected
+
+
 def test_init_code_type_uses_bare_name_for_dir_and_storage(tmp_path: Path) -> None:
     """Slice 39: `mintd init code foo` scaffolds `foo/` (not `code_foo/`) and,
     on the labonly DVC path, names the remote `foo` with an S3 prefix derived
@@ -327,10 +349,10 @@ def test_init_project_patches_storage_even_when_template_emits_partial_block(
     fake = _FakeInitOps()
     real_render = init_mod.render_scaffold
 
-    def _wrap_with_poison(*, project_type, name, language, target_dir):
+    def _wrap_with_poison(*, project_type, name, language, target_dir, config=None):
         written = real_render(
             project_type=project_type, name=name,
-            language=language, target_dir=target_dir,
+            language=language, target_dir=target_dir, config=config,
         )
         meta_path = target_dir / "metadata.json"
         raw = json.loads(meta_path.read_text())
@@ -672,9 +694,10 @@ def test_dvc_remote_add_issues_version_aware_true(
 def test_dvc_remote_add_version_aware_fires_after_endpoint_and_profile(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """With endpoint + profile set, the call order is: add, modify
-    endpointurl, modify profile, modify version_aware. Version_aware is
-    last and unconditional."""
+    """With endpoint + profile set and no ``.dvc/config`` section to append
+    to (the fallback path), the call order is: add, modify endpointurl,
+    modify profile, modify version_aware. Version_aware is last and
+    unconditional."""
     import subprocess
     from mintd._init_ops import SubprocessInitOps
 
@@ -739,3 +762,86 @@ def test_dvc_remote_add_version_aware_failure_raises_init_op_error(
             profile=None,
         )
 
+
+def _fake_dvc_run_writing_remote(tmp_path: Path, calls: list[list[str]]):
+    """``subprocess.run`` stand-in that records argv and, on ``remote add``,
+    writes the section the way DVC does."""
+
+    class _R:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_run(argv, **kwargs):
+        argv = list(argv)
+        calls.append(argv)
+        if argv[len(dvc_cmd()):len(dvc_cmd()) + 2] == ["remote", "add"]:
+            name, url = argv[-2:]
+            cfg = tmp_path / ".dvc" / "config"
+            cfg.parent.mkdir(parents=True, exist_ok=True)
+            cfg.write_text(
+                "[core]\n"
+                f"    remote = {name}\n"
+                f"['remote \"{name}\"']\n"
+                f"    url = {url}\n"
+            )
+        return _R()
+
+    return fake_run
+
+
+def test_dvc_remote_add_appends_options_without_extra_dvc_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """After `dvc remote add`, endpointurl / profile / version_aware are
+    appended to the new section in one write — no `dvc remote modify`
+    process per key."""
+    import subprocess
+    from mintd._init_ops import SubprocessInitOps
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(subprocess, "run", _fake_dvc_run_writing_remote(tmp_path, calls))
+    SubprocessInitOps().dvc_remote_add(
+        tmp_path,
+        name="data_y",
+        url="s3://b/k/",
+        default=True,
+        endpoint="https://s3.example",
+        profile="mintd",
+    )
+
+    assert calls == [[*dvc_cmd(), "remote", "add", "-d", "data_y", "s3://b/k/"]]
+    assert (tmp_path / ".dvc" / "config").read_text() == (
+        "[core]\n"
+        "    remote = data_y\n"
+        "['remote \"data_y\"']\n"
+        "    url = s3://b/k/\n"
+        "    endpointurl = https://s3.example\n"
+        "    profile = mintd\n"
+        "    version_aware = true\n"
+    )
+
+
+def test_dvc_remote_add_quotable_value_falls_back_to_modify(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A value DVC would have to quote (here a profile with a space) is
+    left to `dvc remote modify` rather than hand-written."""
+    import subprocess
+    from mintd._init_ops import SubprocessInitOps
+
+    calls: list[list[str]] = []
+    monkeypatch.setattr(subprocess, "run", _fake_dvc_run_writing_remote(tmp_path, calls))
+    SubprocessInitOps().dvc_remote_add(
+        tmp_path,
+        name="data_y",
+        url="s3://b/k/",
+        default=True,
+        endpoint=None,
+        profile="lab profile",
+    )
+
+    assert calls[1:] == [
+        [*dvc_cmd(), "remote", "modify", "data_y", "profile", "lab profile"],
+        [*dvc_cmd(), "remote", "modify", "data_y", "version_aware", "true"],
+    ]
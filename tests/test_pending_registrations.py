@@ -91,3 +91,42 @@ def test_parent_dirs_created_on_first_write(tmp_path: Path) -> None:
     p = PendingRegistrations(path=tmp_path / "nested" / "dir" / ".mintd_pending.json")
     p.add(_make())
     assert (tmp_path / "nested" / "dir" / ".mintd_pending.json").exists()
+
+
+def test_write_recreates_parent_removed_between_writes(tmp_path: Path) -> None:
+    """The parent is only created when the tempfile can't be opened, so a
+    cache wiped between writes is still handled."""
+    import shutil
+
+    p = PendingRegistrations(path=tmp_path / "cache" / ".mintd_pending.json")
+    p.add(_make(name="a"))
+    shutil.rmtree(tmp_path / "cache")
+    p.add(_make(name="b"))
+    assert [e.name for e in p.all_entries()] == ["b"]
+
+
+def test_repeated_reads_parse_file_once(tmp_path: Path, monkeypatch) -> None:
+    """find/all_entries after a write are served from the memoized parse;
+    an out-of-band rewrite (new mtime/size) is picked up on the next read."""
+    path = tmp_path / ".mintd_pending.json"
+    p = PendingRegistrations(path=path)
+    p.add(_make(name="a", pr=1))
+
+    reads: list[Path] = []
+    real_read_bytes = Path.read_bytes
+
+    def _counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return real_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _counting_read_bytes)
+    assert p.find("a") is not None
+    assert p.find("zzz") is None
+    assert len(p.all_entries()) == 1
+    assert reads == []
+
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw["entries"].append({**raw["entries"][0], "name": "b", "pr_number": 2})
+    path.write_text(json.dumps(raw, indent=2), encoding="utf-8")
+    assert {e.name for e in p.all_entries()} == {"a", "b"}
+    assert reads == [path]
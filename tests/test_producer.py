@@ -135,6 +135,22 @@ def test_producer_view_at_raises_schema_too_old(tmp_path: Path) -> None:
     assert "1.1" in ei.value.detail
 
 
+def test_producer_view_at_valid_metadata_skips_schema_peek(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mintd.producer as producer_mod
+
+    def _no_peek(raw: bytes) -> None:
+        raise AssertionError("schema peek on the happy path")
+
+    monkeypatch.setattr(producer_mod, "_peek_schema_version", _no_peek)
+    fetcher = StaticFetcher({(REPO, PIN): _valid_bytes()})
+
+    view = ProducerView.at(REPO, PIN, fetcher=fetcher, cache_dir=tmp_path)
+
+    assert view.metadata.schema_version == "2.0"
+
+
 def test_producer_view_try_at_returns_error_object_on_failure(tmp_path: Path) -> None:
     fetcher = ErroringFetcher(FetchError.pin_missing(REPO, PIN))
 
@@ -627,3 +627,14 @@ def test_fetch_metadata_at_translates_path_missing_to_metadata_missing(
         GitArchiveFetcher().fetch_metadata_at(REPO, PIN)
 
     assert ei.value.reason == FetchError.Reason.METADATA_MISSING
+
+
+def test_scratch_dir_prefers_writable_shm(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mintd import _producer_git_ops
+
+    monkeypatch.setattr(_producer_git_ops, "_SHM_DIR", str(tmp_path))
+    assert _producer_git_ops._scratch_dir() == str(tmp_path)
+    monkeypatch.setattr(_producer_git_ops, "_SHM_DIR", str(tmp_path / "absent"))
+    assert _producer_git_ops._scratch_dir() is None
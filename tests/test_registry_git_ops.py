@@ -0,0 +1,177 @@
+"""Tests for `SubprocessRegistryGitOps` argv/env shaping (subprocess mocked)."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mintd._registry_git_ops import (
+    GhAuthError,
+    GitOpError,
+    PRConflictError,
+    SubprocessRegistryGitOps,
+)
+
+
+def test_gh_calls_disable_update_check_and_prompts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: dict[str, Any] = {}
+
+    def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        seen["cmd"] = cmd
+        seen["env"] = kwargs["env"]
+        return subprocess.CompletedProcess(cmd, 0, stdout="https://github.com/o/r/pull/12\n", stderr="")
+
+    monkeypatch.setattr("mintd._registry_git_ops.subprocess.run", _fake_run)
+    pr = SubprocessRegistryGitOps().open_pr(tmp_path, title="t", body="b", head="register/x")
+    assert pr == 12
+    assert seen["cmd"][:3] == ["gh", "pr", "create"]
+    assert seen["env"]["GH_NO_UPDATE_NOTIFIER"] == "1"
+    assert seen["env"]["GH_PROMPT_DISABLED"] == "1"
+
+
+def test_push_multiplexes_ssh_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: dict[str, Any] = {}
+
+    def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        seen["cmd"] = cmd
+        seen["env"] = kwargs["env"]
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+    monkeypatch.delenv("GIT_SSH", raising=False)
+    mux_dir = tmp_path / "ssh"
+    monkeypatch.setattr("mintd._registry_git_ops._ssh_mux_dir", lambda: mux_dir)
+    monkeypatch.setattr("mintd._registry_git_ops._configured_ssh_command", lambda: None)
+    monkeypatch.setattr("mintd._registry_git_ops.subprocess.run", _fake_run)
+    SubprocessRegistryGitOps().push_branch(tmp_path, "register/x")
+    assert seen["cmd"][:2] == ["git", "push"]
+    assert "ControlMaster=auto" in seen["env"]["GIT_SSH_COMMAND"]
+    assert f"ControlPath={mux_dir}/%C" in seen["env"]["GIT_SSH_COMMAND"]
+    assert mux_dir.is_dir()
+
+
+def test_ssh_control_path_survives_a_space_in_the_mux_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import shlex
+
+    from mintd._registry_git_ops import _git_network_env
+
+    mux_dir = tmp_path / "Jane Doe" / "ssh"
+    monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+    monkeypatch.delenv("GIT_SSH", raising=False)
+    monkeypatch.setattr("mintd._registry_git_ops._ssh_mux_dir", lambda: mux_dir)
+    monkeypatch.setattr("mintd._registry_git_ops._configured_ssh_command", lambda: None)
+    env = _git_network_env()
+    assert env is not None
+    argv = shlex.split(env["GIT_SSH_COMMAND"])
+    assert f"ControlPath={mux_dir}/%C" in argv
+
+
+def test_push_keeps_user_git_ssh_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: dict[str, Any] = {}
+
+    def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        seen["env"] = kwargs["env"]
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setenv("GIT_SSH_COMMAND", "ssh -i /custom/key")
+    monkeypatch.setattr("mintd._registry_git_ops.subprocess.run", _fake_run)
+    SubprocessRegistryGitOps().push_branch(tmp_path, "register/x")
+    assert seen["env"] is None
+
+
+def test_push_keeps_user_core_ssh_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A ``core.sshCommand`` in git config loses to GIT_SSH_COMMAND, so its
+    presence also opts out of the multiplexing override."""
+    seen: dict[str, Any] = {}
+
+    def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        if cmd[:2] == ["git", "config"]:
+            assert cmd[-1] == "core.sshCommand"
+            return subprocess.CompletedProcess(cmd, 0, stdout="ssh -i ~/.ssh/lab_key\n", stderr="")
+        seen["env"] = kwargs["env"]
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+    monkeypatch.delenv("GIT_SSH", raising=False)
+    monkeypatch.setattr("mintd._registry_git_ops.subprocess.run", _fake_run)
+    SubprocessRegistryGitOps().push_branch(tmp_path, "register/x")
+    assert seen["env"] is None
+
+
+def test_network_env_built_once_per_instance(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    envs: list[Any] = []
+    builds: list[int] = []
+
+    def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        envs.append(kwargs["env"])
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    import mintd._registry_git_ops as ops_mod
+
+    real = ops_mod._git_network_env
+    monkeypatch.setattr(ops_mod, "_git_network_env", lambda: builds.append(1) or real())
+    monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+    monkeypatch.delenv("GIT_SSH", raising=False)
+    monkeypatch.setattr(ops_mod, "_configured_ssh_command", lambda: None)
+    monkeypatch.setattr("mintd._registry_git_ops.subprocess.run", _fake_run)
+    ops = SubprocessRegistryGitOps()
+    ops.fetch(tmp_path)
+    ops.push_branch(tmp_path, "register/x")
+    assert len(builds) == 1
+    assert envs[0] is envs[1]
+    assert "ControlMaster=auto" in envs[1]["GIT_SSH_COMMAND"]
+
+
+@pytest.mark.parametrize(
+    ("stderr", "expected"),
+    [
+        ("To get started with GitHub CLI, please run:  gh auth login\nNot Authenticated", GhAuthError),
+        ("HTTP 401: Authentication required", GhAuthError),
+        ("a pull request for branch \"register/x\" Already Exists", PRConflictError),
+        ("HTTP 502: Bad Gateway", GitOpError),
+    ],
+)
+def test_gh_failures_classified_by_stderr(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, stderr: str, expected: type[Exception]
+) -> None:
+    def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        raise subprocess.CalledProcessError(1, cmd, output="", stderr=stderr)
+
+    monkeypatch.setattr("mintd._registry_git_ops.subprocess.run", _fake_run)
+    with pytest.raises(expected):
+        SubprocessRegistryGitOps().open_pr(tmp_path, title="t", body="b", head="register/x")
+
+
+@pytest.mark.parametrize("live", [True, False])
+def test_clone_requests_progress_only_with_a_live_reporter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, live: bool
+) -> None:
+    from types import SimpleNamespace
+
+    from mintd._subprocess import StreamResult
+
+    seen: list[list[str]] = []
+
+    def _fake_streaming(argv: list[str], **kwargs: Any) -> StreamResult:
+        seen.append(argv)
+        return StreamResult(returncode=0, stdout_lines=[], stderr_lines=[])
+
+    monkeypatch.setattr("mintd._subprocess.run_streaming", _fake_streaming)
+    reporter = SimpleNamespace(shows_live_progress=live)
+    SubprocessRegistryGitOps(reporter=reporter).clone("https://example.invalid/r.git", tmp_path / "r")
+    assert ("--progress" in seen[0]) is live
@@ -174,11 +174,13 @@ def test_compute_storage_prefix_licensed_with_slug() -> None:
     ) == "optum/data_foo/"
 
 
-def test_compute_storage_prefix_licensed_rejects_bad_slug() -> None:
-    """Slug becomes a top-level S3 segment so it MUST be URL-safe."""
+@pytest.mark.parametrize("slug", ["bad slug", "optum\n"])
+def test_compute_storage_prefix_licensed_rejects_bad_slug(slug: str) -> None:
+    """Slug becomes a top-level S3 segment so it MUST be URL-safe — including
+    no trailing newline, which a ``$``-anchored ``match`` would let through."""
     with pytest.raises(ValueError, match="must match"):
         compute_storage_prefix(
-            classification="licensed", project_name="data_foo", slug="bad slug"
+            classification="licensed", project_name="data_foo", slug=slug
         )
 
 
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
 from mintd._templates import (
     InitNameInvalid,
+    project_full_name,
     render_scaffold,
     render_template,
     validate_project_name,
@@ -27,15 +30,99 @@ def test_render_template_substitutes_project_name() -> None:
     assert "{%" not in out
 
 
+def test_template_environment_reuses_compiled_templates() -> None:
+    from mintd._templates.engine import _get_env
+
+    env = _get_env()
+    assert env is _get_env()
+    assert env.auto_reload is False
+    assert env.get_template("README_data.md.j2") is env.get_template("README_data.md.j2")
+
+
+def test_compiled_templates_persist_across_environments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second process (simulated by rebuilding the environment) loads
+    bytecode from the on-disk cache instead of recompiling."""
+    from jinja2 import Environment
+
+    import mintd._templates.engine as engine_mod
+    from mintd._templates.engine import _get_env
+
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setattr(engine_mod, "_bytecode_cache_dir", lambda: cache_dir)
+    _get_env.cache_clear()
+    try:
+        first = _get_env().get_template("README_data.md.j2").render(**_MIN_CONTEXT)
+        assert list(cache_dir.iterdir())
+
+        _get_env.cache_clear()
+
+        def _no_compile(*args, **kwargs):
+            raise AssertionError("template recompiled despite bytecode cache")
+
+        monkeypatch.setattr(Environment, "compile", _no_compile)
+        assert _get_env().get_template("README_data.md.j2").render(**_MIN_CONTEXT) == first
+    finally:
+        _get_env.cache_clear()
+
+
+def test_unwritable_bytecode_cache_still_renders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mintd._templates.engine as engine_mod
+    from mintd._templates.engine import _get_env
+
+    (tmp_path / ".cache").write_text("not a directory")
+    monkeypatch.setattr(
+        engine_mod, "_bytecode_cache_dir", lambda: tmp_path / ".cache" / "mintd" / "jinja"
+    )
+    _get_env.cache_clear()
+    try:
+        assert _get_env().bytecode_cache is None
+        assert "alpha" in render_template(
+            "README_data.md.j2", _MIN_CONTEXT | {"project_name": "alpha"}
+        )
+    finally:
+        _get_env.cache_clear()
+
+
+def test_importing_templates_package_does_not_import_jinja2() -> None:
+    code = "import sys, mintd._templates; print('jinja2' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
+
+
 def test_validate_project_name_rejects_leading_dash() -> None:
     with pytest.raises(InitNameInvalid):
         validate_project_name("-bad")
 
 
+def test_validate_project_name_rejects_trailing_newline() -> None:
+    with pytest.raises(InitNameInvalid):
+        validate_project_name("foo\n")
+
+
 def test_validate_project_name_accepts_underscore_and_digits() -> None:
     validate_project_name("my_project_2")  # no exception
 
 
+@pytest.mark.parametrize(
+    ("project_type", "expected"),
+    [
+        ("data", "data_foo"),
+        ("project", "prj_foo"),
+        ("code", "foo"),
+        ("enclave", "enclave_foo"),
+        ("other", "other_foo"),
+    ],
+)
+def test_project_full_name_prefixes(project_type: str, expected: str) -> None:
+    assert project_full_name(project_type, "foo") == expected
+
+
 # --- per-type scaffolds ---------------------------------------------------
 
 def test_data_python_renders_all_files(tmp_path: Path) -> None:
@@ -443,3 +530,125 @@ _MIN_CONTEXT: dict[str, object] = {
     "mirror_purpose": "",
     "data_products_primary": "",
 }
+
+
+def test_mint_version_resolved_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mintd._templates import _render
+
+    calls: list[str] = []
+
+    def _fake_version(dist: str) -> str:
+        calls.append(dist)
+        return "9.9.9"
+
+    _render._mint_version.cache_clear()
+    monkeypatch.setattr(_render.importlib.metadata, "version", _fake_version)
+    try:
+        ctx1 = _render._build_context(project_type="data", name="a", language="python")
+        ctx2 = _render._build_context(project_type="data", name="b", language="python")
+    finally:
+        _render._mint_version.cache_clear()
+    assert ctx1["mint_version"] == ctx2["mint_version"] == "9.9.9"
+    assert calls == ["mintd"]
+
+
+def test_scaffold_dirs_includes_ancestors_shallowest_first() -> None:
+    from mintd._templates._render import _scaffold_dirs
+
+    dirs = _scaffold_dirs(["a/b/c", "a"], [("x/y/z.txt", "t.j2"), ("top.md", "t.j2")])
+    assert dirs == ["a", "x", "a/b", "x/y", "a/b/c"]
+
+
+def test_detect_platform_probes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    import platform
+
+    from mintd._templates import _render
+
+    calls: list[int] = []
+
+    def _system() -> str:
+        calls.append(1)
+        return "Darwin"
+
+    _render._detect_platform.cache_clear()
+    monkeypatch.setattr(platform, "system", _system)
+    try:
+        info = _render._detect_platform()
+        assert (info.os, info.command_sep) == ("macos", "&&")
+        assert _render._detect_platform() is info
+    finally:
+        _render._detect_platform.cache_clear()
+    assert len(calls) == 1
+
+
+def test_static_files_are_read_once_per_process(tmp_path: Path) -> None:
+    from mintd._templates import _render
+
+    _render._static_file_bytes.cache_clear()
+    try:
+        for sub in ("a", "b"):
+            (tmp_path / sub).mkdir()
+            render_scaffold(
+                project_type="data", name="foo", language="python", target_dir=tmp_path / sub
+            )
+        assert (tmp_path / "a" / ".gitignore").read_bytes() == (
+            tmp_path / "b" / ".gitignore"
+        ).read_bytes()
+        info = _render._static_file_bytes.cache_info()
+        assert info.misses == len(_render._STATIC_FILES)
+        assert info.hits == info.misses
+    finally:
+        _render._static_file_bytes.cache_clear()
+
+
+def test_scaffold_tables_are_shared_and_immutable() -> None:
+    """Scaffold functions hand back the same immutable tables every call."""
+    for project_type in ("data", "project", "code", "enclave"):
+        dirs, files = dispatch(project_type)("python", "n", "n")
+        assert isinstance(dirs, tuple)
+        assert isinstance(files, tuple)
+        dirs2, files2 = dispatch(project_type)("python", "other", "other")
+        assert dirs2 is dirs
+        assert files2 is files
+
+
+def test_build_context_uses_passed_config_without_loading(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from mintd._config import Config
+    from mintd._templates import _render
+
+    def _no_load(cls, path=None):  # noqa: ANN001
+        pytest.fail("Config.load must not run when a config is passed in")
+
+    monkeypatch.setattr(Config, "load", classmethod(_no_load))
+    ctx = _render._build_context(
+        project_type="data",
+        name="a",
+        language="stata",
+        config=Config(stata_executable="stata-mp", admin_team="admins"),
+    )
+    assert ctx["stata_executable"] == "stata-mp"
+    assert ctx["admin_team"] == "admins"
+
+
+def test_build_context_overrides_win_over_defaults() -> None:
+    from mintd._templates import _render
+
+    ctx = _render._build_context(
+        project_type="data",
+        name="a",
+        language="python",
+        overrides={"description": "custom", "extra_key": 1},
+    )
+    assert ctx["description"] == "custom"
+    assert ctx["extra_key"] == 1
+    assert ctx["project_name"] == "a"
+
+
+def test_file_table_assembled_once_per_language() -> None:
+    from mintd._templates.scaffolds import _file_table
+
+    first = _file_table("data", "r", "code")
+    assert _file_table("data", "r", "code") is first
+    assert ("code/fetch.R", "fetch.R.j2") in first
@@ -0,0 +1,31 @@
+"""Tests for `mintd._yaml` — libyaml-backed safe load/dump wrappers."""
+
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from mintd import _yaml
+
+
+def test_safe_dump_matches_pure_python_output() -> None:
+    data = {
+        "project": {"name": "data_x", "type": "data"},
+        "metadata": {"description": "café → résumé", "tags": ["a", "b"]},
+        "dates": ["2026-05-01", "yes", None, 1.5, True],
+        "multi": "line1\nline2\n",
+    }
+    assert _yaml.safe_dump(data, sort_keys=False, default_flow_style=False) == yaml.safe_dump(
+        data, sort_keys=False, default_flow_style=False
+    )
+
+
+def test_safe_load_round_trips_text_and_bytes() -> None:
+    text = _yaml.safe_dump({"a": [1, "2026-05-01"], "b": {"c": "ü"}})
+    assert _yaml.safe_load(text) == {"a": [1, "2026-05-01"], "b": {"c": "ü"}}
+    assert _yaml.safe_load(text.encode("utf-8")) == _yaml.safe_load(text)
+
+
+def test_safe_load_rejects_python_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        _yaml.safe_load("!!python/object/apply:os.system ['true']")